@@ -0,0 +1,133 @@
+"""
+Script to time `fides evaluate` against a generated taxonomy with many systems.
+
+Usage: python scripts/benchmark_evaluate.py [--systems 2000] [--datasets 200]
+"""
+import argparse
+import time
+
+from fideslang.default_taxonomy import DEFAULT_TAXONOMY
+from fideslang.models import (
+    Dataset,
+    DatasetCollection,
+    DatasetField,
+    MatchesEnum,
+    Policy,
+    PolicyRule,
+    PrivacyDeclaration,
+    PrivacyRule,
+    System,
+    Taxonomy,
+)
+
+from fides.core.evaluate import execute_evaluation, merge_taxonomies
+
+
+def generate_taxonomy(num_systems: int, num_datasets: int) -> Taxonomy:
+    """
+    A taxonomy made of the default taxonomy, a policy with a few rules and the given
+    number of systems and datasets, each system declaring a few uses of the data of a
+    dataset.
+    """
+    data_categories = [
+        category.fides_key
+        for category in DEFAULT_TAXONOMY.data_category
+        if category.parent_key
+    ]
+    data_uses = [data_use.fides_key for data_use in DEFAULT_TAXONOMY.data_use]
+    data_subjects = [
+        data_subject.fides_key for data_subject in DEFAULT_TAXONOMY.data_subject
+    ]
+
+    datasets = [
+        Dataset(
+            fides_key=f"benchmark_dataset_{i}",
+            data_categories=[data_categories[i % len(data_categories)]],
+            collections=[
+                DatasetCollection(
+                    name=f"collection_{j}",
+                    fields=[
+                        DatasetField(
+                            name=f"field_{k}",
+                            data_categories=[
+                                data_categories[(i + j + k) % len(data_categories)]
+                            ],
+                        )
+                        for k in range(10)
+                    ],
+                )
+                for j in range(5)
+            ],
+        )
+        for i in range(num_datasets)
+    ]
+
+    systems = [
+        System(
+            fides_key=f"benchmark_system_{i}",
+            system_type="Service",
+            privacy_declarations=[
+                PrivacyDeclaration(
+                    name=f"declaration_{j}",
+                    data_categories=[
+                        data_categories[(i + j + k) % len(data_categories)]
+                        for k in range(3)
+                    ],
+                    data_use=data_uses[(i + j) % len(data_uses)],
+                    data_subjects=[data_subjects[(i + j) % len(data_subjects)]],
+                    data_qualifier="aggregated.anonymized.unlinked_pseudonymized.pseudonymized.identified",
+                    dataset_references=[f"benchmark_dataset_{i % num_datasets}"]
+                    if num_datasets
+                    else None,
+                )
+                for j in range(3)
+            ],
+        )
+        for i in range(num_systems)
+    ]
+
+    policy = Policy(
+        fides_key="benchmark_policy",
+        rules=[
+            PolicyRule(
+                name=f"rule_{matches.value}",
+                data_categories=PrivacyRule(
+                    matches=matches, values=data_categories[::7]
+                ),
+                data_uses=PrivacyRule(matches=MatchesEnum.ANY, values=data_uses[::3]),
+                data_subjects=PrivacyRule(
+                    matches=MatchesEnum.ANY, values=data_subjects[::2]
+                ),
+                data_qualifier="aggregated.anonymized",
+            )
+            for matches in MatchesEnum
+        ],
+    )
+
+    return merge_taxonomies(
+        Taxonomy(dataset=datasets, system=systems, policy=[policy]),
+        DEFAULT_TAXONOMY.copy(deep=True),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--systems", type=int, default=2000)
+    parser.add_argument("--datasets", type=int, default=200)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    taxonomy = generate_taxonomy(args.systems, args.datasets)
+    print(
+        f"Generated a taxonomy with {args.systems} systems and {args.datasets} datasets in {time.perf_counter() - start:.2f}s"
+    )
+
+    start = time.perf_counter()
+    evaluation = execute_evaluation(taxonomy)
+    print(
+        f"Evaluated it in {time.perf_counter() - start:.2f}s, with {len(evaluation.violations)} violations"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Script to time building and running the traversal of a generated graph with many collections.
+
+Usage: python scripts/benchmark_traversal.py [--collections 10000] [--branching-factor 10]
+"""
+import argparse
+import time
+from typing import List
+
+from fides.api.graph.config import Collection, FieldAddress, GraphDataset, ScalarField
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal
+
+
+def generate_tree_datasets(size: int, branching_factor: int) -> List[GraphDataset]:
+    """
+    A tree of `size` single-collection datasets, in which each collection references
+    its parent and the root collection holds the "email" identity.
+    """
+    datasets = [
+        GraphDataset(
+            name=f"dataset_{i}",
+            collections=[
+                Collection(
+                    name=f"collection_{i}",
+                    fields=[ScalarField(name=f"f{j}") for j in range(1, 4)],
+                )
+            ],
+            connection_key="benchmark_connection_config_key",
+        )
+        for i in range(size)
+    ]
+    datasets[0].collections[0].fields[0].identity = "email"
+    for i in range(1, size):
+        parent = (i - 1) // branching_factor
+        datasets[i].collections[0].fields[0].references.append(
+            (FieldAddress(f"dataset_{parent}", f"collection_{parent}", "f1"), "from")
+        )
+    return datasets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--collections", type=int, default=10000)
+    parser.add_argument("--branching-factor", type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = DatasetGraph(
+        *generate_tree_datasets(args.collections, args.branching_factor)
+    )
+    print(
+        f"Built a graph of {args.collections} collections in {time.perf_counter() - start:.2f}s"
+    )
+
+    start = time.perf_counter()
+    traversal = Traversal(graph, {"email": "customer-1@example.com"})
+    print(f"Verified its traversal in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    end_nodes = traversal.traverse({}, lambda tn, data: None)
+    print(
+        f"Traversed it in {time.perf_counter() - start:.2f}s, with {len(end_nodes)} end nodes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -98,12 +98,12 @@ def _filter_consent(
     )
 
     if identity:
-        hashed_identity = ProvidedIdentity.hash_value(value=identity)
+        identity_condition = ProvidedIdentity.value_matches(db, identity)
         identities: Set[str] = {
             identity[0]
             for identity in ProvidedIdentity.filter(
                 db=db,
-                conditions=(ProvidedIdentity.hashed_value == hashed_identity),
+                conditions=identity_condition,
             ).values(column("id"))
         }
         query = query.filter(Consent.provided_identity_id.in_(identities))
@@ -332,7 +332,7 @@ def get_consent_preferences(
     identity = ProvidedIdentity.filter(
         db,
         conditions=(
-            (ProvidedIdentity.hashed_value == ProvidedIdentity.hash_value(str(lookup)))
+            ProvidedIdentity.value_matches(db, str(lookup))
             & (ProvidedIdentity.privacy_request_id.is_(None))
         ),
     ).first()
@@ -494,10 +494,7 @@ def _get_or_create_provided_identity(
             db=db,
             conditions=(
                 (ProvidedIdentity.field_name == ProvidedIdentityType.email)
-                & (
-                    ProvidedIdentity.hashed_value
-                    == ProvidedIdentity.hash_value(identity_data.email)
-                )
+                & ProvidedIdentity.value_matches(db, identity_data.email)
                 & (ProvidedIdentity.privacy_request_id.is_(None))
             ),
         ).first()
@@ -519,10 +516,7 @@ def _get_or_create_provided_identity(
             db=db,
             conditions=(
                 (ProvidedIdentity.field_name == ProvidedIdentityType.phone_number)
-                & (
-                    ProvidedIdentity.hashed_value
-                    == ProvidedIdentity.hash_value(identity_data.phone_number)
-                )
+                & ProvidedIdentity.value_matches(db, identity_data.phone_number)
                 & (ProvidedIdentity.privacy_request_id.is_(None))
             ),
         ).first()
@@ -1,5 +1,7 @@
+import hashlib
+import json
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import Depends, HTTPException, Request, Response
 from fastapi_pagination import Page, Params
@@ -9,6 +11,7 @@ from loguru import logger
 from sqlalchemy.orm import Session
 from starlette.status import (
     HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
     HTTP_404_NOT_FOUND,
     HTTP_422_UNPROCESSABLE_ENTITY,
 )
@@ -16,16 +19,16 @@ from starlette.status import (
 from fides.api.api import deps
 from fides.api.api.v1 import urn_registry as urls
 from fides.api.api.v1.endpoints.utils import fides_limiter
-from fides.api.models.privacy_experience import (
-    ComponentType,
-    PrivacyExperience,
-    PrivacyExperienceConfig,
-)
-from fides.api.models.privacy_notice import PrivacyNotice, PrivacyNoticeRegion
+from fides.api.models.privacy_experience import ComponentType, PrivacyExperience
+from fides.api.models.privacy_notice import PrivacyNoticeRegion
 from fides.api.models.privacy_request import ProvidedIdentity
 from fides.api.schemas.privacy_experience import PrivacyExperienceResponse
 from fides.api.util.api_router import APIRouter
 from fides.api.util.consent_util import get_fides_user_device_id_provided_identity
+from fides.api.util.privacy_experience_cache import (
+    add_user_preferences,
+    get_privacy_experience_snapshot,
+)
 from fides.core.config import CONFIG
 
 router = APIRouter(tags=["Privacy Experience"], prefix=urls.V1_URL_PREFIX)
@@ -66,7 +69,7 @@ def privacy_experience_list(
     fides_user_device_id: Optional[str] = None,
     request: Request,  # required for rate limiting
     response: Response,  # required for rate limiting
-) -> AbstractPage[PrivacyExperience]:
+) -> Union[AbstractPage[PrivacyExperience], Response]:
     """
     Public endpoint that returns a list of PrivacyExperience records for individual regions with
     relevant privacy notices embedded in the response.
@@ -76,6 +79,10 @@ def privacy_experience_list(
 
     'fides_user_device_id' query param will stash the current preferences of the given user
     alongside each notice where applicable.
+
+    Experiences are served from a snapshot that is rebuilt whenever an experience,
+    experience config or notice changes. Responses carry an ETag, and a request whose
+    If-None-Match header matches it gets an empty 304 response.
     """
     logger.info("Finding all Privacy Experiences with pagination params '{}'", params)
     fides_user_provided_identity: Optional[ProvidedIdentity] = None
@@ -91,47 +98,38 @@ def privacy_experience_list(
             db=db, fides_user_device_id=fides_user_device_id
         )
 
-    experience_query = db.query(PrivacyExperience)
-
-    if show_disabled is False:
-        # This field is actually stored on the PrivacyExperienceConfig.  This is a useful filter in that
-        # it forces the ExperienceConfig to exist, and it has to be enabled.
-        experience_query = experience_query.join(
-            PrivacyExperienceConfig,
-            PrivacyExperienceConfig.id == PrivacyExperience.experience_config_id,
-        ).filter(PrivacyExperienceConfig.disabled.is_(False))
-
-    if region is not None:
-        experience_query = experience_query.filter(PrivacyExperience.region == region)
-    if component is not None:
-        experience_query = experience_query.filter(
-            PrivacyExperience.component == component
-        )
-    if has_config is True:
-        experience_query = experience_query.filter(
-            PrivacyExperience.experience_config_id.isnot(None)
-        )
-    if has_config is False:
-        experience_query = experience_query.filter(
-            PrivacyExperience.experience_config_id.is_(None)
+    experiences: List[Dict[str, Any]] = get_privacy_experience_snapshot(
+        db,
+        show_disabled=show_disabled,
+        region=region,
+        component=component,
+        has_config=has_config,
+    )
+    if has_notices:
+        experiences = [
+            experience for experience in experiences if experience["privacy_notices"]
+        ]
+    if fides_user_provided_identity:
+        experiences = add_user_preferences(
+            db, experiences, fides_user_provided_identity
         )
 
-    results: List[PrivacyExperience] = []
-    for privacy_experience in experience_query.order_by(
-        PrivacyExperience.created_at.desc()
-    ):
-        privacy_notices: List[
-            PrivacyNotice
-        ] = privacy_experience.get_related_privacy_notices(
-            db, show_disabled, fides_user_provided_identity
-        )
-        # Temporarily save privacy notices on the privacy experience object
-        privacy_experience.privacy_notices = privacy_notices
-        # Temporarily save "show_banner" on the privacy experience object
-        privacy_experience.show_banner = privacy_experience.get_should_show_banner(
-            db, show_disabled
-        )
-        if not (has_notices and not privacy_notices):
-            results.append(privacy_experience)
+    page = fastapi_paginate(experiences, params=params)
+
+    # Experiences are the same for everyone unless a user's preferences were added, so
+    # shared caches may store them, revalidating with the ETag once they are stale.
+    digest = hashlib.sha256(
+        json.dumps(page.dict(), sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    etag = f'"{digest}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, max-age=0, must-revalidate"
+        if fides_user_device_id
+        else f"public, max-age={CONFIG.security.public_request_cache_max_age}, must-revalidate",
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
 
-    return fastapi_paginate(results, params=params)
+    response.headers.update(headers)
+    return page
@@ -1,6 +1,6 @@
 import ipaddress
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import Depends, HTTPException, Request, Response
 from fastapi.params import Security
@@ -328,9 +328,6 @@ def _save_privacy_preferences_for_identities(
     preferences for when we have a verified user identity (like email/phone number), just a fides user device from
     the browser, or both.
     """
-    created_historical_preferences: List[PrivacyPreferenceHistory] = []
-    upserted_current_preferences: List[CurrentPrivacyPreference] = []
-
     email, hashed_email = extract_identity_from_provided_identity(
         verified_provided_identity, ProvidedIdentityType.email
     )
@@ -341,10 +338,12 @@ def _save_privacy_preferences_for_identities(
         fides_user_provided_identity, ProvidedIdentityType.fides_user_device_id
     )
 
-    for privacy_preference in request_data.preferences:
-        historical_preference: PrivacyPreferenceHistory = PrivacyPreferenceHistory.create(
-            db=db,
-            data={
+    created_historical_preferences: List[
+        PrivacyPreferenceHistory
+    ] = PrivacyPreferenceHistory.bulk_create(
+        db=db,
+        data=[
+            {
                 "anonymized_ip_address": request_data.anonymized_ip_address,
                 "email": email,
                 "privacy_experience_config_history_id": request_data.experience_config_history_id
@@ -371,15 +370,25 @@ def _save_privacy_preferences_for_identities(
                 "user_agent": request_data.user_agent,
                 "user_geography": request_data.user_geography,
                 "url_recorded": request_data.url_recorded,
-            },
-            check_name=False,
-        )
-        upserted_current_preference: CurrentPrivacyPreference = (
-            historical_preference.current_privacy_preference
+            }
+            for privacy_preference in request_data.preferences
+        ],
+    )
+    current_preferences: Dict[str, CurrentPrivacyPreference] = {
+        current_preference.privacy_preference_history_id: current_preference
+        for current_preference in db.query(CurrentPrivacyPreference).filter(
+            CurrentPrivacyPreference.privacy_preference_history_id.in_(
+                [
+                    historical_preference.id
+                    for historical_preference in created_historical_preferences
+                ]
+            )
         )
-
-        created_historical_preferences.append(historical_preference)
-        upserted_current_preferences.append(upserted_current_preference)
+    }
+    upserted_current_preferences: List[CurrentPrivacyPreference] = [
+        current_preferences[historical_preference.id]
+        for historical_preference in created_historical_preferences
+    ]
 
     identity = (
         request_data.browser_identity if request_data.browser_identity else Identity()
@@ -4,7 +4,17 @@ import csv
 import io
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Union
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
 import sqlalchemy
 from fastapi import Body, Depends, HTTPException, Security
@@ -16,7 +26,7 @@ from loguru import logger
 from pydantic import ValidationError as PydanticValidationError
 from pydantic import conlist
 from sqlalchemy import cast, column, null
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, selectinload
 from sqlalchemy.sql.expression import nullslast
 from starlette.responses import StreamingResponse
 from starlette.status import (
@@ -244,56 +254,103 @@ def _send_privacy_request_receipt_message_to_user(
     )
 
 
-def privacy_request_csv_download(
-    db: Session, privacy_request_query: Query
-) -> StreamingResponse:
-    """Download privacy requests as CSV for Admin UI"""
-    f = io.StringIO()
-    csv_file = csv.writer(f)
+PRIVACY_REQUEST_CSV_HEADERS = [
+    "Status",
+    "Request Type",
+    "Subject Identity",
+    "Time Received",
+    "Reviewed By",
+    "Request ID",
+    "Time Approved/Denied",
+    "Denial Reason",
+]
+# Number of privacy requests fetched from the database cursor, and written to the
+# response, at a time when downloading privacy requests as CSV
+PRIVACY_REQUEST_CSV_CHUNK_SIZE = 1000
+
+
+def _privacy_request_csv_rows(
+    db: Session, privacy_requests: List[PrivacyRequest]
+) -> Iterator[List[Any]]:
+    """CSV rows for a chunk of privacy requests, with the denial reasons of the denied
+    ones loaded with a single query"""
+    denied_ids: List[str] = [
+        pr.id for pr in privacy_requests if pr.status == PrivacyRequestStatus.denied
+    ]
+    denial_audit_logs: Dict[str, str] = {}
+    if denied_ids:
+        denial_audit_logs = {
+            privacy_request_id: message
+            for privacy_request_id, message in db.query(
+                AuditLog.privacy_request_id, AuditLog.message
+            ).filter(
+                AuditLog.action == AuditLogAction.denied,
+                AuditLog.privacy_request_id.in_(denied_ids),
+            )
+        }
 
-    csv_file.writerow(
-        [
-            "Status",
-            "Request Type",
-            "Subject Identity",
-            "Time Received",
-            "Reviewed By",
-            "Request ID",
-            "Time Approved/Denied",
-            "Denial Reason",
+    for pr in privacy_requests:
+        yield [
+            pr.status.value if pr.status else None,
+            pr.policy.rules[0].action_type if len(pr.policy.rules) > 0 else None,  # type: ignore[attr-defined]
+            pr.get_persisted_identity().dict(),
+            pr.created_at,
+            pr.reviewed_by,
+            pr.id,
+            pr.reviewed_at,
+            denial_audit_logs.get(pr.id),
         ]
-    )
-    privacy_request_ids: List[str] = [r.id for r in privacy_request_query]
-    denial_audit_log_query: Query = db.query(AuditLog).filter(
-        AuditLog.action == AuditLogAction.denied,
-        AuditLog.privacy_request_id.in_(privacy_request_ids),
-    )
-    denial_audit_logs: Dict[str, str] = {
-        r.privacy_request_id: r.message for r in denial_audit_log_query
-    }
 
-    for pr in privacy_request_query:
-        denial_reason = (
-            denial_audit_logs[pr.id]
-            if pr.status == PrivacyRequestStatus.denied and pr.id in denial_audit_logs
-            else None
-        )
 
-        csv_file.writerow(
-            [
-                pr.status.value if pr.status else None,
-                pr.policy.rules[0].action_type if len(pr.policy.rules) > 0 else None,
-                pr.get_persisted_identity().dict(),
-                pr.created_at,
-                pr.reviewed_by,
-                pr.id,
-                pr.reviewed_at,
-                denial_reason,
-            ]
-        )
+def stream_privacy_requests_csv(
+    db: Session,
+    privacy_request_query: Query,
+    chunk_size: int = PRIVACY_REQUEST_CSV_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Privacy requests as CSV, generated in a single pass over the query.
+
+    Privacy requests are read from a server-side cursor, along with their policy rules
+    and persisted identities, and written out a chunk at a time, so memory use is bounded
+    by the chunk size rather than by the number of privacy requests.
+    """
+    buffer = io.StringIO()
+    csv_file = csv.writer(buffer)
+
+    def flush() -> str:
+        content = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return content
+
+    csv_file.writerow(PRIVACY_REQUEST_CSV_HEADERS)
+    yield flush()
+
+    query = privacy_request_query.options(
+        selectinload(PrivacyRequest.policy).selectinload(Policy.rules),  # type: ignore[attr-defined]
+        selectinload(PrivacyRequest.provided_identities),  # type: ignore[attr-defined]
+    ).yield_per(chunk_size)
+
+    chunk: List[PrivacyRequest] = []
+    for pr in query:
+        chunk.append(pr)
+        if len(chunk) >= chunk_size:
+            csv_file.writerows(_privacy_request_csv_rows(db, chunk))
+            chunk = []
+            yield flush()
 
-    f.seek(0)
-    response = StreamingResponse(f, media_type="text/csv")
+    if chunk:
+        csv_file.writerows(_privacy_request_csv_rows(db, chunk))
+        yield flush()
+
+
+def privacy_request_csv_download(
+    db: Session, privacy_request_query: Query
+) -> StreamingResponse:
+    """Download privacy requests as CSV for Admin UI"""
+    response = StreamingResponse(
+        stream_privacy_requests_csv(db, privacy_request_query), media_type="text/csv"
+    )
     response.headers[
         "Content-Disposition"
     ] = f"attachment; filename=privacy_requests_download_{datetime.today().strftime('%Y-%m-%d')}.csv"
@@ -401,13 +458,13 @@ def _filter_privacy_request_queryset(
     )
 
     if identity:
-        hashed_identity = ProvidedIdentity.hash_value(value=identity)
+        identity_condition = ProvidedIdentity.value_matches(db, identity)
         identities: Set[str] = {
             identity[0]
             for identity in ProvidedIdentity.filter(
                 db=db,
                 conditions=(
-                    (ProvidedIdentity.hashed_value == hashed_identity)
+                    identity_condition
                     & (ProvidedIdentity.privacy_request_id.isnot(None))
                 ),
             ).values(column("privacy_request_id"))
@@ -1424,8 +1481,8 @@ def privacy_request_data_transfer(
             detail=f"Rule key {rule_key} not found",
         )
 
-    value_dict: Dict[str, Optional[List[Row]]] = cache.get_encoded_objects_by_prefix(
-        f"{privacy_request_id}__access_request"
+    value_dict: Dict[str, Optional[List[Row]]] = cache.get_encoded_objects_by_index(
+        privacy_request.cache_index, f"{privacy_request_id}__access_request"
     )
 
     if not value_dict:
@@ -1,9 +1,11 @@
 """
 Contains utility functions that set up the application webserver.
 """
+from contextlib import contextmanager
 from logging import DEBUG
 from os.path import dirname, join
-from typing import List, Optional, Pattern, Union
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Pattern, Union
 
 from fastapi import FastAPI
 from loguru import logger
@@ -113,6 +115,31 @@ def create_fides_app(
     return fastapi_app
 
 
+# Seconds spent in each step of the webserver startup, in the order the steps ran
+startup_timings: Dict[str, float] = {}
+
+
+@contextmanager
+def startup_step(name: str) -> Iterator[None]:
+    """Time a step of the webserver startup for the startup timing report."""
+    started_at = perf_counter()
+    try:
+        yield
+    finally:
+        startup_timings[name] = perf_counter() - started_at
+
+
+def log_startup_timings(total: float) -> None:
+    """Log how long the webserver startup took and what it spent that time on."""
+    logger.info(
+        "Startup timing report: {:.2f}s in total ({})",
+        total,
+        ", ".join(
+            f"{name}: {seconds:.2f}s" for name, seconds in startup_timings.items()
+        ),
+    )
+
+
 def log_startup() -> None:
     """Log application startup and other information."""
     logger.info(f"Starting Fides - v{VERSION}")
@@ -141,14 +168,16 @@ async def run_database_startup() -> None:
         raise FidesError("No database uri provided")
 
     if CONFIG.database.automigrate:
-        await configure_db(
-            CONFIG.database.sync_database_uri, samples=CONFIG.database.load_samples
-        )
+        with startup_step("database migrations"):
+            await configure_db(
+                CONFIG.database.sync_database_uri, samples=CONFIG.database.load_samples
+            )
     else:
         logger.info("Skipping auto-migration due to 'automigrate' configuration value.")
 
     try:
-        create_or_update_parent_user()
+        with startup_step("parent user"):
+            create_or_update_parent_user()
     except Exception as e:
         logger.error("Error creating parent user: {}", str(e))
         raise FidesError(f"Error creating parent user: {str(e)}")
@@ -156,7 +185,8 @@ async def run_database_startup() -> None:
     db = get_api_session()
     logger.info("Loading config settings into database...")
     try:
-        ApplicationConfig.update_config_set(db, CONFIG)
+        with startup_step("config settings"):
+            ApplicationConfig.update_config_set(db, CONFIG)
     except Exception as e:
         logger.error("Error occurred writing config settings to database: {}", str(e))
         raise FidesError(
@@ -167,7 +197,8 @@ async def run_database_startup() -> None:
 
     logger.info("Validating SaaS connector templates...")
     try:
-        update_saas_configs(db)
+        with startup_step("SaaS connector templates"):
+            update_saas_configs(db)
         logger.info("Finished loading SaaS templates")
     except Exception as e:
         logger.error(
@@ -178,12 +209,14 @@ async def run_database_startup() -> None:
     finally:
         db.close()
 
-    load_default_experience_configs()  # Must occur before loading default privacy notices
+    with startup_step("default privacy experience configs"):
+        load_default_experience_configs()  # Must occur before loading default privacy notices
 
     if not CONFIG.test_mode:
         # Default notices subject to change, so preventing these from
         # loading in test mode to avoid interfering with unit tests.
-        load_default_privacy_notices()
+        with startup_step("default privacy notices"):
+            load_default_privacy_notices()
     db.close()
 
 
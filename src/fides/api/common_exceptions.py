@@ -29,6 +29,10 @@ class ValidationError(FidesopsException):
     """Data does not pass validation."""
 
 
+class RowLimitExceeded(FidesopsException):
+    """A collection has more rows than `execution.retrieval_row_limit` allows."""
+
+
 class StorageUploadError(FidesopsException):
     """Data cannot be uploaded to storage destination"""
 
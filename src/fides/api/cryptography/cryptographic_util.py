@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 import secrets
 from base64 import b64decode, b64encode
 from binascii import Error
@@ -22,6 +24,18 @@ def hash_with_salt(text: bytes, salt: bytes) -> str:
     return bcrypt.hashpw(text, salt).hex()
 
 
+def hmac_with_key(text: bytes, key: bytes) -> str:
+    """Hashes the text using HMAC-SHA-256 with the provided key and returns the hex
+    string representation"""
+    return hmac.new(key, text, hashlib.sha256).hexdigest()
+
+
+def derive_key(key: bytes, purpose: str) -> bytes:
+    """Derives a key for the given purpose from the provided key using HMAC-SHA-256,
+    so that the provided key itself is only ever used for its original purpose"""
+    return hmac.new(key, purpose.encode("UTF-8"), hashlib.sha256).digest()
+
+
 def generate_secure_random_string(length: int) -> str:
     """Generates a securely random string using Python secrets library
     that is twice the length of the specified input"""
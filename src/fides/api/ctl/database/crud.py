@@ -192,6 +192,75 @@ async def get_resource_with_custom_fields(
     return resource_dict
 
 
+async def get_resources_with_custom_fields(
+    sql_model: Base, fides_keys: List[str], async_session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """Get the resources from the database with any of the given FidesKeys, including
+    their custom fields, with one query for the resources and one for the custom fields.
+
+    Returns a list of dictionaries of the resources that exist, in the order of the
+    given FidesKeys.
+    """
+    if not fides_keys:
+        return []
+
+    with log.contextualize(sql_model=sql_model.__name__, fides_keys=fides_keys):
+        async with async_session.begin():
+            try:
+                log.debug("Fetching resources and their custom fields")
+                result = await async_session.execute(
+                    select(sql_model).where(sql_model.fides_key.in_(fides_keys))
+                )
+                sql_resources = result.scalars().all()
+                result = await async_session.execute(
+                    select(
+                        CustomField.resource_id,
+                        CustomFieldDefinition.name,
+                        CustomField.value,
+                    )
+                    .join(
+                        CustomField,
+                        CustomField.custom_field_definition_id
+                        == CustomFieldDefinition.id,
+                    )
+                    .where(
+                        (CustomField.resource_id.in_(fides_keys))
+                        & (  # pylint: disable=singleton-comparison
+                            CustomFieldDefinition.active == True
+                        )
+                    )
+                )
+            except SQLAlchemyError:
+                sa_error = errors.QueryError()
+                log.bind(error=sa_error.detail["error"]).info(  # type: ignore[index]
+                    "Failed to fetch resources"
+                )
+                raise sa_error
+
+            custom_fields = defaultdict(list)
+            for field in result.mappings().all():
+                custom_fields[field["resource_id"]].append(field)
+
+    resource_dicts: Dict[str, Dict[str, Any]] = {}
+    for resource in sql_resources:
+        resource_dict = resource.__dict__
+        resource_dict.pop("_sa_instance_state", None)
+        for field in custom_fields[resource.fides_key]:
+            if field["name"] in resource_dict:
+                resource_dict[
+                    field["name"]
+                ] = f"{resource_dict[field['name']]}, {', '.join(field['value'])}"
+            else:
+                resource_dict[field["name"]] = ", ".join(field["value"])
+        resource_dicts[resource.fides_key] = resource_dict
+
+    return [
+        resource_dicts[fides_key]
+        for fides_key in dict.fromkeys(fides_keys)
+        if fides_key in resource_dicts
+    ]
+
+
 async def list_resource(sql_model: Base, async_session: AsyncSession) -> List[Base]:
     """
     Get a list of all of the resources of this type from the database.
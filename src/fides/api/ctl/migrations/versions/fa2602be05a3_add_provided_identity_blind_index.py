@@ -0,0 +1,36 @@
+"""add provided identity blind index
+
+Revision ID: fa2602be05a3
+Revises: 76c02f99eec1
+Create Date: 2023-06-12 10:14:52.318407
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "fa2602be05a3"
+down_revision = "76c02f99eec1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the blind index column to provided identities. Existing identities are
+    backfilled by the webserver at startup, as this requires decrypting their values."""
+    op.add_column(
+        "providedidentity", sa.Column("blind_index", sa.String(), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_providedidentity_blind_index"),
+        "providedidentity",
+        ["blind_index"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_providedidentity_blind_index"), table_name="providedidentity"
+    )
+    op.drop_column("providedidentity", "blind_index")
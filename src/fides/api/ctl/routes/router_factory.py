@@ -19,6 +19,7 @@ from fides.api.ctl.database.crud import (
     create_resource,
     delete_resource,
     get_resource_with_custom_fields,
+    get_resources_with_custom_fields,
     list_resource,
     update_resource,
     upsert_resources,
@@ -78,6 +79,9 @@ def generic_router_factory(fides_model: FidesModelType, model_type: str) -> APIR
     )
     list_router = list_router_factory(fides_model=fides_model, model_type=model_type)
     get_router = get_router_factory(fides_model=fides_model, model_type=model_type)
+    bulk_get_router = bulk_get_router_factory(
+        fides_model=fides_model, model_type=model_type
+    )
     delete_router = delete_router_factory(
         fides_model=fides_model, model_type=model_type
     )
@@ -91,6 +95,7 @@ def generic_router_factory(fides_model: FidesModelType, model_type: str) -> APIR
     object_router.include_router(create_router)
     object_router.include_router(list_router)
     object_router.include_router(get_router)
+    object_router.include_router(bulk_get_router)
     object_router.include_router(delete_router)
     object_router.include_router(update_router)
     object_router.include_router(upsert_router)
@@ -202,6 +207,38 @@ def get_router_factory(fides_model: FidesModelType, model_type: str) -> APIRoute
     return router
 
 
+def bulk_get_router_factory(fides_model: FidesModelType, model_type: str) -> APIRouter:
+    """Return a configured version of a generic 'Bulk Get' endpoint."""
+
+    router = APIRouter(prefix=f"{API_PREFIX}/{model_type}", tags=[fides_model.__name__])
+
+    @router.post(
+        path="/bulk-get",
+        dependencies=[
+            Security(
+                verify_oauth_client_prod,
+                scopes=[f"{CLI_SCOPE_PREFIX_MAPPING[model_type]}:{READ}"],
+            )
+        ],
+        response_model=List[fides_model],
+        name="Bulk Get",
+    )
+    async def bulk_get(
+        fides_keys: List[str],
+        db: AsyncSession = Depends(get_async_db),
+    ) -> List:
+        """
+        Get the resources with any of the given fides_keys.
+
+        Keys that don't belong to a resource are skipped rather than
+        responding with a `404 Not Found`.
+        """
+        sql_model = sql_model_map[model_type]
+        return await get_resources_with_custom_fields(sql_model, fides_keys, db)
+
+    return router
+
+
 def update_router_factory(fides_model: FidesModelType, model_type: str) -> APIRouter:
     """Return a configured version of a generic 'Update' route."""
 
@@ -30,6 +30,7 @@ from fides.api.api.v1.urn_registry import (
 from fides.api.ctl.database.crud import (
     get_resource,
     get_resource_with_custom_fields,
+    get_resources_with_custom_fields,
     list_resource,
 )
 from fides.api.ctl.database.session import get_async_db
@@ -271,6 +272,25 @@ async def get(
     return await get_resource_with_custom_fields(System, fides_key, db)
 
 
+@SYSTEM_ROUTER.post(
+    "/bulk-get",
+    dependencies=[
+        Security(
+            verify_oauth_client_prod,
+            scopes=[SYSTEM_READ],
+        )
+    ],
+    response_model=List[SystemResponse],
+    name="Bulk Get",
+)
+async def bulk_get(
+    fides_keys: List[str],
+    db: AsyncSession = Depends(get_async_db),
+) -> List:
+    """Get the resources with any of the given fides_keys, skipping missing keys."""
+    return await get_resources_with_custom_fields(System, fides_keys, db)
+
+
 @SYSTEM_CONNECTION_INSTANTIATE_ROUTER.post(
     "/",
     dependencies=[
@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Set, Tuple, cast
+from collections import Counter, defaultdict
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pydash.collections
 from loguru import logger
@@ -17,7 +29,7 @@ from fides.api.graph.config import (
 )
 from fides.api.graph.graph import DatasetGraph, Edge, Node
 from fides.api.util.collection_util import Row, append
-from fides.api.util.matching_queue import MatchingQueue
+from fides.api.util.matching_queue import ReadyQueue
 
 Datastore = Dict[CollectionAddress, List[Row]]
 """A type expressing retrieved rows of data from a specified collection"""
@@ -120,18 +132,45 @@ class TraversalNode:
                     out[key] = filtered
         return out
 
-    def can_run_given(self, remaining_node_keys: Set[CollectionAddress]) -> bool:
+    def can_run_given(
+        self,
+        remaining_node_keys: Set[CollectionAddress],
+        remaining_dataset_keys: Optional[Container[str]] = None,
+    ) -> bool:
         """True if finished_node_keys covers all the nodes that this traversal_node is waiting for.  If
         all nodes this traversal_node is waiting for have finished, it's ok for this traversal_node to run.
+
+        The datasets of the remaining nodes are derived from remaining_node_keys unless they are passed in.
         """
-        if self.node.collection.after.intersection(
-            remaining_node_keys
-        ) or self.node.dataset.after.intersection(
-            {k.dataset for k in remaining_node_keys}
+        if remaining_dataset_keys is None:
+            remaining_dataset_keys = {k.dataset for k in remaining_node_keys}
+        if any(
+            address in remaining_node_keys for address in self.node.collection.after
+        ) or any(
+            dataset in remaining_dataset_keys for dataset in self.node.dataset.after
         ):
             return False
         return True
 
+    def waiting_on(
+        self,
+        remaining_node_keys: Set[CollectionAddress],
+        remaining_dataset_keys: Container[str],
+    ) -> Set[Union[CollectionAddress, str]]:
+        """The remaining nodes and datasets this traversal_node has to wait for, the node
+        can run once all of them are finished (see can_run_given)"""
+        waiting_on: Set[Union[CollectionAddress, str]] = {
+            address
+            for address in self.node.collection.after
+            if address in remaining_node_keys
+        }
+        waiting_on.update(
+            dataset
+            for dataset in self.node.dataset.after
+            if dataset in remaining_dataset_keys
+        )
+        return waiting_on
+
     def is_root_node(self) -> bool:
         """This traversal_node is the defined traversal start"""
         return self.address == ROOT_COLLECTION_ADDRESS
@@ -286,30 +325,62 @@ class Traversal:
         remaining_node_keys: Set[CollectionAddress] = set(
             self.traversal_node_dict.keys()
         )
+        # the number of nodes of each dataset that have not yet run, to check
+        # dataset-level "after" conditions without rebuilding the set of remaining datasets
+        remaining_datasets: Counter[str] = Counter(
+            address.dataset for address in remaining_node_keys
+        )
         finished_nodes: dict[CollectionAddress, TraversalNode] = {}
-        running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(self.root_node)
+        finished_order: Dict[CollectionAddress, int] = {}
+        # nodes waiting on "after" conditions are only popped once the nodes and
+        # datasets they wait for have finished, in the order they were queued
+        running_node_queue: ReadyQueue[TraversalNode] = ReadyQueue()
+        running_node_queue.push(
+            self.root_node,
+            self.root_node.waiting_on(remaining_node_keys, remaining_datasets),
+        )
         remaining_edges: Set[Edge] = self.edges.copy()
+        # index the remaining edges by the collections at both of their ends, so that each
+        # traversal_node only looks at its own edges instead of every remaining edge
+        remaining_edges_by_address: Dict[CollectionAddress, Set[Edge]] = defaultdict(
+            set
+        )
+        for edge in remaining_edges:
+            remaining_edges_by_address[edge.f1.collection_address()].add(edge)
+            remaining_edges_by_address[edge.f2.collection_address()].add(edge)
+
         while not running_node_queue.is_empty():
             # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
-            n = running_node_queue.pop_first_match(
-                lambda x: x.can_run_given(remaining_node_keys)
-            )
+            n = running_node_queue.pop()
 
             if n:
                 node_run_fn(n, environment)
+                node_edges = remaining_edges_by_address[n.address]
                 # delete all edges between the traversal_node that's just run and any completed nodes
-                for finished_node_address, finished_node in finished_nodes.items():
-                    completed_edges = Edge.delete_edges(
-                        remaining_edges,
-                        finished_node_address,
-                        cast(TraversalNode, n).address,  # type: ignore[redundant-cast]
+                completed_edges: Dict[CollectionAddress, Set[Edge]] = defaultdict(set)
+                for edge in node_edges:
+                    addr_1 = edge.f1.collection_address()
+                    other_address = (
+                        edge.f2.collection_address() if addr_1 == n.address else addr_1
                     )
+                    if other_address in finished_nodes and edge.spans(
+                        other_address, n.address
+                    ):
+                        completed_edges[other_address].add(edge)
+                for finished_node_address in sorted(
+                    completed_edges, key=finished_order.__getitem__
+                ):
+                    finished_node = finished_nodes[finished_node_address]
+                    for edge in completed_edges[finished_node_address]:
+                        remaining_edges.discard(edge)
+                        node_edges.discard(edge)
+                        remaining_edges_by_address[finished_node_address].discard(edge)
                     # append edges that end in this traversal_node
                     for edge in filter(
                         lambda _edge: _edge.ends_with_collection(
                             cast(TraversalNode, n).address  # type: ignore[redundant-cast]
                         ),
-                        completed_edges,
+                        completed_edges[finished_node_address],
                     ):
                         # note, this will not work for self-reference
                         finished_node.add_child(n, edge)
@@ -319,8 +390,7 @@ class Traversal:
                 edges_to_children = pydash.collections.filter_(
                     [
                         e.split_by_address(cast(TraversalNode, n).address)  # type: ignore[redundant-cast]
-                        for e in remaining_edges
-                        if e.contains(n.address)
+                        for e in node_edges
                     ]
                 )
                 if not edges_to_children:
@@ -332,11 +402,19 @@ class Traversal:
                 }
                 for nxt_address in child_node_addresses:
                     # only add the next traversal_node to the queue if it is not already there (no duplicates)
+                    nxt = self.traversal_node_dict[nxt_address]
                     running_node_queue.push_if_new(
-                        self.traversal_node_dict[nxt_address]
+                        nxt, nxt.waiting_on(remaining_node_keys, remaining_datasets)
                     )
+                finished_order[n.address] = len(finished_order)
                 finished_nodes[n.address] = n
-                remaining_node_keys.difference_update({n.address})
+                if n.address in remaining_node_keys:
+                    remaining_node_keys.remove(n.address)
+                    running_node_queue.release(n.address)
+                    remaining_datasets[n.address.dataset] -= 1
+                    if not remaining_datasets[n.address.dataset]:
+                        del remaining_datasets[n.address.dataset]
+                        running_node_queue.release(n.address.dataset)
             else:
                 # traversal traversal_node dict diff finished nodes
                 logger.error(
@@ -4,6 +4,7 @@ Contains the code that sets up the API.
 import sys
 from datetime import datetime, timezone
 from logging import WARNING
+from time import perf_counter
 from typing import Callable, Optional
 
 from fastapi import HTTPException, Request, Response, status
@@ -11,6 +12,7 @@ from fastapi.responses import FileResponse
 from fideslog.sdk.python.event import AnalyticsEvent
 from loguru import logger
 from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 from uvicorn import Config, Server
 
 import fides
@@ -23,7 +25,9 @@ from fides.api.app_setup import (
     check_redis,
     create_fides_app,
     log_startup,
+    log_startup_timings,
     run_database_startup,
+    startup_step,
 )
 from fides.api.ctl.routes.util import API_PREFIX
 from fides.api.ctl.ui import (
@@ -33,8 +37,11 @@ from fides.api.ctl.ui import (
     match_route,
     path_is_in_ui_directory,
 )
-from fides.api.middleware import handle_audit_log_resource
+from fides.api.middleware import audit_log_resource_writer, handle_audit_log_resource
 from fides.api.schemas.analytics import Event, ExtraData
+from fides.api.service.privacy_request.blind_index_service import (
+    initiate_blind_index_backfill,
+)
 
 # pylint: disable=wildcard-import, unused-wildcard-import
 from fides.api.service.privacy_request.email_batch_service import (
@@ -203,6 +210,7 @@ async def setup_server() -> None:
     **NOTE**: The order of operations here _is_ deliberate
     and must be maintained.
     """
+    started_at = perf_counter()
     if not CONFIG.dev_mode:
         sys.tracebacklimit = 0
 
@@ -210,24 +218,39 @@ async def setup_server() -> None:
 
     await run_database_startup()
 
-    check_redis()
+    with startup_step("cache connection test"):
+        check_redis()
+
+    with startup_step("scheduled tasks"):
+        if not scheduler.running:
+            scheduler.start()
 
-    if not scheduler.running:
-        scheduler.start()
+        initiate_scheduled_batch_email_send()
 
-    initiate_scheduled_batch_email_send()
+        initiate_blind_index_backfill()
 
     logger.debug("Sending startup analytics events...")
-    await send_analytics_event(
-        AnalyticsEvent(
-            docker=in_docker_container(),
-            event=Event.server_start.value,
-            event_created_at=datetime.now(tz=timezone.utc),
+    with startup_step("startup analytics events"):
+        await send_analytics_event(
+            AnalyticsEvent(
+                docker=in_docker_container(),
+                event=Event.server_start.value,
+                event_created_at=datetime.now(tz=timezone.utc),
+            )
         )
-    )
 
     logger.info(FIDES_ASCII_ART)
     logger.info(f"Fides startup complete! v{VERSION}")
+    log_startup_timings(perf_counter() - started_at)
+
+
+@app.on_event("shutdown")
+async def shutdown_server() -> None:
+    """Write the audit log resource records still queued before the webserver stops."""
+    await run_in_threadpool(audit_log_resource_writer.stop)
+    logger.debug(
+        "Audit log resource writer stopped: {}", audit_log_resource_writer.stats()
+    )
 
 
 def start_webserver(port: int = 8080) -> None:
@@ -1,5 +1,8 @@
 import json
-from typing import Any, Dict, List
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Any, Dict, List, Optional
 
 from fastapi import Request
 from loguru import logger
@@ -10,6 +13,7 @@ from starlette.types import Message
 from fides.api.api import deps
 from fides.api.ctl.sql_models import AuditLogResource  # type: ignore[attr-defined]
 from fides.api.oauth.utils import extract_token_and_load_client
+from fides.core.config import CONFIG
 
 
 async def handle_audit_log_resource(request: Request) -> None:
@@ -23,60 +27,211 @@ async def handle_audit_log_resource(request: Request) -> None:
     WHEN: Timestamps related to the request
     WHAT: The endpoint, request type, and (if applicable)
     fides_key(s) associated with the request
+
+    Only the fides_keys are read here: the user id is resolved, and the record
+    written, by the audit log resource writer in the background.
     """
+    # Access request body to check for fides_keys
+    body = await get_body(request)
 
-    # details to be stored as a row on the server
-    audit_log_resource_data = {
-        "user_id": None,
-        "request_path": request.scope["path"],
-        "request_type": request.method,
-        "fides_keys": None,
-        "extra_data": None,
-    }
-    db: Session = deps.get_api_session()
-
-    # get the user id associated with the request
-    token = request.headers.get("authorization")
-    if token:
-        client = await get_client_user_id(db, token)
-        audit_log_resource_data["user_id"] = client
+    audit_log_resource_writer.enqueue(
+        {
+            "request_path": request.scope["path"],
+            "request_type": request.method,
+            "authorization": request.headers.get("authorization"),
+            "fides_keys": get_fides_keys_from_body(body),
+        }
+    )
 
-    # Access request body to check for fides_keys
-    await set_body(request, await request.body())
 
-    body = await get_body(request)
-    fides_keys = await extract_data_from_body(body)
-    audit_log_resource_data["fides_keys"] = fides_keys
+class AuditLogResourceWriter:
+    """
+    Writes audit log resource records in bulk from a background thread, so requests
+    don't wait on the database.
+
+    Requests are queued in memory, up to `security.audit_log_resource_queue_size`,
+    and written in batches of up to `security.audit_log_resource_batch_size`, at least
+    every `security.audit_log_resource_flush_interval_seconds`. Requests arriving while
+    the queue is full are dropped and counted. Queued requests are written when the
+    writer is stopped, on webserver shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "Queue[Dict[str, Any]]" = Queue(
+            maxsize=CONFIG.security.audit_log_resource_queue_size
+        )
+        self._lock = Lock()
+        self._stopping = Event()
+        self._thread: Optional[Thread] = None
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+
+    def stats(self) -> Dict[str, int]:
+        """The number of records queued, and dropped, written or failed so far"""
+        return {
+            "queued": self._queue.qsize(),
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+        }
 
-    # write record to server
-    await write_audit_log_resource_record(db, audit_log_resource_data)
+    def enqueue(self, pending_record: Dict[str, Any]) -> bool:
+        """
+        Queue a request to be written to the audit log resource table without blocking.
+        Returns False if the request was dropped because the queue is full.
+        """
+        self._start()
+        try:
+            self._queue.put_nowait(pending_record)
+        except Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            # Log the first drop, then every hundredth, to avoid flooding the logs
+            if dropped % 100 == 1:
+                logger.warning(
+                    "Audit log resource queue is full, {} records dropped so far",
+                    dropped,
+                )
+            return False
+        return True
 
+    def flush(self) -> None:
+        """Write every queued record now, from the calling thread"""
+        while True:
+            batch = self._next_batch(wait=False)
+            if not batch:
+                return
+            self._write_batch(batch)
 
-async def write_audit_log_resource_record(
-    db: Session, audit_log_resource_data: Dict[str, Any]
-) -> None:
+    def stop(self) -> None:
+        """Stop the background thread once every queued record has been written"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread:
+            self._stopping.set()
+            thread.join()
+            self._stopping.clear()
+        self.flush()
+
+    def _start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            if self._thread:
+                logger.warning("Audit log resource writer stopped, restarting it")
+            self._thread = Thread(
+                target=self._run, name="audit-log-resource-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._next_batch(wait=not self._stopping.is_set())
+            if batch:
+                self._write_batch(batch)
+
+    def _next_batch(self, wait: bool) -> List[Dict[str, Any]]:
+        """
+        Up to a batch size of queued records, waiting for at most the flush interval
+        for the batch to fill up if `wait` is set.
+        """
+        batch: List[Dict[str, Any]] = []
+        deadline = (
+            monotonic() + CONFIG.security.audit_log_resource_flush_interval_seconds
+        )
+        while len(batch) < CONFIG.security.audit_log_resource_batch_size:
+            try:
+                if wait and not self._stopping.is_set():
+                    batch.append(
+                        self._queue.get(timeout=max(deadline - monotonic(), 0))
+                    )
+                else:
+                    batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Write a batch of records, counting them as failed if anything goes wrong so a
+        single batch never stops the writer thread.
+        """
+        try:
+            self._write(batch)
+        except Exception as exc:  # pylint: disable=broad-except
+            with self._lock:
+                self.failed += len(batch)
+            logger.error(
+                "Unable to write {} audit log resource records: {}", len(batch), exc
+            )
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        db: Optional[Session] = None
+        try:
+            db = deps.get_api_session()
+            records = [
+                record
+                for record in (
+                    build_audit_log_resource_record(db, pending_record)
+                    for pending_record in batch
+                )
+                if record is not None
+            ]
+            db.bulk_insert_mappings(AuditLogResource, records)
+            db.commit()
+            with self._lock:
+                self.written += len(records)
+        except SQLAlchemyError as err:
+            if db:
+                db.rollback()
+            with self._lock:
+                self.failed += len(batch)
+            logger.warning(
+                "Unable to write {} audit log resource records: {}", len(batch), err
+            )
+        finally:
+            if db:
+                db.close()
+
+
+def build_audit_log_resource_record(
+    db: Session, pending_record: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
     """
-    Writes a record to the audit log resource table
+    The audit log resource record of a queued request, with the id of the user who made
+    it. Returns None, like the middleware used to skip the record, if the user can't
+    be resolved.
     """
     try:
-        AuditLogResource.create(db=db, data=audit_log_resource_data)
-    except SQLAlchemyError as err:
-        logger.debug(err)
+        token = pending_record["authorization"]
+        return {
+            "user_id": resolve_client_user_id(db, token) if token else None,
+            "request_path": pending_record["request_path"],
+            "request_type": pending_record["request_type"],
+            "fides_keys": pending_record["fides_keys"],
+            "extra_data": None,
+        }
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.debug(exc)
+        return None
 
 
-async def get_client_user_id(db: Session, auth_token: str) -> str:
+def resolve_client_user_id(db: Session, auth_token: str) -> str:
     """
-    Attempts to retrieve a client user_id
+    Retrieves the user_id of the client an authorization header belongs to
     """
     stripped_token = auth_token.replace("Bearer ", "")
     _, client = extract_token_and_load_client(stripped_token, db)
     return client.user_id or "root"
 
 
-async def extract_data_from_body(body: bytes) -> List:
+def get_fides_keys_from_body(body: bytes) -> List:
     """
-    Attempts to retrieve any fides_keys associated with
-    the request found in the request body.
+    Retrieves any fides_keys found in a request body
     """
 
     fides_keys = []
@@ -124,3 +279,6 @@ async def get_body(request: Request) -> bytes:
     body = await request.body()
     await set_body(request, body)
     return body
+
+
+audit_log_resource_writer = AuditLogResourceWriter()
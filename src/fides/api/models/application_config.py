@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from copy import deepcopy
 from json import loads
-from typing import Any, Dict, Optional
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 
 from loguru import logger
 from pydantic.utils import deep_update
@@ -15,8 +17,16 @@ from sqlalchemy_utils.types.encrypted.encrypted_type import (
 )
 
 from fides.api.db.base_class import Base, JSONTypeOverride
+from fides.api.util.cache_version import CacheVersion
 from fides.core.config import CONFIG, FidesConfig
 
+ConfigSets = Optional[Tuple[Dict[str, Any], Dict[str, Any]]]
+
+_lock = Lock()
+# The api_set and config_set of the config record, or None if there is no record,
+# stored with the version of the config they were read at
+_cached_config_sets: Optional[Tuple[str, ConfigSets]] = None
+
 
 class ApplicationConfig(Base):
     """
@@ -162,6 +172,39 @@ class ApplicationConfig(Base):
         config_dict = loads(config.json())
         return cls.create_or_update(db, data={"config_set": config_dict})
 
+    @classmethod
+    def get_cached_config_sets(cls, db: Session) -> ConfigSets:
+        """
+        The api_set and config_set of the config record, or None if there is no record.
+
+        They are kept in memory until the config record is changed by any process, which
+        is signaled through a version counter in Redis. If Redis can't be reached, or the
+        given session has uncommitted changes to the config record, it is read from the db.
+        The returned dicts are shared and must not be modified.
+        """
+        global _cached_config_sets  # pylint: disable=W0603
+        version = (
+            None
+            if application_config_version.changed_in(db)
+            else application_config_version.get()
+        )
+        if version is not None:
+            with _lock:
+                cached = _cached_config_sets
+            if cached and cached[0] == version:
+                return cached[1]
+
+        config_record = db.query(cls).first()
+        config_sets: ConfigSets = (
+            (dict(config_record.api_set), dict(config_record.config_set))
+            if config_record
+            else None
+        )
+        if version is not None:
+            with _lock:
+                _cached_config_sets = (version, config_sets)
+        return config_sets
+
     @classmethod
     def get_resolved_config_property(
         cls, db: Session, config_property: str, default_value: Any = None
@@ -173,12 +216,33 @@ class ApplicationConfig(Base):
 
         Api-set values get priority over config-set, in case of conflict.
         """
-        config_record = db.query(cls).first()
-        if config_record:
-            api_prop = get(config_record.api_set, config_property)
+        config_sets = cls.get_cached_config_sets(db)
+        if config_sets:
+            api_set, config_set = config_sets
+            api_prop = get(api_set, config_property)
             if api_prop is None:
                 logger.info(f"No API-set {config_property} property found")
-                return get(config_record.config_set, config_property, default_value)
-            return api_prop
+                return deepcopy(get(config_set, config_property, default_value))
+            return deepcopy(api_prop)
         logger.warning("No config record found!")
         return default_value
+
+
+def _clear_cached_config_sets() -> None:
+    global _cached_config_sets  # pylint: disable=W0603
+    with _lock:
+        _cached_config_sets = None
+
+
+# The version of the config record, shared by all processes through Redis and bumped
+# every time the config record changes. If Redis can't be reached, the config isn't cached.
+application_config_version = CacheVersion(
+    "application_config_version",
+    (ApplicationConfig,),
+    on_invalidate=_clear_cached_config_sets,
+)
+
+
+def invalidate_application_config_cache() -> None:
+    """Discard the cached config record of every process"""
+    application_config_version.invalidate()
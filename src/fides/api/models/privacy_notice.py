@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 from fideslang.validation import FidesKey
 from sqlalchemy import Boolean, Column
@@ -14,7 +14,11 @@ from sqlalchemy.orm import Session, relationship
 from sqlalchemy.util import hybridproperty
 
 from fides.api.common_exceptions import ValidationError
-from fides.api.ctl.sql_models import System  # type: ignore[attr-defined]
+from fides.api.ctl.sql_models import (  # type: ignore[attr-defined]
+    DataUse,
+    PrivacyDeclaration,
+    System,
+)
 from fides.api.db.base_class import Base, FidesBase
 
 
@@ -369,21 +373,50 @@ class PrivacyNoticeHistory(PrivacyNoticeBase, Base):
         String, ForeignKey(PrivacyNotice.id_field_path), nullable=False
     )
 
-    def calculate_relevant_systems(self, db: Session) -> List[FidesKey]:
+    def calculate_relevant_systems(
+        self,
+        db: Session,
+        system_data_uses: Optional[Dict[FidesKey, Set[str]]] = None,
+    ) -> List[FidesKey]:
         """Method to cache the relevant systems at the time to store on PrivacyPreferenceHistory for record keeping
 
         Provided the notice's enforcement level is "system_wide" - a system is relevant if
         their data use is an exact match or a child of the notice's data use.
+
+        The data uses of every system can be passed in, as returned by `get_system_data_uses`,
+        when calculating the relevant systems of several notices.
         """
         relevant_systems: List[FidesKey] = []
         if self.enforcement_level == EnforcementLevel.system_wide:
-            for system in db.query(System):
-                if self.applies_to_system(system):
-                    relevant_systems.append(system.fides_key)
-                    continue
+            if system_data_uses is None:
+                system_data_uses = get_system_data_uses(db)
+            notice_data_uses = set(self.data_uses or [])
+            relevant_systems = [
+                fides_key
+                for fides_key, data_uses in system_data_uses.items()
+                if not data_uses.isdisjoint(notice_data_uses)
+            ]
         return relevant_systems
 
 
+def get_system_data_uses(db: Session) -> Dict[FidesKey, Set[str]]:
+    """
+    The data uses of every system with privacy declarations, including their parents,
+    keyed by system fides key and loaded with a single query
+    """
+    system_data_uses: Dict[FidesKey, Set[str]] = defaultdict(set)
+    for fides_key, data_use in (
+        db.query(System.fides_key, PrivacyDeclaration.data_use)
+        .join(PrivacyDeclaration, PrivacyDeclaration.system_id == System.id)
+        .order_by(System.fides_key)
+    ):
+        if data_use:
+            system_data_uses[fides_key].update(
+                DataUse.get_parent_uses_from_key(data_use)
+            )
+    return dict(system_data_uses)
+
+
 def update_if_modified(
     resource: Base, db: Session, *, data: dict[str, Any]
 ) -> Tuple[Base, bool]:
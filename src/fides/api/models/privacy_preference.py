@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from sqlalchemy import ARRAY, Column, DateTime
 from sqlalchemy import Enum as EnumColumn
-from sqlalchemy import ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import ForeignKey, String, UniqueConstraint, func, or_
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Session, relationship
@@ -30,6 +30,7 @@ from fides.api.models.privacy_request import (
     PrivacyRequest,
     ProvidedIdentity,
 )
+from fides.api.util.relevant_systems_cache import get_relevant_systems
 from fides.core.config import CONFIG
 
 
@@ -225,7 +226,9 @@ class PrivacyPreferenceHistory(Base):
                 "Must supply a verified provided identity id or a fides_user_device_provided_identity_id"
             )
 
-        data["relevant_systems"] = privacy_notice_history.calculate_relevant_systems(db)
+        data["relevant_systems"] = get_relevant_systems(db, [privacy_notice_history])[
+            privacy_notice_history.id
+        ]
         created_privacy_preference_history = super().create(
             db=db, data=data, check_name=check_name
         )
@@ -292,6 +295,185 @@ class PrivacyPreferenceHistory(Base):
 
         return created_privacy_preference_history
 
+    @classmethod
+    def bulk_create(
+        cls: Type[PrivacyPreferenceHistory],
+        db: Session,
+        *,
+        data: List[dict[str, Any]],
+    ) -> List[PrivacyPreferenceHistory]:
+        """Create PrivacyPreferenceHistory records for several privacy notices and upsert their
+        CurrentPrivacyPreference records, like `create` does for a single record, in one transaction.
+
+        Privacy notice histories, their relevant systems and existing current preferences
+        are loaded with a query each, rather than once per preference.
+        """
+        privacy_notice_histories: Dict[str, PrivacyNoticeHistory] = {
+            privacy_notice_history.id: privacy_notice_history
+            for privacy_notice_history in db.query(PrivacyNoticeHistory).filter(
+                PrivacyNoticeHistory.id.in_(
+                    [item.get("privacy_notice_history_id") for item in data]
+                )
+            )
+        }
+        for item in data:
+            if item.get("privacy_notice_history_id") not in privacy_notice_histories:
+                raise PrivacyNoticeHistoryNotFound()
+            if not item.get("provided_identity_id") and not item.get(
+                "fides_user_device_provided_identity_id"
+            ):
+                raise IdentityNotFoundException(
+                    "Must supply a verified provided identity id or a fides_user_device_provided_identity_id"
+                )
+
+        relevant_systems = get_relevant_systems(db, privacy_notice_histories.values())
+        created_privacy_preference_histories: List[PrivacyPreferenceHistory] = [
+            cls(
+                **{
+                    **item,
+                    "relevant_systems": relevant_systems[
+                        item["privacy_notice_history_id"]
+                    ],
+                }
+            )
+            for item in data
+        ]
+        db.add_all(created_privacy_preference_histories)
+        db.flush()
+
+        # Current Privacy Preferences saved against any of the ProvidedIdentities or
+        # Fides User Device Id Provided Identities, for any of the privacy notices
+        provided_identity_ids = {
+            item["provided_identity_id"]
+            for item in data
+            if item.get("provided_identity_id")
+        }
+        fides_user_device_provided_identity_ids = {
+            item["fides_user_device_provided_identity_id"]
+            for item in data
+            if item.get("fides_user_device_provided_identity_id")
+        }
+        current_preferences_on_provided_identity: Dict[
+            Tuple[Optional[str], str], CurrentPrivacyPreference
+        ] = {}
+        current_preferences_on_fides_user_device_provided_identity: Dict[
+            Tuple[Optional[str], str], CurrentPrivacyPreference
+        ] = {}
+        for existing_preference in db.query(CurrentPrivacyPreference).filter(
+            CurrentPrivacyPreference.privacy_notice_id.in_(
+                {
+                    privacy_notice_history.privacy_notice_id
+                    for privacy_notice_history in privacy_notice_histories.values()
+                }
+            ),
+            or_(
+                CurrentPrivacyPreference.provided_identity_id.in_(
+                    provided_identity_ids
+                ),
+                CurrentPrivacyPreference.fides_user_device_provided_identity_id.in_(
+                    fides_user_device_provided_identity_ids
+                ),
+            ),
+        ):
+            if existing_preference.provided_identity_id in provided_identity_ids:
+                current_preferences_on_provided_identity[
+                    (
+                        existing_preference.provided_identity_id,
+                        existing_preference.privacy_notice_id,
+                    )
+                ] = existing_preference
+            if (
+                existing_preference.fides_user_device_provided_identity_id
+                in fides_user_device_provided_identity_ids
+            ):
+                current_preferences_on_fides_user_device_provided_identity[
+                    (
+                        existing_preference.fides_user_device_provided_identity_id,
+                        existing_preference.privacy_notice_id,
+                    )
+                ] = existing_preference
+
+        def existing_current_preferences(
+            history: PrivacyPreferenceHistory, privacy_notice_id: str
+        ) -> Tuple[
+            Optional[CurrentPrivacyPreference], Optional[CurrentPrivacyPreference]
+        ]:
+            return (
+                current_preferences_on_provided_identity.get(
+                    (history.provided_identity_id, privacy_notice_id)
+                )
+                if history.provided_identity_id
+                else None,
+                current_preferences_on_fides_user_device_provided_identity.get(
+                    (history.fides_user_device_provided_identity_id, privacy_notice_id)
+                )
+                if history.fides_user_device_provided_identity_id
+                else None,
+            )
+
+        # If separate current preferences exist for both identities, delete the one saved
+        # against the fides user device id so they can be consolidated. This is flushed
+        # before updating the other one, to keep the unique constraints satisfied.
+        for history in created_privacy_preference_histories:
+            privacy_notice_id = privacy_notice_histories[
+                history.privacy_notice_history_id
+            ].privacy_notice_id
+            (
+                on_provided_identity,
+                on_fides_user_device_provided_identity,
+            ) = existing_current_preferences(history, privacy_notice_id)
+            if (
+                on_provided_identity
+                and on_fides_user_device_provided_identity
+                and on_provided_identity != on_fides_user_device_provided_identity
+            ):
+                db.delete(on_fides_user_device_provided_identity)
+                del current_preferences_on_fides_user_device_provided_identity[
+                    (history.fides_user_device_provided_identity_id, privacy_notice_id)
+                ]
+        db.flush()
+
+        for history in created_privacy_preference_histories:
+            privacy_notice_history = privacy_notice_histories[
+                history.privacy_notice_history_id
+            ]
+            privacy_notice_id = privacy_notice_history.privacy_notice_id
+            current_privacy_preference_data = {
+                "preference": history.preference,
+                "provided_identity_id": history.provided_identity_id,
+                "privacy_notice_id": privacy_notice_id,
+                "privacy_notice_history_id": privacy_notice_history.id,
+                "privacy_preference_history_id": history.id,
+                "fides_user_device_provided_identity_id": history.fides_user_device_provided_identity_id,
+            }
+            (
+                on_provided_identity,
+                on_fides_user_device_provided_identity,
+            ) = existing_current_preferences(history, privacy_notice_id)
+            current_preference: Optional[CurrentPrivacyPreference] = (
+                on_provided_identity or on_fides_user_device_provided_identity
+            )
+            if current_preference:
+                for key, value in current_privacy_preference_data.items():
+                    setattr(current_preference, key, value)
+            else:
+                current_preference = CurrentPrivacyPreference(
+                    **current_privacy_preference_data
+                )
+                db.add(current_preference)
+
+            if history.provided_identity_id:
+                current_preferences_on_provided_identity[
+                    (history.provided_identity_id, privacy_notice_id)
+                ] = current_preference
+            if history.fides_user_device_provided_identity_id:
+                current_preferences_on_fides_user_device_provided_identity[
+                    (history.fides_user_device_provided_identity_id, privacy_notice_id)
+                ] = current_preference
+
+        db.commit()
+        return created_privacy_preference_histories
+
 
 class CurrentPrivacyPreference(Base):
     """Stores only the user's most recently saved preference for a given privacy notice
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 from datetime import datetime, timedelta
 from enum import Enum as EnumType
 from typing import Any, Dict, List, Optional, Union
@@ -18,10 +19,14 @@ from sqlalchemy import (
     Integer,
     String,
     UniqueConstraint,
+    and_,
+    event,
+    or_,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Session, backref, relationship
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy_utils.types.encrypted.encrypted_type import (
     AesGcmEngine,
     StringEncryptedType,
@@ -34,7 +39,11 @@ from fides.api.common_exceptions import (
     NoCachedManualWebhookEntry,
     PrivacyRequestPaused,
 )
-from fides.api.cryptography.cryptographic_util import hash_with_salt
+from fides.api.cryptography.cryptographic_util import (
+    derive_key,
+    hash_with_salt,
+    hmac_with_key,
+)
 from fides.api.db.base_class import Base  # type: ignore[attr-defined]
 from fides.api.db.base_class import JSONTypeOverride
 from fides.api.db.util import EnumColumn
@@ -68,6 +77,7 @@ from fides.api.util.cache import (
     get_encryption_cache_key,
     get_identity_cache_key,
     get_masking_secret_cache_key,
+    get_privacy_request_index_key,
 )
 from fides.api.util.collection_util import Row
 from fides.api.util.constants import API_DATE_FORMAT
@@ -307,13 +317,34 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         """
         cache: FidesopsRedis = get_cache()
         all_keys = get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
-        for key in all_keys:
-            cache.delete(key)
+        if all_keys:
+            cache.delete(*all_keys)
 
         for provided_identity in self.provided_identities:  # type: ignore[attr-defined]
             provided_identity.delete(db=db)
         super().delete(db=db)
 
+    @property
+    def cache_index(self) -> str:
+        """The key of the set indexing every key cached for this privacy request"""
+        return get_privacy_request_index_key(self.id)
+
+    def start_cache_index(self) -> None:
+        """Mark the cache index of a new privacy request as complete, before anything
+        is cached for it. Every key cached for the request is added to the index."""
+        get_cache().start_index(self.cache_index)
+
+    def index_cached_keys(self) -> None:
+        """Make sure every key cached for this privacy request is in its cache index.
+
+        Privacy requests created before keys were indexed have their cached keys
+        added to the index with a single scan of the keyspace.
+        """
+        cache: FidesopsRedis = get_cache()
+        if not cache.is_index_complete(self.cache_index):
+            logger.info("Indexing cached keys for privacy request {}", self.id)
+            cache.index_keys_by_pattern(self.cache_index, f"*{self.id}*")
+
     def cache_identity(self, identity: Identity) -> None:
         """Sets the identity's values at their specific locations in the Fides app cache"""
         cache: FidesopsRedis = get_cache()
@@ -323,6 +354,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                 cache.set_with_autoexpire(
                     get_identity_cache_key(self.id, key),
                     value,
+                    index=self.cache_index,
                 )
 
     def persist_identity(self, db: Session, identity: Identity) -> None:
@@ -381,6 +413,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
             get_async_task_tracking_cache_key(self.id),
             task_id,
         )
+        cache.add_to_index(self.cache_index, get_async_task_tracking_cache_key(self.id))
 
     def get_cached_task_id(self) -> Optional[str]:
         """Gets the cached task ID for this privacy request."""
@@ -405,11 +438,13 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         repr(value),
+                        index=self.cache_index,
                     )
                 else:
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         value,
+                        index=self.cache_index,
                     )
 
     def cache_encryption(self, encryption_key: Optional[str] = None) -> None:
@@ -421,6 +456,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_with_autoexpire(
             get_encryption_cache_key(self.id, "key"),
             encryption_key,
+            index=self.cache_index,
         )
 
     def cache_masking_secret(self, masking_secret: MaskingSecretCache) -> None:
@@ -435,20 +471,23 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                 secret_type=masking_secret.secret_type,
             ),
             FidesopsRedis.encode_obj(masking_secret.secret),
+            index=self.cache_index,
         )
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
         """Retrieves any identity data pertaining to this request from the cache"""
-        prefix = f"id-{self.id}-identity-*"
+        prefix = f"id-{self.id}-identity-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
-        return {key.split("-")[-1]: cache.get(key) for key in keys}
+        keys = cache.get_keys_by_index(self.cache_index, prefix)
+        return {
+            key.split("-")[-1]: value for key, value in cache.get_values(keys).items()
+        }
 
     def get_results(self) -> Dict[str, Any]:
         """Retrieves all cached identity data associated with this Privacy Request"""
         cache: FidesopsRedis = get_cache()
-        result_prefix = f"{self.id}__*"
-        return cache.get_encoded_objects_by_prefix(result_prefix)
+        result_prefix = f"{self.id}__"
+        return cache.get_encoded_objects_by_index(self.cache_index, result_prefix)
 
     def cache_email_connector_template_contents(
         self,
@@ -463,6 +502,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
             step=step,
             collection=collection,
             action_needed=action_needed,
+            index=self.cache_index,
         )
 
     def get_email_connector_template_contents_by_dataset(
@@ -470,8 +510,8 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
     ) -> List[CheckpointActionRequired]:
         """Retrieve the raw details to populate an email template for collections on a given dataset."""
         cache: FidesopsRedis = get_cache()
-        email_contents: Dict[str, Optional[Any]] = cache.get_encoded_objects_by_prefix(
-            f"EMAIL_INFORMATION__{self.id}__{step.value}__{dataset}"
+        email_contents: Dict[str, Optional[Any]] = cache.get_encoded_objects_by_index(
+            self.cache_index, f"EMAIL_INFORMATION__{self.id}__{step.value}__{dataset}"
         )
 
         actions: List[CheckpointActionRequired] = []
@@ -496,6 +536,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
             step=step,
             collection=collection,
             action_needed=action_needed,
+            index=self.cache_index,
         )
 
     def get_paused_collection_details(
@@ -525,6 +566,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
             step=step,
             collection=collection,
             action_needed=None,
+            index=self.cache_index,
         )
 
     def get_failed_checkpoint_details(
@@ -551,6 +593,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"WEBHOOK_MANUAL_INPUT__{self.id}__{manual_webhook.id}",
             parsed_data.dict(),
+            index=self.cache_index,
         )
 
     def get_manual_webhook_input_strict(
@@ -605,6 +648,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"MANUAL_INPUT__{self.id}__{collection.value}",
             manual_rows,
+            index=self.cache_index,
         )
 
     def get_manual_input(self, collection: CollectionAddress) -> Optional[List[Row]]:
@@ -614,12 +658,9 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         This is for use by the *manual* connector which is integrated with the graph.
         """
         cache: FidesopsRedis = get_cache()
-        cached_results: Optional[
-            Dict[str, Optional[List[Row]]]
-        ] = cache.get_encoded_objects_by_prefix(
-            f"MANUAL_INPUT__{self.id}__{collection.value}"
+        return cache.get_encoded_by_key(
+            f"EN_MANUAL_INPUT__{self.id}__{collection.value}"
         )
-        return list(cached_results.values())[0] if cached_results else None
 
     def cache_manual_erasure_count(
         self, collection: CollectionAddress, count: int
@@ -632,6 +673,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"MANUAL_MASK__{self.id}__{collection.value}",
             count,
+            index=self.cache_index,
         )
 
     def get_manual_erasure_count(self, collection: CollectionAddress) -> Optional[int]:
@@ -641,24 +683,21 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         This is for use by the *manual* connector which is integrated with the graph.
         """
         cache: FidesopsRedis = get_cache()
-        prefix = f"MANUAL_MASK__{self.id}__{collection.value}"
-        value_dict: Optional[Dict[str, int]] = cache.get_encoded_objects_by_prefix(  # type: ignore
-            prefix
+        return cache.get_encoded_by_key(
+            f"EN_MANUAL_MASK__{self.id}__{collection.value}"
         )
-        return list(value_dict.values())[0] if value_dict else None
 
     def cache_access_graph(self, value: GraphRepr) -> None:
         """Cache a representation of the graph built for the access request"""
         cache: FidesopsRedis = get_cache()
-        cache.set_encoded_object(f"ACCESS_GRAPH__{self.id}", value)
+        cache.set_encoded_object(
+            f"ACCESS_GRAPH__{self.id}", value, index=self.cache_index
+        )
 
     def get_cached_access_graph(self) -> Optional[GraphRepr]:
         """Fetch the graph built for the access request"""
         cache: FidesopsRedis = get_cache()
-        value_dict: Optional[
-            Dict[str, Optional[GraphRepr]]
-        ] = cache.get_encoded_objects_by_prefix(f"ACCESS_GRAPH__{self.id}")
-        return list(value_dict.values())[0] if value_dict else None
+        return cache.get_encoded_by_key(f"EN_ACCESS_GRAPH__{self.id}")
 
     def trigger_policy_webhook(
         self,
@@ -802,14 +841,9 @@ def _get_manual_input_from_cache(
     """Get raw manual input uploaded to the privacy request for the given webhook
     from the cache without attempting to coerce into a Pydantic schema"""
     cache: FidesopsRedis = get_cache()
-    cached_results: Optional[
-        Optional[Dict[str, Any]]
-    ] = cache.get_encoded_objects_by_prefix(
-        f"WEBHOOK_MANUAL_INPUT__{privacy_request.id}__{manual_webhook.id}"
+    return cache.get_encoded_by_key(
+        f"EN_WEBHOOK_MANUAL_INPUT__{privacy_request.id}__{manual_webhook.id}"
     )
-    if cached_results:
-        return list(cached_results.values())[0]
-    return None
 
 
 class PrivacyRequestNotifications(Base):
@@ -827,6 +861,13 @@ class ProvidedIdentityType(EnumType):
     fides_user_device_id = "fides_user_device_id"
 
 
+# Purpose the key of the provided identity blind index is derived for
+BLIND_INDEX_KEY_PURPOSE = "provided_identity_blind_index"
+BLIND_INDEX_BACKFILL_CHECK_SECONDS = 60
+_blind_index_backfill_complete = False
+_blind_index_backfill_checked_at = float("-inf")
+
+
 class ProvidedIdentity(Base):  # pylint: disable=R0904
     """
     A table for storing identity fields and values provided at privacy request
@@ -852,6 +893,12 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         index=True,
         unique=False,
         nullable=True,
+    )  # bcrypt hash of the value, kept for identities persisted before the blind index
+    blind_index = Column(
+        String,
+        index=True,
+        unique=False,
+        nullable=True,
     )  # This field is used as a blind index for exact match searches
     encrypted_value = Column(
         MutableDict.as_mutable(
@@ -887,6 +934,70 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         )
         return hashed_value
 
+    @classmethod
+    def blind_index_value(
+        cls,
+        value: str,
+        encoding: str = "UTF-8",
+    ) -> str:
+        """Keyed hash of an identity value, stored as its blind index.
+
+        The key is derived from the app encryption key rather than being the encryption
+        key itself.
+        """
+        return hmac_with_key(
+            value.encode(encoding),
+            derive_key(
+                CONFIG.security.app_encryption_key.encode(encoding),
+                BLIND_INDEX_KEY_PURPOSE,
+            ),
+        )
+
+    @classmethod
+    def value_matches(cls, db: Session, value: str) -> ColumnElement:
+        """
+        A condition matching the provided identities with the given value.
+
+        Until every identity persisted before the blind index was introduced has been
+        backfilled, identities without a blind index are matched on their bcrypt hash.
+        """
+        condition = cls.blind_index == cls.blind_index_value(value)
+        if not cls.blind_index_backfill_complete(db):
+            condition = or_(
+                condition,
+                and_(
+                    cls.blind_index.is_(None),
+                    cls.hashed_value == cls.hash_value(value),
+                ),
+            )
+        return condition
+
+    @classmethod
+    def blind_index_backfill_complete(cls, db: Session) -> bool:
+        """
+        Whether every provided identity with a value has a blind index. The result is kept
+        once the backfill is complete, since new identities always get a blind index;
+        until then the database is checked at most every BLIND_INDEX_BACKFILL_CHECK_SECONDS.
+        """
+        global _blind_index_backfill_complete, _blind_index_backfill_checked_at  # pylint: disable=W0603
+        if _blind_index_backfill_complete:
+            return True
+
+        now = time.monotonic()
+        if now - _blind_index_backfill_checked_at >= BLIND_INDEX_BACKFILL_CHECK_SECONDS:
+            _blind_index_backfill_checked_at = now
+            _blind_index_backfill_complete = (
+                db.query(cls.id)
+                .filter(
+                    cls.blind_index.is_(None),
+                    cls.hashed_value.isnot(None),
+                    cls.encrypted_value.isnot(None),
+                )
+                .first()
+                is None
+            )
+        return _blind_index_backfill_complete
+
     def as_identity_schema(self) -> IdentityBase:
         """Creates an Identity schema from a ProvidedIdentity record in the application DB."""
         identity = IdentityBase()
@@ -906,6 +1017,16 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         return identity
 
 
+@event.listens_for(ProvidedIdentity, "before_insert")
+@event.listens_for(ProvidedIdentity, "before_update")
+def set_blind_index(_: Any, __: Any, target: ProvidedIdentity) -> None:
+    """Keep the blind index of a provided identity in sync with its value"""
+    value = (target.encrypted_value or {}).get("value")
+    target.blind_index = (
+        ProvidedIdentity.blind_index_value(str(value)) if value else None
+    )
+
+
 class Consent(Base):
     """The DB ORM model for Consent."""
 
@@ -963,10 +1084,12 @@ class ConsentRequest(IdentityVerificationMixin, Base):
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
         """Retrieves any identity data pertaining to this request from the cache."""
-        prefix = f"id-{self.id}-identity-*"
+        prefix = f"id-{self.id}-identity-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
-        return {key.split("-")[-1]: cache.get(key) for key in keys}
+        keys = cache.get_keys_by_prefix(prefix)
+        return {
+            key.split("-")[-1]: value for key, value in cache.get_values(keys).items()
+        }
 
     def verify_identity(
         self,
@@ -991,6 +1114,7 @@ def cache_action_required(
     step: Optional[CurrentStep] = None,
     collection: Optional[CollectionAddress] = None,
     action_needed: Optional[List[ManualAction]] = None,
+    index: Optional[str] = None,
 ) -> None:
     """Generic method to cache information about additional action required for a collection.
 
@@ -1009,6 +1133,7 @@ def cache_action_required(
     cache.set_encoded_object(
         cache_key,
         action_required.dict() if action_required else None,
+        index=index,
     )
 
 
@@ -30,6 +30,11 @@ from fides.api.models.policy import PolicyPreWebhook
 from fides.api.oauth.roles import get_scopes_from_roles
 from fides.api.schemas.external_https import WebhookJWE
 from fides.api.schemas.oauth import OAuth2ClientCredentialsBearer
+from fides.api.util.oauth_cache import (
+    cache_token_data,
+    get_cached_token_data,
+    load_client,
+)
 from fides.core.config import CONFIG
 
 JWT_ENCRYPTION_ALGORITHM = ALGORITHMS.A256GCM
@@ -195,13 +200,16 @@ def extract_token_and_load_client(
         logger.debug("No authorization supplied.")
         raise AuthenticationError(detail="Authentication Failure")
 
-    try:
-        token_data = json.loads(
-            extract_payload(authorization, CONFIG.security.app_encryption_key)
-        )
-    except exceptions.JWEParseError as exc:
-        logger.debug("Unable to parse auth token.")
-        raise AuthorizationError(detail="Not Authorized for this action") from exc
+    token_data = get_cached_token_data(authorization)
+    if token_data is None:
+        try:
+            token_data = json.loads(
+                extract_payload(authorization, CONFIG.security.app_encryption_key)
+            )
+        except exceptions.JWEParseError as exc:
+            logger.debug("Unable to parse auth token.")
+            raise AuthorizationError(detail="Not Authorized for this action") from exc
+        cache_token_data(authorization, token_data)
 
     issued_at = token_data.get(JWE_ISSUED_AT, None)
     if not issued_at:
@@ -219,14 +227,17 @@ def extract_token_and_load_client(
         logger.debug("No client_id included in auth token.")
         raise AuthorizationError(detail="Not Authorized for this action")
 
-    # scopes/roles param is only used if client is root client, otherwise we use the client's associated scopes
-    client = ClientDetail.get(
-        db,
-        object_id=client_id,
-        config=CONFIG,
-        scopes=CONFIG.security.root_user_scopes,
-        roles=CONFIG.security.root_user_roles,
-    )
+    if client_id == CONFIG.security.oauth_root_client_id:
+        # scopes/roles param is only used if client is root client, otherwise we use the client's associated scopes
+        client = ClientDetail.get(
+            db,
+            object_id=client_id,
+            config=CONFIG,
+            scopes=CONFIG.security.root_user_scopes,
+            roles=CONFIG.security.root_user_roles,
+        )
+    else:
+        client = load_client(db, client_id)
 
     if not client:
         logger.debug("Auth token belongs to an invalid client_id.")
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+from threading import Lock
 from typing import Any, Dict, Generic, List, Optional, TypeVar
 
+from loguru import logger
 from sqlalchemy.orm import Session
 
-from fides.api.common_exceptions import NotSupportedForCollection
+from fides.api.common_exceptions import NotSupportedForCollection, RowLimitExceeded
 from fides.api.graph.traversal import TraversalNode
 from fides.api.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
 from fides.api.models.policy import Policy
@@ -37,6 +39,8 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
         # parameters inside queries for debugging purposes.
         self.hide_parameters = not CONFIG.dev_mode
         self.db_client: Optional[DB_CONNECTOR_TYPE] = None
+        # Nodes of the same privacy request may share this connector across threads
+        self._client_lock = Lock()
 
     @abstractmethod
     def query_config(self, node: TraversalNode) -> QueryConfig[Any]:
@@ -57,7 +61,9 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     def client(self) -> DB_CONNECTOR_TYPE:
         """Return connector appropriate to this resource"""
         if not self.db_client:
-            self.db_client = self.create_client()
+            with self._client_lock:
+                if not self.db_client:
+                    self.db_client = self.create_client()
         return self.db_client
 
     @abstractmethod
@@ -113,3 +119,22 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     @abstractmethod
     def close(self) -> None:
         """Close any held resources"""
+
+
+def check_row_limit(rows: List[Row], row_limit: int, node: TraversalNode) -> None:
+    """Fail the collection if more than `execution.retrieval_row_limit` rows were
+    retrieved from it.
+
+    Connectors read one row past the limit to tell a collection that has exactly as
+    many rows as the limit from one whose further rows would go unprocessed.
+    """
+    if row_limit and len(rows) > row_limit:
+        logger.error(
+            "Collection {} has more than the maximum of {} rows",
+            node.address,
+            row_limit,
+        )
+        raise RowLimitExceeded(
+            f"Collection {node.address} has more than the maximum of {row_limit} rows "
+            f"allowed by execution.retrieval_row_limit."
+        )
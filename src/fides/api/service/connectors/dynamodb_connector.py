@@ -1,4 +1,6 @@
 import itertools
+import json
+from time import sleep
 from typing import Any, Dict, Generator, List, Optional
 
 from boto3.dynamodb.types import TypeDeserializer
@@ -16,13 +18,19 @@ from fides.api.schemas.connection_configuration.connection_secrets_dynamodb impo
 )
 from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.service.connectors.query_config import DynamoDBQueryConfig, QueryConfig
-from fides.api.util.collection_util import Row
+from fides.api.util.collection_util import Row, chunks
 from fides.api.util.logger import Pii
 from fides.connectors.models import (
     AWSConfig,
     ConnectorAuthFailureException,
     ConnectorFailureException,
 )
+from fides.core.config import CONFIG
+
+# DynamoDB accepts at most 25 put requests in a single batch_write_item call
+DYNAMODB_MAX_BATCH_WRITE_ITEMS = 25
+DYNAMODB_UNPROCESSED_ITEMS_RETRY_COUNT = 5
+DYNAMODB_UNPROCESSED_ITEMS_RETRY_DELAY = 0.1
 
 
 class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
@@ -54,6 +62,9 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         client = self.client()
         try:
             describe_table = client.describe_table(TableName=node.address.collection)
+            key_attribute_names = [
+                key["AttributeName"] for key in describe_table["Table"]["KeySchema"]
+            ]
             for key in describe_table["Table"]["KeySchema"]:
                 if key["KeyType"] == "HASH":
                     hash_key = key["AttributeName"]
@@ -65,7 +76,7 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         except ClientError as error:
             raise ConnectorFailureException(error.response["Error"]["Message"])
 
-        return DynamoDBQueryConfig(node, attribute_definitions)
+        return DynamoDBQueryConfig(node, attribute_definitions, key_attribute_names)
 
     def test_connection(self) -> Optional[ConnectionTestStatus]:
         """
@@ -138,16 +149,32 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         rows: List[Row],
         input_data: Dict[str, List[Any]],
     ) -> int:
-        """Execute a masking requestfor DynamoDB"""
+        """Execute a masking requestfor DynamoDB
+
+        If `execution.masking_batch_size` is greater than 1, the masked items are written
+        with batch_write_item instead of one put_item per item.
+        """
 
         query_config = self.query_config(node)
         collection_name = node.address.collection
+        batch_size: int = CONFIG.execution.masking_batch_size
         update_ct = 0
+        batch_items: Dict[str, Dict[str, Any]] = {}
         for row in rows:
+            # Taken before masking, since generating the update modifies the row
+            item_key = json.dumps(
+                [row.get(name) for name in query_config.key_attribute_names],  # type: ignore[attr-defined]
+                default=str,
+            )
             update_items = query_config.generate_update_stmt(
                 row, policy, privacy_request
             )
             if update_items is not None:
+                if batch_size > 1:
+                    # A batch can't contain the same item twice, and items are
+                    # identified by the table's key attributes
+                    batch_items[item_key] = update_items
+                    continue
                 client = self.client()
                 update_result = client.put_item(
                     TableName=collection_name,
@@ -161,8 +188,48 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
                     Pii(update_items),
                 )
 
+        for batch in chunks(
+            list(batch_items.values()),
+            min(batch_size, DYNAMODB_MAX_BATCH_WRITE_ITEMS),
+        ):
+            update_ct += self.batch_write_items(collection_name, batch)
+
         return update_ct
 
+    def batch_write_items(self, collection_name: str, items: List[Row]) -> int:
+        """Put the given items with a single batch_write_item call, retrying any items
+        DynamoDB reports as unprocessed with an exponential backoff. Returns the number
+        of items written."""
+        client = self.client()
+        request_items: List[Dict[str, Any]] = [
+            {"PutRequest": {"Item": item}} for item in items
+        ]
+        delay = DYNAMODB_UNPROCESSED_ITEMS_RETRY_DELAY
+        try:
+            for attempt in range(DYNAMODB_UNPROCESSED_ITEMS_RETRY_COUNT + 1):
+                if attempt:
+                    sleep(delay)
+                    delay *= 2
+                response = client.batch_write_item(
+                    RequestItems={collection_name: request_items}
+                )
+                logger.info(
+                    "client.batch_write_item({}, {} items)",
+                    collection_name,
+                    len(request_items),
+                )
+                request_items = response.get("UnprocessedItems", {}).get(
+                    collection_name, []
+                )
+                if not request_items:
+                    return len(items)
+        except ClientError as error:
+            raise ConnectorFailureException(error.response["Error"]["Message"])
+
+        raise ConnectorFailureException(
+            f"DynamoDB did not process {len(request_items)} items of a batch write to {collection_name}"
+        )
+
 
 def product_dict(**kwargs: List) -> Generator:
     """
@@ -1,11 +1,15 @@
 import time
 from enum import Enum
-from typing import List
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
 
 from loguru import logger
+from redis.client import Script  # type: ignore
 
 from fides.api.common_exceptions import RedisConnectionError
 from fides.api.util.cache import FidesopsRedis, get_cache
+from fides.core.config import CONFIG
 
 
 class RateLimiterPeriod(Enum):
@@ -47,83 +51,165 @@ class RateLimiterTimeoutException(Exception):
     """
 
 
+# Atomically checks a sliding window log for each of the given keys, and reserves up to
+# the requested number of calls in all of them if every window has room. The time is read
+# from Redis so that all workers agree on it.
+#
+# KEYS: one sorted set per rate limit
+# ARGV: unique token, number of calls requested, then the limit and period in
+#       milliseconds of each key
+# Returns the number of calls reserved and, if none were, the milliseconds to wait before
+# a call can be reserved.
+SLIDING_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local granted = tonumber(ARGV[2])
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[1 + i * 2])
+    local period = tonumber(ARGV[2 + i * 2])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - period)
+    local count = redis.call('ZCARD', key)
+    local available = limit - count
+    if available < granted then
+        granted = math.max(available, 0)
+    end
+    if available < 1 then
+        -- the call whose expiry from the window frees up the first slot
+        local oldest = redis.call('ZRANGE', key, count - limit, count - limit, 'WITHSCORES')
+        wait = math.max(wait, tonumber(oldest[2]) + period - now)
+    end
+end
+if granted < 1 then
+    return {0, wait}
+end
+for i, key in ipairs(KEYS) do
+    for call = 1, granted do
+        redis.call('ZADD', key, now, ARGV[1] .. ':' .. call)
+    end
+    redis.call('PEXPIRE', key, tonumber(ARGV[2 + i * 2]))
+end
+return {granted, 0}
+"""
+
+_lock = Lock()
+_script: Optional[Script] = None
+# Calls reserved in Redis ahead of time by this process, keyed by the rate limits they
+# were reserved against, with the time after which they may no longer be used
+_leases: Dict[Tuple[Tuple[str, int], ...], Tuple[int, float]] = {}
+# Number of times and total seconds each rate limit key held up a call in this process
+_throttle_metrics: Dict[str, Dict[str, float]] = {}
+
+
+def get_sliding_window_script(redis: FidesopsRedis) -> Script:
+    """The sliding window script, registered once with the given Redis client"""
+    global _script  # pylint: disable=W0603
+    with _lock:
+        if _script is None or _script.registered_client is not redis:
+            _script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+        return _script
+
+
+def get_throttle_metrics() -> Dict[str, Dict[str, float]]:
+    """Report how often, and for how many seconds in total, calls in this process
+    were held up by each rate limit key"""
+    with _lock:
+        return {key: dict(metrics) for key, metrics in _throttle_metrics.items()}
+
+
 class RateLimiter:
     """
     A rate limiter which interacts with Redis to provide a shared state between fidesops instances
+
+    Each rate limit is a sliding window: no more than `rate_limit` calls are let through
+    in any `period`. If `execution.rate_limit_lease_size` is greater than 1, calls are
+    reserved in Redis that many at a time and handed out locally, which saves a round
+    trip to Redis for most calls. Reserved calls that are not used within
+    LEASE_TTL_SECONDS are discarded, and while they are used the window may let slightly
+    more than `rate_limit` calls through.
     """
 
-    EXPIRE_AFTER_PERIOD_SECONDS: int = 500
+    LEASE_TTL_SECONDS: float = 1.0
 
-    def build_redis_key(self, current_seconds: int, request: RateLimiterRequest) -> str:
+    def build_redis_key(self, request: RateLimiterRequest) -> str:
         """
         Builds the key to be used for the given request for rate limiting
         """
-        fixed_time_filter = (
-            int(current_seconds / request.period.factor) * request.period.factor
-        )
-        redis_key = f"{request.key}:{request.period.label}:{fixed_time_filter}"
-        return redis_key
+        return f"{request.key}:{request.period.label}:window"
 
-    def increment_usage(
+    def reserve_calls(
         self,
         redis: FidesopsRedis,
-        current_seconds: int,
         requests: List[RateLimiterRequest],
-    ) -> List[int]:
+        count: int,
+    ) -> Tuple[int, float]:
         """
-        Increments the call count for the given requests for rate limitting.
+        Reserves up to `count` calls within all of the given rate limits at once.
 
-        Also sets an expire time on the redis key.
+        Returns the number of calls reserved, and if none could be reserved, the number
+        of seconds until one can be.
         """
-        pipe = redis.pipeline()
+        args: List[Any] = [uuid4().hex, count]
         for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.incrby(redis_key, 1)
-            pipe.expire(
-                redis_key, request.period.factor + self.EXPIRE_AFTER_PERIOD_SECONDS
-            )
-        response = pipe.execute()
+            args.extend([request.rate_limit, request.period.factor * 1000])
+        granted, wait_ms = get_sliding_window_script(redis)(
+            keys=[self.build_redis_key(request) for request in requests], args=args
+        )
+        return int(granted), int(wait_ms) / 1000
 
-        found_bucket_usages = []
-        for index, request in enumerate(requests):
-            # alternates between incr and expire responses
-            found_bucket_usages.append(response[index * 2])
+    def take_leased_call(self, requests: List[RateLimiterRequest]) -> bool:
+        """Use one of the calls this process already reserved for the given rate limits"""
+        lease_key = tuple((self.build_redis_key(r), r.rate_limit) for r in requests)
+        with _lock:
+            remaining, expires_at = _leases.get(lease_key, (0, 0.0))
+            if remaining < 1 or time.time() >= expires_at:
+                _leases.pop(lease_key, None)
+                return False
+            _leases[lease_key] = (remaining - 1, expires_at)
+            return True
 
-        return found_bucket_usages
+    def lease_calls(self, requests: List[RateLimiterRequest], count: int) -> None:
+        """Keep calls reserved ahead of time for later use by this process"""
+        lease_key = tuple((self.build_redis_key(r), r.rate_limit) for r in requests)
+        with _lock:
+            _leases[lease_key] = (count, time.time() + self.LEASE_TTL_SECONDS)
 
-    def decrement_usage(
-        self,
-        redis: FidesopsRedis,
-        current_seconds: int,
-        requests: List[RateLimiterRequest],
-    ) -> None:
-        """
-        Decrements the call count for the given requests for rate limitting.
-        """
-        pipe = redis.pipeline()
-        for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.decrby(redis_key, 1)
-        pipe.execute()
+    @staticmethod
+    def record_throttle(requests: List[RateLimiterRequest], seconds: float) -> None:
+        """Add the time a call was held up to the throttle metrics of its rate limits,
+        and log them"""
+        with _lock:
+            for request in requests:
+                metrics = _throttle_metrics.setdefault(
+                    request.key, {"throttled_calls": 0, "throttled_seconds": 0.0}
+                )
+                metrics["throttled_calls"] += 1
+                metrics["throttled_seconds"] += seconds
+                logger.info(
+                    "Rate limit {} held up a call for {:.3f} seconds, {} calls for {:.3f} seconds in total",
+                    request.key,
+                    seconds,
+                    int(metrics["throttled_calls"]),
+                    metrics["throttled_seconds"],
+                )
 
     def limit(
         self, requests: List[RateLimiterRequest], timeout_seconds: int = 30
     ) -> None:
         """
-        Increments call count for the current time bucket and verifies that it is within the
-        rate limit provided. If limit is breached it will decrement the count and try again
-        until it can successfully reserve a call, or timeout. Because we rely on optimistic
-        locking for many keys at a time, it is possible that concurrent rate limiters could
-        make the wrong decision in between increment to decrement operations.
+        Reserves a call within every one of the given rate limits, waiting until the
+        earliest time a call is available if any of them is used up. The check and the
+        reservation happen atomically in Redis, so concurrent rate limiters cannot let
+        too many calls through. Raises a RateLimiterTimeoutException right away if no
+        call will be available within the timeout.
 
         If connection to the redis cluster fails then rate limiter will be skipped.
 
         Expiration is set on any keys which are stored in the cluster
         """
+        if not requests:
+            return
+
         try:
             redis: FidesopsRedis = get_cache()
         except RedisConnectionError as exc:
@@ -134,33 +220,37 @@ class RateLimiter:
             )
             return
 
-        start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
-            current_seconds = int(time.time())
+        lease_size = min(
+            [CONFIG.execution.rate_limit_lease_size]
+            + [request.rate_limit for request in requests]
+        )
+        if lease_size > 1 and self.take_leased_call(requests):
+            return
 
-            bucket_usages = self.increment_usage(
-                redis=redis, current_seconds=current_seconds, requests=requests
+        start_time = time.time()
+        while True:
+            granted, wait_seconds = self.reserve_calls(
+                redis, requests, max(lease_size, 1)
             )
+            if granted:
+                if granted > 1:
+                    self.lease_calls(requests, granted - 1)
+                throttled_seconds = time.time() - start_time
+                if throttled_seconds > 0.001:
+                    self.record_throttle(requests, throttled_seconds)
+                return
 
-            breached_requests = [
-                request
-                for index, request in enumerate(requests)
-                if bucket_usages[index] > request.rate_limit
-            ]
+            if time.time() - start_time + wait_seconds > timeout_seconds:
+                break
 
-            if breached_requests:
-                logger.debug(
-                    "Breached rate limits: {}. Decrementing usage and trying again.",
-                    ",".join(str(r) for r in breached_requests),
-                )
-                self.decrement_usage(
-                    redis=redis, current_seconds=current_seconds, requests=requests
-                )
-                time.sleep(0.1)
-            else:
-                # success
-                return
+            logger.debug(
+                "Breached rate limits: {}. Waiting {} seconds.",
+                ",".join(str(r) for r in requests),
+                wait_seconds,
+            )
+            # sleep at least a millisecond so a wait rounded down to 0 isn't a busy loop
+            time.sleep(max(wait_seconds, 0.001))
 
-        error_message = f"Timeout waiting for rate limiter. Last breached requests: {','.join(str(r) for r in breached_requests)}"
+        error_message = f"Timeout waiting for rate limiter. Last breached requests: {','.join(str(r) for r in requests)}"
         logger.error(error_message)
         raise RateLimiterTimeoutException(error_message)
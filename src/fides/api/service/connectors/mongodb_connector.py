@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
 
 from fides.api.common_exceptions import ConnectionException
@@ -12,10 +12,11 @@ from fides.api.models.privacy_request import PrivacyRequest
 from fides.api.schemas.connection_configuration.connection_secrets_mongodb import (
     MongoDBSchema,
 )
-from fides.api.service.connectors.base_connector import BaseConnector
+from fides.api.service.connectors.base_connector import BaseConnector, check_row_limit
 from fides.api.service.connectors.query_config import MongoQueryConfig, QueryConfig
-from fides.api.util.collection_util import Row
+from fides.api.util.collection_util import Row, chunks
 from fides.api.util.logger import Pii
+from fides.core.config import CONFIG
 
 
 class MongoDBConnector(BaseConnector[MongoClient]):
@@ -86,7 +87,12 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         privacy_request: PrivacyRequest,
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
-        """Retrieve mongo data"""
+        """Retrieve mongo data
+
+        Documents are fetched in batches of `execution.retrieval_batch_size` if set.  If
+        `execution.retrieval_row_limit` is set, retrieval fails on a collection with more
+        documents than the limit rather than returning only some of them.
+        """
         query_config = self.query_config(node)
         client = self.client()
 
@@ -100,11 +106,18 @@ class MongoDBConnector(BaseConnector[MongoClient]):
 
         db = client[db_name]
         collection = db[collection_name]
+        row_limit: int = CONFIG.execution.retrieval_row_limit
         rows = []
         logger.info("Starting data retrieval for {}", node.address)
-        for row in collection.find(query_data, fields):
+        for row in collection.find(
+            query_data,
+            fields,
+            batch_size=CONFIG.execution.retrieval_batch_size,
+            limit=row_limit + 1 if row_limit else 0,
+        ):
             rows.append(row)
         logger.info("Found {} rows on {}", len(rows), node.address)
+        check_row_limit(rows, row_limit, node)
         return rows
 
     def mask_data(
@@ -115,19 +128,27 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         rows: List[Row],
         input_data: Dict[str, List[Any]],
     ) -> int:
-        """Execute a masking request"""
+        """Execute a masking request
+
+        If `execution.masking_batch_size` is greater than 1, the updates are sent
+        as unordered bulk writes of at most that many updates each.
+        """
         query_config = self.query_config(node)
         collection_name = node.address.collection
         client = self.client()
+        collection = client[node.address.dataset][collection_name]
+        batch_size: int = CONFIG.execution.masking_batch_size
         update_ct = 0
+        bulk_updates: List[UpdateOne] = []
         for row in rows:
             update_stmt = query_config.generate_update_stmt(
                 row, policy, privacy_request
             )
             if update_stmt is not None:
                 query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
+                if batch_size > 1:
+                    bulk_updates.append(UpdateOne(query, update, upsert=False))
+                    continue
                 update_result = collection.update_one(query, update, upsert=False)
                 update_ct += update_result.modified_count
                 logger.info(
@@ -137,6 +158,15 @@ class MongoDBConnector(BaseConnector[MongoClient]):
                     Pii(update),
                 )
 
+        for batch in chunks(bulk_updates, batch_size):
+            bulk_result = collection.bulk_write(batch, ordered=False)
+            update_ct += bulk_result.modified_count
+            logger.info(
+                "db.{}.bulk_write({} updates, ordered=False)",
+                collection_name,
+                len(batch),
+            )
+
         return update_ct
 
     def close(self) -> None:
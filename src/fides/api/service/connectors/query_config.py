@@ -1,11 +1,12 @@
 import re
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 
 import pydash
 from boto3.dynamodb.types import TypeSerializer
 from loguru import logger
-from sqlalchemy import MetaData, Table, text
+from sqlalchemy import MetaData, Table, bindparam, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.sql import Executable, Update  # type: ignore
 from sqlalchemy.sql.elements import ColumnElement, TextClause
@@ -29,12 +30,26 @@ from fides.api.task.refine_target_path import (
     build_refined_target_paths,
     join_detailed_path,
 )
-from fides.api.util.collection_util import Row, append, filter_nonempty_values
+from fides.api.util.collection_util import Row, append, chunks, filter_nonempty_values
 from fides.api.util.logger import Pii
 from fides.api.util.querytoken import QueryToken
 
 T = TypeVar("T")
 
+BatchedUpdateStatement = Tuple[Executable, List[Dict[str, Any]]]
+"""A SQL update statement together with the parameter sets it is executed with.
+  More than one parameter set means the statement is executed once per set (executemany)."""
+
+
+@dataclass
+class FieldMaskingPlan:
+    """How the values of a field targeted by an erasure rule are masked"""
+
+    field_path: FieldPath
+    strategy: MaskingStrategy
+    masking_override: MaskingOverride
+    null_masking: bool
+
 
 class QueryConfig(Generic[T], ABC):
     """A wrapper around a resource-type dependent query object that can generate runnable queries
@@ -42,6 +57,7 @@ class QueryConfig(Generic[T], ABC):
 
     def __init__(self, node: TraversalNode):
         self.node = node
+        self._masking_plan: Optional[Tuple[Policy, List[FieldMaskingPlan]]] = None
 
     def field_map(self) -> Dict[FieldPath, Field]:
         """Flattened FieldPaths of interest from this traversal_node."""
@@ -123,23 +139,21 @@ class QueryConfig(Generic[T], ABC):
 
         return data
 
-    def update_value_map(  # pylint: disable=R0914
-        self, row: Row, policy: Policy, request: PrivacyRequest
-    ) -> Dict[str, Any]:
-        """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
-
-        Example return:  {'name': None, 'ccn': None, 'code': None, 'workplace_info.employer': None, 'children.0': None}
-
-        In this example, a Null Masking Strategy was used to determine that the name/ccn/code fields, nested
-        workplace_info.employer field, and the first element in 'children' for a given customer_id will be replaced
-        with null values.
+    def build_masking_plan(self, policy: Policy) -> List[FieldMaskingPlan]:
+        """Resolve how each field targeted by the policy's erasure rules is masked on this collection.
 
+        The plan is built once per policy and reused for every row masked by this query config.
+        Fields whose data type is not supported by their masking strategy are left out.
         """
+        if self._masking_plan and self._masking_plan[0] is policy:
+            return self._masking_plan[1]
+
         rule_to_collection_field_paths: Dict[
             Rule, List[FieldPath]
         ] = self.build_rule_target_field_paths(policy)
+        field_map: Dict[FieldPath, Field] = self.field_map()
 
-        value_map: Dict[str, Any] = {}
+        masking_plan: List[FieldMaskingPlan] = []
         for rule, field_paths in rule_to_collection_field_paths.items():
             strategy_config = rule.masking_strategy
             if not strategy_config:
@@ -147,14 +161,13 @@ class QueryConfig(Generic[T], ABC):
             strategy: MaskingStrategy = MaskingStrategy.get_strategy(
                 strategy_config["strategy"], strategy_config["configuration"]
             )
+            null_masking: bool = (
+                strategy_config.get("strategy") == NullMaskingStrategy.name
+            )
             for rule_field_path in field_paths:
-                masking_override: MaskingOverride = [
-                    MaskingOverride(field.data_type_converter, field.length)
-                    for field_path, field in self.field_map().items()
-                    if field_path == rule_field_path
-                ][0]
-                null_masking: bool = (
-                    strategy_config.get("strategy") == NullMaskingStrategy.name
+                field = field_map[rule_field_path]
+                masking_override = MaskingOverride(
+                    field.data_type_converter, field.length
                 )
                 if not self._supported_data_type(
                     masking_override, null_masking, strategy
@@ -166,23 +179,61 @@ class QueryConfig(Generic[T], ABC):
                         masking_override.data_type_converter.name,  # type: ignore
                     )
                     continue
-
-                paths_to_mask: List[str] = [
-                    join_detailed_path(path)
-                    for path in build_refined_target_paths(
-                        row, query_paths={rule_field_path: None}
-                    )
-                ]
-                for detailed_path in paths_to_mask:
-                    value_map[detailed_path] = self._generate_masked_value(
-                        request_id=request.id,
+                masking_plan.append(
+                    FieldMaskingPlan(
+                        field_path=rule_field_path,
                         strategy=strategy,
-                        val=pydash.objects.get(row, detailed_path),
                         masking_override=masking_override,
                         null_masking=null_masking,
-                        str_field_path=detailed_path,
                     )
-        return value_map
+                )
+
+        self._masking_plan = (policy, masking_plan)
+        return masking_plan
+
+    def update_value_map(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Dict[str, Any]:
+        """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
+
+        Example return:  {'name': None, 'ccn': None, 'code': None, 'workplace_info.employer': None, 'children.0': None}
+
+        In this example, a Null Masking Strategy was used to determine that the name/ccn/code fields, nested
+        workplace_info.employer field, and the first element in 'children' for a given customer_id will be replaced
+        with null values.
+
+        """
+        return self.update_value_maps([row], policy, request)[0]
+
+    def update_value_maps(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Dict[str, Any]]:
+        """Map the relevant fields to be updated on each of the rows with their masked values, in the
+        same order as the rows. See update_value_map.
+
+        The values of each targeted field are collected across all of the rows and masked with a single
+        call to the field's masking strategy.
+        """
+        value_maps: List[Dict[str, Any]] = [{} for _ in rows]
+        for field_plan in self.build_masking_plan(policy):
+            targets: List[Tuple[Dict[str, Any], str]] = []
+            values: List[Any] = []
+            for row, value_map in zip(rows, value_maps):
+                for path in build_refined_target_paths(
+                    row, query_paths={field_plan.field_path: None}
+                ):
+                    detailed_path = join_detailed_path(path)
+                    targets.append((value_map, detailed_path))
+                    values.append(pydash.objects.get(row, detailed_path))
+            if not values:
+                continue
+
+            masked_values = self._generate_masked_values(
+                request_id=request.id, field_plan=field_plan, values=values
+            )
+            for (value_map, detailed_path), masked_val in zip(targets, masked_values):
+                value_map[detailed_path] = masked_val
+        return value_maps
 
     @staticmethod
     def _supported_data_type(
@@ -200,37 +251,37 @@ class QueryConfig(Generic[T], ABC):
         return True
 
     @staticmethod
-    def _generate_masked_value(  # pylint: disable=R0913
+    def _generate_masked_values(
         request_id: str,
-        strategy: MaskingStrategy,
-        val: Any,
-        masking_override: MaskingOverride,
-        null_masking: bool,
-        str_field_path: str,
-    ) -> T:
-        # masking API takes and returns lists, but here we are only leveraging single elements
-        masked_val = strategy.mask([val], request_id)[0]  # type: ignore
+        field_plan: FieldMaskingPlan,
+        values: List[Any],
+    ) -> List[Any]:
+        masked_values: List[Any] = field_plan.strategy.mask(values, request_id)  # type: ignore
 
         logger.debug(
-            "Generated the following masked val for field {}: {}",
-            str_field_path,
-            masked_val,
+            "Generated the following masked vals for field {}: {}",
+            field_plan.field_path.string_path,
+            masked_values,
         )
 
         # special case for null masking
-        if null_masking:
-            return masked_val
+        if field_plan.null_masking:
+            return masked_values
 
+        masking_override = field_plan.masking_override
         if masking_override.length:
             logger.warning(
                 "Because a length has been specified for field {}, we will truncate length of masked value to match, regardless of masking strategy",
-                str_field_path,
+                field_plan.field_path.string_path,
             )
             #  for strategies other than null masking we assume that masked data type is the same as specified data type
-            masked_val = masking_override.data_type_converter.truncate(  # type: ignore
-                masking_override.length, masked_val
-            )
-        return masked_val
+            masked_values = [
+                masking_override.data_type_converter.truncate(  # type: ignore
+                    masking_override.length, masked_val
+                )
+                for masked_val in masked_values
+            ]
+        return masked_values
 
     @abstractmethod
     def generate_query(
@@ -416,21 +467,39 @@ class SQLQueryConfig(QueryConfig[Executable]):
         fields.sort()
         return [f"{k} = :{k}" for k in fields]
 
-    def generate_update_stmt(
+    def format_in_clause_for_update_stmt(self, field: str) -> str:
+        """Adds the appropriate formatting for an IN clause on an update statement in this datastore.
+        The operand is expected to be bound as an expanding parameter."""
+        return f"{field} IN :{field}"
+
+    def generate_update_values(
         self, row: Row, policy: Policy, request: PrivacyRequest
-    ) -> Optional[TextClause]:
-        """Returns an update statement in generic SQL dialect."""
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Returns the masked values to set on the row, and the values of the row's
+        non-empty primary keys to locate it by."""
         update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
-        update_clauses: list[str] = self.format_key_map_for_update_stmt(
-            list(update_value_map.keys())
-        )
-        non_empty_primary_keys: Dict[str, Field] = filter_nonempty_values(
+        return update_value_map, self.generate_primary_key_values(row)
+
+    def generate_primary_key_values(self, row: Row) -> Dict[str, Any]:
+        """Returns the values of the row's non-empty primary keys"""
+        return filter_nonempty_values(
             {
                 fpath.string_path: fld.cast(row[fpath.string_path])
                 for fpath, fld in self.primary_key_field_paths.items()
                 if fpath.string_path in row
             }
         )
+
+    def generate_update_stmt(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Optional[TextClause]:
+        """Returns an update statement in generic SQL dialect."""
+        update_value_map, non_empty_primary_keys = self.generate_update_values(
+            row, policy, request
+        )
+        update_clauses: list[str] = self.format_key_map_for_update_stmt(
+            list(update_value_map.keys())
+        )
         pk_clauses: list[str] = self.format_key_map_for_update_stmt(
             list(non_empty_primary_keys.keys())
         )
@@ -453,6 +522,119 @@ class SQLQueryConfig(QueryConfig[Executable]):
         logger.info("query = {}, params = {}", Pii(query_str), Pii(update_value_map))
         return text(query_str).params(update_value_map)
 
+    def group_rows_for_update(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> Tuple[
+        List[Tuple[Dict[str, Any], str, List[Any]]],
+        List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    ]:
+        """Groups the rows to be masked by how they can be updated together.
+
+        Returns
+         - the rows that receive identical masked values and are located by a single primary key,
+           as (masked values, primary key name, primary key values) for each set of masked values.
+         - every other row, as its (masked values, primary key values).
+
+        Rows without enough data to generate a valid update are skipped.
+        """
+        same_value_groups: Dict[
+            Tuple[str, Tuple[Tuple[str, Any], ...]],
+            Tuple[Dict[str, Any], str, List[Any]],
+        ] = {}
+        individual_rows: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
+        update_value_maps = self.update_value_maps(rows, policy, request)
+        for row, update_value_map in zip(rows, update_value_maps):
+            non_empty_primary_keys = self.generate_primary_key_values(row)
+            if not update_value_map or not non_empty_primary_keys:
+                logger.warning(
+                    "There is not enough data to generate a valid update statement for {}",
+                    self.node.address,
+                )
+                continue
+
+            pk_name: str = next(iter(non_empty_primary_keys))
+            try:
+                group_key = (pk_name, tuple(sorted(update_value_map.items())))
+                hash(group_key)
+            except TypeError:
+                # Masked values that can't be compared, such as nested objects
+                group_key = None
+
+            if (
+                group_key is None
+                or len(non_empty_primary_keys) > 1
+                or pk_name in update_value_map
+            ):
+                individual_rows.append((update_value_map, non_empty_primary_keys))
+                continue
+
+            _, _, pk_values = same_value_groups.setdefault(
+                group_key, (update_value_map, pk_name, [])
+            )
+            pk_values.append(non_empty_primary_keys[pk_name])
+
+        grouped_rows: List[Tuple[Dict[str, Any], str, List[Any]]] = []
+        for update_value_map, pk_name, pk_values in same_value_groups.values():
+            if len(pk_values) > 1:
+                grouped_rows.append((update_value_map, pk_name, pk_values))
+            else:
+                individual_rows.append((update_value_map, {pk_name: pk_values[0]}))
+        return grouped_rows, individual_rows
+
+    def generate_batched_update_stmts(
+        self,
+        rows: List[Row],
+        policy: Policy,
+        request: PrivacyRequest,
+        batch_size: int,
+    ) -> List[BatchedUpdateStatement]:
+        """Returns the update statements that mask the given rows, each masking at most `batch_size` rows.
+
+        Rows that receive identical masked values are masked by an UPDATE ... WHERE pk IN (...)
+        statement. The remaining rows are grouped by the fields they update into a statement
+        that is executed once per row.
+        """
+        grouped_rows, individual_rows = self.group_rows_for_update(
+            rows, policy, request
+        )
+        statements: List[BatchedUpdateStatement] = []
+
+        for update_value_map, pk_name, pk_values in grouped_rows:
+            query_str = self.get_formatted_update_stmt(
+                self.format_key_map_for_update_stmt(list(update_value_map.keys())),
+                [self.format_in_clause_for_update_stmt(pk_name)],
+            )
+            stmt = text(query_str).bindparams(bindparam(pk_name, expanding=True))
+            for pk_batch in chunks(pk_values, batch_size):
+                params = {**update_value_map, pk_name: pk_batch}
+                logger.info("query = {}, params = {}", Pii(query_str), Pii(params))
+                statements.append((stmt, [params]))
+
+        by_updated_fields: Dict[
+            Tuple[Tuple[str, ...], Tuple[str, ...]], List[Dict[str, Any]]
+        ] = {}
+        for update_value_map, non_empty_primary_keys in individual_rows:
+            by_updated_fields.setdefault(
+                (
+                    tuple(sorted(update_value_map)),
+                    tuple(sorted(non_empty_primary_keys)),
+                ),
+                [],
+            ).append({**update_value_map, **non_empty_primary_keys})
+
+        for (update_fields, pk_fields), param_sets in by_updated_fields.items():
+            query_str = self.get_formatted_update_stmt(
+                self.format_key_map_for_update_stmt(list(update_fields)),
+                self.format_key_map_for_update_stmt(list(pk_fields)),
+            )
+            for params_batch in chunks(param_sets, batch_size):
+                logger.info(
+                    "query = {}, params = {}", Pii(query_str), Pii(params_batch)
+                )
+                statements.append((text(query_str), params_batch))
+        return statements
+
     def query_to_str(self, t: TextClause, input_data: Dict[str, List[Any]]) -> str:
         """string representation of a query for logging/dry-run"""
 
@@ -599,6 +781,10 @@ class SnowflakeQueryConfig(SQLQueryConfig):
         fields.sort()
         return [f'"{k}" = :{k}' for k in fields]
 
+    def format_in_clause_for_update_stmt(self, field: str) -> str:
+        """Adds the appropriate formatting for an IN clause on an update statement in this datastore."""
+        return f'"{field}" IN :{field}'
+
     def get_formatted_update_stmt(
         self,
         update_clauses: List[str],
@@ -667,6 +853,43 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
         ]
         return table.update().where(*pk_clauses).values(**update_value_map)
 
+    def generate_batched_updates(
+        self,
+        rows: List[Row],
+        policy: Policy,
+        request: PrivacyRequest,
+        client: Engine,
+        batch_size: int,
+    ) -> List[Update]:
+        """
+        Returns the Update objects that mask the given rows. Rows that receive identical masked
+        values are masked by a single update with a WHERE pk IN (...) clause of at most `batch_size`
+        values. Every other row gets its own update.
+        """
+        grouped_rows, individual_rows = self.group_rows_for_update(
+            rows, policy, request
+        )
+        if not grouped_rows and not individual_rows:
+            return []
+
+        table = Table(
+            self.node.address.collection, MetaData(bind=client), autoload=True
+        )
+        updates: List[Update] = []
+        for update_value_map, pk_name, pk_values in grouped_rows:
+            for pk_batch in chunks(pk_values, batch_size):
+                updates.append(
+                    table.update()
+                    .where(getattr(table.c, pk_name).in_(pk_batch))
+                    .values(**update_value_map)
+                )
+        for update_value_map, non_empty_primary_keys in individual_rows:
+            pk_clauses: List[ColumnElement] = [
+                getattr(table.c, k) == v for k, v in non_empty_primary_keys.items()
+            ]
+            updates.append(table.update().where(*pk_clauses).values(**update_value_map))
+        return updates
+
 
 MongoStatement = Tuple[Dict[str, Any], Dict[str, Any]]
 """A mongo query is expressed in the form of 2 dicts, the first of which represents
@@ -782,10 +1005,17 @@ DynamoDBStatement = Dict[str, Any]
 
 class DynamoDBQueryConfig(QueryConfig[DynamoDBStatement]):
     def __init__(
-        self, node: TraversalNode, attribute_definitions: List[Dict[str, Any]]
+        self,
+        node: TraversalNode,
+        attribute_definitions: List[Dict[str, Any]],
+        key_attribute_names: Optional[List[str]] = None,
     ):
         super().__init__(node)
         self.attribute_definitions = attribute_definitions
+        self.key_attribute_names = key_attribute_names or [
+            attribute_definition["AttributeName"]
+            for attribute_definition in attribute_definitions
+        ]
 
     def generate_query(
         self,
@@ -27,12 +27,17 @@ if TYPE_CHECKING:
     from fides.api.schemas.limiter.rate_limit_config import RateLimitConfig
     from fides.api.schemas.saas.saas_config import ClientConfig
     from fides.api.schemas.saas.shared_schemas import SaaSRequestParams
+    from fides.api.service.authentication.authentication_strategy import (
+        AuthenticationStrategy,
+    )
 
 
 class AuthenticatedClient:
     """
     A helper class to build authenticated HTTP requests based on
     authentication and parameter configurations.
+
+    Clients given the same session share its pool of keep-alive connections.
     """
 
     def __init__(
@@ -41,12 +46,14 @@ class AuthenticatedClient:
         configuration: ConnectionConfig,
         client_config: ClientConfig,
         rate_limit_config: Optional[RateLimitConfig] = None,
+        session: Optional[Session] = None,
     ):
-        self.session = Session()
+        self.session = session or Session()
         self.uri = uri
         self.configuration = configuration
         self.client_config = client_config
         self.rate_limit_config = rate_limit_config
+        self._auth_strategy: Optional[AuthenticationStrategy] = None
 
     def get_authenticated_request(
         self, request_params: SaaSRequestParams
@@ -56,10 +63,6 @@ class AuthenticatedClient:
         incoming path, headers, query, and body params.
         """
 
-        from fides.api.service.authentication.authentication_strategy import (  # pylint: disable=R0401
-            AuthenticationStrategy,
-        )
-
         req: PreparedRequest = Request(
             method=request_params.method,
             url=f"{self.uri}{request_params.path}",
@@ -70,15 +73,25 @@ class AuthenticatedClient:
 
         # add authentication if provided
         if self.client_config.authentication:
-            auth_strategy = AuthenticationStrategy.get_strategy(
-                self.client_config.authentication.strategy,
-                self.client_config.authentication.configuration,
-            )
-            return auth_strategy.add_authentication(req, self.configuration)
+            return self.get_auth_strategy().add_authentication(req, self.configuration)
 
         # otherwise just return the prepared request
         return req
 
+    def get_auth_strategy(self) -> AuthenticationStrategy:
+        """The authentication strategy of the client config, resolved once per client"""
+        from fides.api.service.authentication.authentication_strategy import (  # pylint: disable=R0401
+            AuthenticationStrategy,
+        )
+
+        if not self._auth_strategy:
+            assert self.client_config.authentication is not None
+            self._auth_strategy = AuthenticationStrategy.get_strategy(
+                self.client_config.authentication.strategy,
+                self.client_config.authentication.configuration,
+            )
+        return self._auth_strategy
+
     def retry_send(  # type: ignore
         retry_count: int,
         backoff_factor: float,
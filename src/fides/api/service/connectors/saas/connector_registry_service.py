@@ -1,8 +1,13 @@
 # pylint: disable=protected-access
+import json
 import os
 from abc import ABC, abstractmethod
 from ast import AST, AnnAssign
+from collections import defaultdict
+from contextlib import suppress
+from hashlib import sha256
 from operator import getitem
+from tempfile import mkstemp
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 from zipfile import ZipFile
 
@@ -15,6 +20,7 @@ from RestrictedPython import compile_restricted
 from RestrictedPython.transformer import RestrictingNodeTransformer
 from sqlalchemy.orm import Session
 
+import fides
 from fides.api.api.deps import get_api_session
 from fides.api.common_exceptions import FidesopsException, ValidationError
 from fides.api.cryptography.cryptographic_util import str_to_b64_str
@@ -32,7 +38,6 @@ from fides.api.schemas.saas.connector_template import ConnectorTemplate
 from fides.api.schemas.saas.saas_config import SaaSConfig
 from fides.api.util.saas_util import (
     encode_file_contents,
-    load_config,
     load_config_from_string,
     load_dataset_from_string,
     load_yaml_as_string,
@@ -42,6 +47,16 @@ from fides.api.util.saas_util import (
 )
 from fides.core.config import CONFIG
 
+# Records the content hash of every SaaS connector template in the data/saas directory
+# that passed validation, so templates that haven't changed since the last time the
+# server started aren't validated again. It is kept in the user's cache directory,
+# which other users can't write to, rather than in the shared temp directory.
+TEMPLATE_MANIFEST_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "fides",
+    "saas_template_manifest.json",
+)
+
 
 class ConnectorTemplateLoader(ABC):
     _instance: Optional["ConnectorTemplateLoader"] = None
@@ -70,36 +85,118 @@ class FileConnectorTemplateLoader(ConnectorTemplateLoader):
 
     def _load_connector_templates(self) -> None:
         logger.info("Loading connectors templates from the data/saas directory")
+        manifest = FileConnectorTemplateLoader._read_manifest()
+        updated_manifest: Dict[str, Dict[str, str]] = {}
         for file in os.listdir("data/saas/config"):
             if file.endswith(".yml"):
                 config_file = os.path.join("data/saas/config", file)
-                config_dict = load_config(config_file)
+                config = load_yaml_as_string(config_file)
+                config_dict = load_config_from_string(config)
                 connector_type = config_dict["type"]
                 human_readable = config_dict["name"]
 
-                try:
-                    icon = encode_file_contents(f"data/saas/icon/{connector_type}.svg")
-                except FileNotFoundError:
-                    logger.debug(
-                        f"Could not find the expected {connector_type}.svg in the data/saas/icon/ directory, using default icon"
-                    )
-                    icon = encode_file_contents("data/saas/icon/default.svg")
+                # templates that haven't changed were already validated
+                entry = manifest.get(file)
+                if (
+                    entry
+                    and entry.get("type") == connector_type
+                    and entry.get("name") == human_readable
+                ):
+                    try:
+                        dataset = load_yaml_as_string(
+                            f"data/saas/dataset/{connector_type}_dataset.yml"
+                        )
+                    except FileNotFoundError:
+                        dataset = None
+                    if dataset is not None and _template_hash(
+                        config, dataset
+                    ) == entry.get("hash"):
+                        FileConnectorTemplateLoader.get_connector_templates()[
+                            connector_type
+                        ] = ConnectorTemplate.construct(
+                            config=config,
+                            dataset=dataset,
+                            icon=_load_icon(connector_type),
+                            functions=None,
+                            human_readable=human_readable,
+                        )
+                        updated_manifest[file] = entry
+                        continue
 
                 # store connector template for retrieval
                 try:
+                    dataset = load_yaml_as_string(
+                        f"data/saas/dataset/{connector_type}_dataset.yml"
+                    )
                     FileConnectorTemplateLoader.get_connector_templates()[
                         connector_type
                     ] = ConnectorTemplate(
-                        config=load_yaml_as_string(config_file),
-                        dataset=load_yaml_as_string(
-                            f"data/saas/dataset/{connector_type}_dataset.yml"
-                        ),
-                        icon=icon,
+                        config=config,
+                        dataset=dataset,
+                        icon=_load_icon(connector_type),
                         functions=None,
                         human_readable=human_readable,
                     )
                 except Exception:
                     logger.exception("Unable to load {} connector", connector_type)
+                    continue
+
+                updated_manifest[file] = {
+                    "hash": _template_hash(config, dataset),
+                    "type": connector_type,
+                    "name": human_readable,
+                }
+
+        if updated_manifest != manifest:
+            FileConnectorTemplateLoader._write_manifest(updated_manifest)
+
+    @staticmethod
+    def _read_manifest() -> Dict[str, Dict[str, str]]:
+        """The templates recorded as valid by this version of Fides, keyed by config file name"""
+        try:
+            with open(TEMPLATE_MANIFEST_PATH, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("fides_version") != fides.__version__:
+            return {}
+        return manifest.get("templates", {})
+
+    @staticmethod
+    def _write_manifest(templates: Dict[str, Dict[str, str]]) -> None:
+        """Replace the manifest with a complete new file, so it is never read half
+        written, and an existing file or link at its path is never written through"""
+        manifest_dir = os.path.dirname(TEMPLATE_MANIFEST_PATH)
+        try:
+            os.makedirs(manifest_dir, mode=0o700, exist_ok=True)
+            file_descriptor, temp_path = mkstemp(dir=manifest_dir, suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                    json.dump(
+                        {"fides_version": fides.__version__, "templates": templates},
+                        file,
+                    )
+                os.replace(temp_path, TEMPLATE_MANIFEST_PATH)
+            except OSError:
+                with suppress(OSError):
+                    os.remove(temp_path)
+                raise
+        except OSError as exc:
+            logger.debug("Unable to write the connector template manifest: {}", exc)
+
+
+def _template_hash(config: str, dataset: str) -> str:
+    return sha256(f"{config}\0{dataset}".encode()).hexdigest()
+
+
+def _load_icon(connector_type: str) -> str:
+    try:
+        return encode_file_contents(f"data/saas/icon/{connector_type}.svg")
+    except FileNotFoundError:
+        logger.debug(
+            f"Could not find the expected {connector_type}.svg in the data/saas/icon/ directory, using default icon"
+        )
+        return encode_file_contents("data/saas/icon/default.svg")
 
 
 class CustomConnectorTemplateLoader(ConnectorTemplateLoader):
@@ -373,8 +470,23 @@ def update_saas_configs(db: Session) -> None:
 
     Effectively an "update script" for SaaS config instances,
     to be run on server bootstrap.
+
+    The SaaS connection configs of every registered connector type are loaded with a
+    single query, so only the templates of connector types in use are parsed, and only
+    the outdated connection configs are updated.
     """
-    for connector_type in ConnectorRegistry.connector_types():
+    connector_types = ConnectorRegistry.connector_types()
+    connection_configs_by_type: Dict[str, List[ConnectionConfig]] = defaultdict(list)
+    connection_configs: Iterable[ConnectionConfig] = ConnectionConfig.filter(
+        db=db,
+        conditions=(ConnectionConfig.saas_config["type"].astext.in_(connector_types)),
+    ).all()
+    for connection_config in connection_configs:
+        connection_configs_by_type[connection_config.saas_config["type"]].append(  # type: ignore[index]
+            connection_config
+        )
+
+    for connector_type, type_connection_configs in connection_configs_by_type.items():
         logger.debug(
             "Determining if any updates are needed for connectors of type {} based on templates...",
             connector_type,
@@ -385,32 +497,33 @@ def update_saas_configs(db: Session) -> None:
         saas_config = SaaSConfig(**load_config_from_string(template.config))
         template_version: Version = parse_version(saas_config.version)
 
-        connection_configs: Iterable[ConnectionConfig] = ConnectionConfig.filter(
-            db=db,
-            conditions=(ConnectionConfig.saas_config["type"].astext == connector_type),
-        ).all()
-        for connection_config in connection_configs:
+        for connection_config in type_connection_configs:
+            instance_version = connection_config.saas_config.get("version")  # type: ignore[union-attr]
+            if (
+                instance_version
+                and parse_version(str(instance_version)) >= template_version
+            ):
+                continue
             saas_config_instance = SaaSConfig.parse_obj(connection_config.saas_config)
-            if parse_version(saas_config_instance.version) < template_version:
-                logger.info(
-                    "Updating SaaS config instance '{}' of type '{}' as its version, {}, was found to be lower than the template version {}",
+            logger.info(
+                "Updating SaaS config instance '{}' of type '{}' as its version, {}, was found to be lower than the template version {}",
+                saas_config_instance.fides_key,
+                connector_type,
+                saas_config_instance.version,
+                template_version,
+            )
+            try:
+                update_saas_instance(
+                    db,
+                    connection_config,
+                    template,
+                    saas_config_instance,
+                )
+            except Exception:
+                logger.exception(
+                    "Encountered error attempting to update SaaS config instance {}",
                     saas_config_instance.fides_key,
-                    connector_type,
-                    saas_config_instance.version,
-                    template_version,
                 )
-                try:
-                    update_saas_instance(
-                        db,
-                        connection_config,
-                        template,
-                        saas_config_instance,
-                    )
-                except Exception:
-                    logger.exception(
-                        "Encountered error attempting to update SaaS config instance {}",
-                        saas_config_instance.fides_key,
-                    )
 
 
 def update_saas_instance(
@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from json import JSONDecodeError
+from threading import Lock
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import pydash
 from loguru import logger
 from requests import Response
+from requests import Session as RequestsSession
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import (
@@ -41,6 +46,16 @@ from fides.api.util.consent_util import (
     should_opt_in_to_service,
 )
 from fides.api.util.saas_util import assign_placeholders, map_param_values
+from fides.core.config import CONFIG
+
+ClientKey = Tuple[str, str, Optional[str]]
+
+
+# Authentication strategies that only read the secrets of the connection. Others, such
+# as the OAuth2 strategies, may refresh a token and save it to the connection config
+# while a request is being sent, so requests using them are never sent concurrently
+# and the privacy requests reaching them run on a single worker (see get_num_workers).
+CONCURRENT_AUTHENTICATION_STRATEGIES = {"api_key", "basic", "bearer", "query_param"}
 
 
 class SaaSConnector(BaseConnector[AuthenticatedClient]):
@@ -56,6 +71,11 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         self.current_collection_name: Optional[str] = None
         self.current_privacy_request: Optional[PrivacyRequest] = None
         self.current_saas_request: Optional[SaaSRequest] = None
+        # Clients are kept for the lifetime of the connector, which is a single privacy
+        # request, and share one session so connections to the API are kept alive.
+        self._session: Optional[RequestsSession] = None
+        self._clients: Dict[ClientKey, AuthenticatedClient] = {}
+        self._clients_lock = Lock()
 
     def query_config(self, node: TraversalNode) -> SaaSQueryConfig:
         """
@@ -141,16 +161,47 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         return f"{client_config.protocol}://{assign_placeholders(host, self.secrets)}"
 
     def create_client(self) -> AuthenticatedClient:
-        """Creates an authenticated request builder"""
+        """Creates an authenticated request builder
+
+        A client is created once for each combination of client config and rate limit
+        config used by the connector, and reused after that.
+        """
         uri = self.build_uri()
         client_config = self.get_client_config()
         rate_limit_config = self.get_rate_limit_config()
-
-        logger.info("Creating client to {}", uri)
-        return AuthenticatedClient(
-            uri, self.configuration, client_config, rate_limit_config
+        client_key: ClientKey = (
+            uri,
+            client_config.json(),
+            rate_limit_config.json() if rate_limit_config else None,
         )
 
+        with self._clients_lock:
+            client = self._clients.get(client_key)
+            if not client:
+                logger.info("Creating client to {}", uri)
+                if not self._session:
+                    self._session = self.create_session()
+                client = AuthenticatedClient(
+                    uri,
+                    self.configuration,
+                    client_config,
+                    rate_limit_config,
+                    session=self._session,
+                )
+                self._clients[client_key] = client
+        return client
+
+    @staticmethod
+    def create_session() -> RequestsSession:
+        """Create the HTTP session shared by the clients of this connector, with room
+        in its connection pool for every concurrent request"""
+        session = RequestsSession()
+        pool_size = max(CONFIG.execution.saas_request_max_workers, 10)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def retrieve_data(
         self,
         node: TraversalNode,
@@ -214,21 +265,63 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
             prepared_requests: List[SaaSRequestParams] = query_config.generate_requests(
                 input_data, policy, read_request
             )
+            identity_data = privacy_request.get_cached_identity_data()
 
             # Iterates through initial list of prepared requests and through subsequent
-            # requests generated by pagination. The results are added to the output
-            # list of rows after each request.
-            for next_request in prepared_requests:
-                while next_request:
-                    processed_rows, next_request = self.execute_prepared_request(  # type: ignore
-                        next_request,
-                        privacy_request.get_cached_identity_data(),
-                        read_request,
+            # requests generated by pagination. The prepared requests are independent of
+            # one another, so they may be fetched concurrently, but the results are added
+            # to the output list of rows in the order of the prepared requests.
+            max_workers = min(self.get_max_request_workers(), len(prepared_requests))
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for processed_rows in executor.map(
+                        self.execute_paginated_request,
+                        prepared_requests,
+                        repeat(identity_data),
+                        repeat(read_request),
+                    ):
+                        rows.extend(processed_rows)
+            else:
+                for prepared_request in prepared_requests:
+                    rows.extend(
+                        self.execute_paginated_request(
+                            prepared_request, identity_data, read_request
+                        )
                     )
-                    rows.extend(processed_rows)
         self.unset_connector_state()
         return rows
 
+    def get_max_request_workers(self) -> int:
+        """The number of requests of the current SaaS request that may be sent
+        concurrently, which is always one for authentication strategies that may
+        refresh and store tokens as they go"""
+        authentication = self.get_client_config().authentication
+        if (
+            authentication
+            and authentication.strategy not in CONCURRENT_AUTHENTICATION_STRATEGIES
+        ):
+            return 1
+        return CONFIG.execution.saas_request_max_workers
+
+    def execute_paginated_request(
+        self,
+        prepared_request: SaaSRequestParams,
+        identity_data: Dict[str, Any],
+        saas_request: SaaSRequest,
+    ) -> List[Row]:
+        """Executes the prepared request, followed by the requests for each subsequent
+        page of results, and returns the processed rows of all pages."""
+        rows: List[Row] = []
+        next_request: Optional[SaaSRequestParams] = prepared_request
+        while next_request:
+            processed_rows, next_request = self.execute_prepared_request(
+                next_request,
+                identity_data,
+                saas_request,
+            )
+            rows.extend(processed_rows)
+        return rows
+
     def _missing_dataset_reference_values(
         self, input_data: Dict[str, Any], param_values: Optional[List[ParamValue]]
     ) -> List[str]:
@@ -540,7 +633,12 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         return True
 
     def close(self) -> None:
-        """Not required for this type"""
+        """Close the connections held by the clients of this connector"""
+        with self._clients_lock:
+            self._clients = {}
+            if self._session:
+                self._session.close()
+                self._session = None
 
     @staticmethod
     def _handle_errored_response(
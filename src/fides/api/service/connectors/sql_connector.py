@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from itertools import islice
 from typing import Any, Dict, List, Optional, Type
 
 from loguru import logger
@@ -37,7 +38,7 @@ from fides.api.schemas.connection_configuration.connection_secrets_mariadb impor
 from fides.api.schemas.connection_configuration.connection_secrets_mysql import (
     MySQLSchema,
 )
-from fides.api.service.connectors.base_connector import BaseConnector
+from fides.api.service.connectors.base_connector import BaseConnector, check_row_limit
 from fides.api.service.connectors.query_config import (
     BigQueryQueryConfig,
     MicrosoftSQLServerQueryConfig,
@@ -45,7 +46,13 @@ from fides.api.service.connectors.query_config import (
     SnowflakeQueryConfig,
     SQLQueryConfig,
 )
+from fides.api.service.connectors.sql_engine_registry import (
+    get_engine,
+    get_engine_fingerprint,
+    get_engine_pool_metrics,
+)
 from fides.api.util.collection_util import Row
+from fides.core.config import CONFIG
 
 
 class SQLConnector(BaseConnector[Engine]):
@@ -63,25 +70,30 @@ class SQLConnector(BaseConnector[Engine]):
             )
 
     @staticmethod
-    def cursor_result_to_rows(results: CursorResult) -> List[Row]:
-        """Convert SQLAlchemy results to a list of dictionaries"""
+    def cursor_result_to_rows(
+        results: CursorResult, limit: Optional[int] = None
+    ) -> List[Row]:
+        """Convert SQLAlchemy results to a list of dictionaries, reading at most
+        `limit` rows if given"""
         columns: List[Column] = results.cursor.description
         rows = []
-        for row_tuple in results:
+        for row_tuple in islice(results, limit):
             rows.append(
                 {col.name: row_tuple[count] for count, col in enumerate(columns)}
             )
         return rows
 
     @staticmethod
-    def default_cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def default_cursor_result_to_rows(
+        results: LegacyCursorResult, limit: Optional[int] = None
+    ) -> List[Row]:
         """
-        Convert SQLAlchemy results to a list of dictionaries
+        Convert SQLAlchemy results to a list of dictionaries, reading at most `limit` rows if given
         Overrides BaseConnector.cursor_result_to_rows since SQLAlchemy execute returns LegacyCursorResult for MariaDB
         """
         columns: List[Column] = results.cursor.description
         rows = []
-        for row_tuple in results:
+        for row_tuple in islice(results, limit):
             rows.append({col[0]: row_tuple[count] for count, col in enumerate(columns)})
         return rows
 
@@ -121,17 +133,34 @@ class SQLConnector(BaseConnector[Engine]):
         privacy_request: PrivacyRequest,
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
-        """Retrieve sql data"""
+        """Retrieve sql data
+
+        If `execution.retrieval_batch_size` is set, rows are streamed from a server-side
+        cursor in batches of that size where the dialect supports it.  If
+        `execution.retrieval_row_limit` is set, retrieval fails on a collection with
+        more rows than the limit rather than returning only some of them.
+        """
         query_config = self.query_config(node)
         client = self.client()
         stmt: Optional[TextClause] = query_config.generate_query(input_data, policy)
         if stmt is None:
             return []
+        batch_size: int = CONFIG.execution.retrieval_batch_size
+        row_limit: int = CONFIG.execution.retrieval_row_limit
         logger.info("Starting data retrieval for {}", node.address)
         with client.connect() as connection:
             self.set_schema(connection)
+            if batch_size:
+                connection = connection.execution_options(
+                    stream_results=True, max_row_buffer=batch_size
+                )
             results = connection.execute(stmt)
-            return self.cursor_result_to_rows(results)
+            rows = self.cursor_result_to_rows(
+                results, row_limit + 1 if row_limit else None
+            )
+            results.close()
+        check_row_limit(rows, row_limit, node)
+        return rows
 
     def mask_data(
         self,
@@ -141,10 +170,27 @@ class SQLConnector(BaseConnector[Engine]):
         rows: List[Row],
         input_data: Dict[str, List[Any]],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Execute a masking request. Returns the number of records masked
+
+        If `execution.masking_batch_size` is greater than 1, the rows are masked in batches
+        within a single transaction, otherwise each row is masked and committed by its
+        own UPDATE statement.
+        """
         query_config = self.query_config(node)
+        batch_size: int = CONFIG.execution.masking_batch_size
         update_ct = 0
         client = self.client()
+        if batch_size > 1:
+            with client.connect() as connection:
+                self.set_schema(connection)
+                with connection.begin():
+                    for stmt, params in query_config.generate_batched_update_stmts(
+                        rows, policy, privacy_request, batch_size
+                    ):
+                        results: LegacyCursorResult = connection.execute(stmt, params)
+                        update_ct = update_ct + self.masked_row_count(results, params)
+            return update_ct
+
         for row in rows:
             update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
                 row, policy, privacy_request
@@ -152,24 +198,73 @@ class SQLConnector(BaseConnector[Engine]):
             if update_stmt is not None:
                 with client.connect() as connection:
                     self.set_schema(connection)
-                    results: LegacyCursorResult = connection.execute(update_stmt)
+                    results = connection.execute(update_stmt)
                     update_ct = update_ct + results.rowcount
         return update_ct
 
+    @staticmethod
+    def masked_row_count(
+        results: LegacyCursorResult, params: List[Dict[str, Any]]
+    ) -> int:
+        """The number of rows updated by a masking statement. Not every driver reports
+        an accurate row count for an executemany, in which case each parameter set is
+        assumed to have updated one row."""
+        if len(params) > 1 and not results.supports_sane_multi_rowcount():
+            return len(params)
+        return results.rowcount
+
     def close(self) -> None:
-        """Close any held resources"""
+        """Close any held resources
+
+        Engines shared through the engine registry (see `execution.sql_engine_reuse`)
+        stay open for the next privacy request.
+        """
         if self.db_client:
+            if CONFIG.execution.sql_engine_reuse:
+                logger.debug(
+                    "Returning connections of {} to the pool: {}",
+                    self.configuration.key,
+                    get_engine_pool_metrics(self.db_client),
+                )
+                return
             logger.debug(" disposing of {}", self.__class__)
             self.db_client.dispose()
 
     def create_client(self) -> Engine:
-        """Returns a SQLAlchemy Engine that can be used to interact with a database"""
+        """Returns a SQLAlchemy Engine that can be used to interact with a database
+
+        If `execution.sql_engine_reuse` is set, the engine, along with its pool of
+        connections, is shared by every privacy request using this connection config.
+        """
+        engine_options = self.engine_options()
+        if not CONFIG.execution.sql_engine_reuse:
+            return self.build_engine(**engine_options)
+
+        engine_options["pool_pre_ping"] = True
+        return get_engine(
+            self.configuration,
+            get_engine_fingerprint(self.configuration, **engine_options),
+            lambda: self.build_engine(**engine_options),
+        )
+
+    @staticmethod
+    def engine_options() -> Dict[str, Any]:
+        """Connection pool settings passed to create_engine"""
+        return {
+            "pool_size": CONFIG.execution.sql_pool_size,
+            "max_overflow": CONFIG.execution.sql_max_overflow,
+            "pool_recycle": CONFIG.execution.sql_pool_recycle,
+        }
+
+    def build_engine(self, **engine_options: Any) -> Engine:
+        """Build a new SQLAlchemy Engine for this connection config"""
         config = self.secrets_schema(**self.configuration.secrets or {})
         uri = config.url or self.build_uri()
         return create_engine(
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **engine_options,
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -229,11 +324,13 @@ class MySQLConnector(SQLConnector):
         return url
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, limit: Optional[int] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, limit)
 
 
 class MariaDBConnector(SQLConnector):
@@ -258,11 +355,13 @@ class MariaDBConnector(SQLConnector):
         return url
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, limit: Optional[int] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, limit)
 
 
 class RedshiftConnector(SQLConnector):
@@ -307,8 +406,8 @@ class BigQueryConnector(SQLConnector):
         dataset = f"/{config.dataset}" if config.dataset else ""
         return f"bigquery://{config.keyfile_creds.project_id}{dataset}"
 
-    # Overrides SQLConnector.create_client
-    def create_client(self) -> Engine:
+    # Overrides SQLConnector.build_engine
+    def build_engine(self, **engine_options: Any) -> Engine:
         """
         Returns a SQLAlchemy Engine that can be used to interact with Google BigQuery.
 
@@ -322,6 +421,7 @@ class BigQueryConnector(SQLConnector):
             credentials_info=config.keyfile_creds.dict(),
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **engine_options,
         )
 
     # Overrides SQLConnector.query_config
@@ -339,15 +439,26 @@ class BigQueryConnector(SQLConnector):
     ) -> int:
         """Execute a masking request. Returns the number of records masked"""
         query_config = self.query_config(node)
+        batch_size: int = CONFIG.execution.masking_batch_size
         update_ct = 0
         client = self.client()
+        if batch_size > 1:
+            updates: List[Executable] = query_config.generate_batched_updates(
+                rows, policy, privacy_request, client, batch_size
+            )
+            with client.connect() as connection:
+                for update in updates:
+                    results: LegacyCursorResult = connection.execute(update)
+                    update_ct = update_ct + results.rowcount
+            return update_ct
+
         for row in rows:
             update_stmt: Optional[Executable] = query_config.generate_update(
                 row, policy, privacy_request, client
             )
             if update_stmt is not None:
                 with client.connect() as connection:
-                    results: LegacyCursorResult = connection.execute(update_stmt)
+                    results = connection.execute(update_stmt)
                     update_ct = update_ct + results.rowcount
         return update_ct
 
@@ -421,8 +532,10 @@ class MicrosoftSQLServerConnector(SQLConnector):
         return MicrosoftSQLServerQueryConfig(node)
 
     @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
+    def cursor_result_to_rows(
+        results: LegacyCursorResult, limit: Optional[int] = None
+    ) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
         """
-        return SQLConnector.default_cursor_result_to_rows(results)
+        return SQLConnector.default_cursor_result_to_rows(results, limit)
@@ -0,0 +1,98 @@
+import hashlib
+import json
+from threading import Lock
+from typing import Any, Callable, Dict, Tuple
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from fides.api.models.connectionconfig import ConnectionConfig
+
+_lock = Lock()
+# Pooled engines shared by privacy requests, keyed by connection config key. Each engine
+# is stored with the fingerprint of the configuration it was built from.
+_engines: Dict[str, Tuple[str, Engine]] = {}
+
+
+def get_engine_fingerprint(
+    configuration: ConnectionConfig, **engine_options: Any
+) -> str:
+    """A hash of everything an engine of the given connection config is built from"""
+    fingerprint_data = {
+        "connection_type": configuration.connection_type.value,  # type: ignore
+        "secrets": configuration.secrets or {},
+        "engine_options": engine_options,
+    }
+    return hashlib.sha256(
+        json.dumps(fingerprint_data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def get_engine(
+    configuration: ConnectionConfig,
+    fingerprint: str,
+    create_engine_fn: Callable[[], Engine],
+) -> Engine:
+    """Return the pooled engine of the given connection config, creating it with
+    `create_engine_fn` if there is none yet.
+
+    An engine built from a different fingerprint, for instance before the secrets of the
+    connection config were changed, is disposed of and replaced.
+    """
+    key: str = configuration.key
+    with _lock:
+        cached = _engines.get(key)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        engine = create_engine_fn()
+        _engines[key] = (fingerprint, engine)
+
+    if cached:
+        logger.info("Replacing the SQL engine of connection config {}", key)
+        cached[1].dispose()
+    return engine
+
+
+def dispose_engine(key: str) -> None:
+    """Close the pooled connections of the given connection config, if it has any"""
+    with _lock:
+        cached = _engines.pop(key, None)
+    if cached:
+        logger.debug("Disposing of the SQL engine of connection config {}", key)
+        cached[1].dispose()
+
+
+def dispose_all_engines() -> None:
+    """Close the pooled connections of every connection config"""
+    with _lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for _, engine in engines:
+        engine.dispose()
+
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Report the state of the connection pool of each pooled engine, by connection
+    config key"""
+    with _lock:
+        engines = {key: engine for key, (_, engine) in _engines.items()}
+    return {key: get_engine_pool_metrics(engine) for key, engine in engines.items()}
+
+
+def get_engine_pool_metrics(engine: Engine) -> Dict[str, Any]:
+    """Report the size and use of the connection pool of the given engine"""
+    pool = engine.pool
+    return {
+        "size": pool.size() if hasattr(pool, "size") else None,
+        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+        "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+    }
+
+
+@event.listens_for(ConnectionConfig, "after_delete")
+def connection_config_deleted(_: Any, __: Any, target: ConnectionConfig) -> None:
+    """Close the pooled connections of a connection config when it is deleted"""
+    dispose_engine(target.key)
@@ -0,0 +1,73 @@
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from fides.api.models.privacy_request import ProvidedIdentity
+from fides.api.tasks import DatabaseTask, celery_app
+from fides.api.tasks.scheduled.scheduler import scheduler
+from fides.core.config import get_config
+
+CONFIG = get_config()
+BLIND_INDEX_BACKFILL = "blind_index_backfill"
+BLIND_INDEX_BACKFILL_BATCH_SIZE = 500
+
+
+def backfill_blind_index(
+    db: Session, batch_size: int = BLIND_INDEX_BACKFILL_BATCH_SIZE
+) -> int:
+    """
+    Sets the blind index of provided identities persisted before it was introduced,
+    committing one batch at a time. Returns the number of identities updated.
+    """
+    updated = 0
+    last_id = ""
+    while True:
+        identities = (
+            db.query(ProvidedIdentity)
+            .filter(
+                ProvidedIdentity.blind_index.is_(None),
+                ProvidedIdentity.encrypted_value.isnot(None),
+                ProvidedIdentity.id > last_id,
+            )
+            .order_by(ProvidedIdentity.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not identities:
+            return updated
+
+        for identity in identities:
+            value = (identity.encrypted_value or {}).get("value")
+            if value:
+                identity.blind_index = ProvidedIdentity.blind_index_value(str(value))
+                updated += 1
+        db.commit()
+        last_id = identities[-1].id
+        logger.debug("Backfilled the blind index of {} provided identities", updated)
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def backfill_provided_identity_blind_index(self: DatabaseTask) -> int:
+    """Sets the blind index of every provided identity that doesn't have one yet"""
+    logger.info("Starting blind index backfill of provided identities...")
+    with self.get_new_session() as session:
+        updated = backfill_blind_index(session)
+    logger.info("Backfilled the blind index of {} provided identities", updated)
+    return updated
+
+
+def initiate_blind_index_backfill() -> None:
+    """Initiates scheduler to backfill the blind index of provided identities once"""
+
+    if CONFIG.test_mode:
+        return
+
+    assert scheduler.running, "Scheduler is not running! Cannot add Blind Index job."
+
+    logger.info("Initiating scheduler for blind index backfill")
+    scheduler.add_job(
+        func=backfill_provided_identity_blind_index,
+        kwargs={},
+        id=BLIND_INDEX_BACKFILL,
+        coalesce=True,
+        replace_existing=True,
+    )
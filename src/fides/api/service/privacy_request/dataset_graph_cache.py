@@ -0,0 +1,73 @@
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from fides.api.ctl.sql_models import Dataset as CtlDataset  # type: ignore[attr-defined]
+from fides.api.graph.graph import DatasetGraph
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.api.models.datasetconfig import DatasetConfig
+
+DatasetGraphFingerprint = Tuple[Tuple[Any, ...], ...]
+
+_lock = Lock()
+_cached_graph: Optional[Tuple[DatasetGraphFingerprint, DatasetGraph]] = None
+
+
+def get_dataset_graph_fingerprint(db: Session) -> DatasetGraphFingerprint:
+    """Identify the current version of every DatasetConfig, along with the ctl Dataset and
+    ConnectionConfig it is built from.
+
+    This only reads the keys and timestamps of each record, so it is much cheaper than
+    loading the datasets themselves. Any write to one of these records, or the addition
+    or removal of a DatasetConfig, changes the fingerprint.
+    """
+    rows = (
+        db.query(
+            DatasetConfig.id,
+            DatasetConfig.updated_at,
+            CtlDataset.updated_at,
+            ConnectionConfig.id,
+            ConnectionConfig.updated_at,
+        )
+        .join(CtlDataset, DatasetConfig.ctl_dataset_id == CtlDataset.id)
+        .join(
+            ConnectionConfig, DatasetConfig.connection_config_id == ConnectionConfig.id
+        )
+        .order_by(DatasetConfig.id)
+        .all()
+    )
+    return tuple(tuple(row) for row in rows)
+
+
+def get_dataset_graph(db: Session) -> DatasetGraph:
+    """Return the DatasetGraph of all DatasetConfigs.
+
+    The graph is built once and shared by subsequent privacy requests until any of the
+    datasets or connection configs it was built from change. The cached graph must be
+    treated as read-only.
+    """
+    global _cached_graph  # pylint: disable=W0603
+
+    fingerprint = get_dataset_graph_fingerprint(db)
+    with _lock:
+        if _cached_graph and _cached_graph[0] == fingerprint:
+            return _cached_graph[1]
+
+    logger.info("Building dataset graph from {} dataset configs", len(fingerprint))
+    datasets = DatasetConfig.all(db=db)
+    dataset_graph = DatasetGraph(
+        *[dataset_config.get_graph() for dataset_config in datasets]
+    )
+    with _lock:
+        _cached_graph = (fingerprint, dataset_graph)
+    return dataset_graph
+
+
+def clear_dataset_graph_cache() -> None:
+    """Discard the cached DatasetGraph, so that the next request rebuilds it"""
+    global _cached_graph  # pylint: disable=W0603
+
+    with _lock:
+        _cached_graph = None
@@ -65,6 +65,7 @@ from fides.api.service.connectors.erasure_email_connector import (
 )
 from fides.api.service.connectors.fides_connector import filter_fides_connector_datasets
 from fides.api.service.messaging.message_dispatch_service import dispatch_message
+from fides.api.service.privacy_request.dataset_graph_cache import get_dataset_graph
 from fides.api.service.storage.storage_uploader_service import upload
 from fides.api.task.filter_results import filter_data_categories
 from fides.api.task.graph_task import (
@@ -79,6 +80,7 @@ from fides.api.util.cache import (
     FidesopsRedis,
     get_async_task_tracking_cache_key,
     get_cache,
+    get_privacy_request_index_key,
 )
 from fides.api.util.collection_util import Row
 from fides.api.util.logger import Pii, _log_exception, _log_warning
@@ -264,6 +266,10 @@ def queue_privacy_request(
             get_async_task_tracking_cache_key(privacy_request_id),
             task.task_id,
         )
+        cache.add_to_index(
+            get_privacy_request_index_key(privacy_request_id),
+            get_async_task_tracking_cache_key(privacy_request_id),
+        )
     except DataError:
         logger.debug(
             "Error tracking task_id for request with id {}", privacy_request_id
@@ -302,6 +308,7 @@ async def run_privacy_request(
                 f"Privacy request with id {privacy_request_id} not found"
             )
 
+        privacy_request.index_cached_keys()
         privacy_request.cache_failed_checkpoint_details()  # Reset failed step and collection to None
 
         if privacy_request.status == PrivacyRequestStatus.canceled:
@@ -339,9 +346,7 @@ async def run_privacy_request(
             )
 
         try:
-            datasets = DatasetConfig.all(db=session)
-            dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-            dataset_graph = DatasetGraph(*dataset_graphs)
+            dataset_graph = get_dataset_graph(session)
             identity_data = privacy_request.get_cached_identity_data()
             connection_configs = ConnectionConfig.all(db=session)
             fides_connector_datasets: Set[str] = filter_fides_connector_datasets(
@@ -400,7 +405,7 @@ async def run_privacy_request(
                 await run_consent_request(
                     privacy_request=privacy_request,
                     policy=policy,
-                    graph=build_consent_dataset_graph(datasets),
+                    graph=build_consent_dataset_graph(DatasetConfig.all(db=session)),
                     connection_configs=connection_configs,
                     identity=identity_data,
                     session=session,
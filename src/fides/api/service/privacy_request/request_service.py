@@ -50,6 +50,7 @@ def cache_data(
     drp_request_body: Optional[DrpPrivacyRequestCreate],
 ) -> None:
     """Cache privacy request data"""
+    privacy_request.start_cache_index()
     # Store identity and encryption key in the cache
     logger.info("Caching identity for privacy request {}", privacy_request.id)
     privacy_request.cache_identity(identity)
@@ -17,6 +17,7 @@ from fides.api.common_exceptions import (
     NotSupportedForCollection,
     PrivacyRequestErasureEmailSendRequired,
     PrivacyRequestPaused,
+    RowLimitExceeded,
     SkippingConsentPropagation,
     TraversalError,
 )
@@ -43,8 +44,13 @@ from fides.api.service.connectors.base_connector import BaseConnector
 from fides.api.task.consolidate_query_matches import consolidate_query_matches
 from fides.api.task.filter_element_match import filter_element_match
 from fides.api.task.refine_target_path import FieldPathNodeInput
-from fides.api.task.task_resources import TaskResources
-from fides.api.util.cache import get_cache
+from fides.api.task.task_resources import TaskResources, get_num_workers
+from fides.api.util.cache import (
+    ACCESS_RESULTS_REFERENCE,
+    FidesopsRedis,
+    get_cache,
+    get_privacy_request_index_key,
+)
 from fides.api.util.collection_util import NodeInput, Row, append, partition
 from fides.api.util.consent_util import add_errored_system_status_for_consent_reporting
 from fides.api.util.logger import Pii
@@ -88,7 +94,10 @@ def retry(
                     else:
                         self.log_start(action_type)
                     # Run access or erasure request
-                    return func(*args, **kwargs)
+                    with self.resources.connection_slot(
+                        self.traversal_node.node.dataset.connection_key
+                    ):
+                        return func(*args, **kwargs)
                 except PrivacyRequestPaused as ex:
                     traceback.print_exc()
                     logger.warning(
@@ -118,6 +127,11 @@ def retry(
                     )
                     self.log_skipped(action_type, exc)
                     return default_return
+                except RowLimitExceeded as exc:
+                    traceback.print_exc()
+                    # Retrying would retrieve the same rows again
+                    raised_ex = exc
+                    break
                 except SkippingConsentPropagation as exc:
                     traceback.print_exc()
                     logger.warning(
@@ -126,13 +140,18 @@ def retry(
                         self.resources.request.id,
                     )
                     self.log_skipped(action_type, exc)
-                    for pref in self.resources.request.privacy_preferences:
-                        # For consent reporting, also caching the given system as skipped for all historical privacy preferences.
-                        pref.cache_system_status(
-                            self.resources.session,
-                            self.connector.configuration.system_key,
-                            ExecutionLogStatus.skipped,
+                    system_key = self.connector.configuration.system_key
+                    with self.resources.worker_session() as db:
+                        privacy_request = self.resources.load_into(
+                            db, self.resources.request
                         )
+                        for pref in privacy_request.privacy_preferences:
+                            # For consent reporting, also caching the given system as skipped for all historical privacy preferences.
+                            pref.cache_system_status(
+                                db,
+                                system_key,
+                                ExecutionLogStatus.skipped,
+                            )
                     return default_return
                 except BaseException as ex:  # pylint: disable=W0703
                     traceback.print_exc()
@@ -149,11 +168,12 @@ def retry(
             self.resources.request.cache_failed_checkpoint_details(
                 step=action_type, collection=self.traversal_node.address
             )
-            add_errored_system_status_for_consent_reporting(
-                self.resources.session,
-                self.resources.request,
-                self.connector.configuration,
-            )
+            with self.resources.worker_session() as db:
+                add_errored_system_status_for_consent_reporting(
+                    db,
+                    self.resources.load_into(db, self.resources.request),
+                    self.resources.load_into(db, self.connector.configuration),
+                )
             # Re-raise to stop privacy request execution on failure.
             raise raised_ex  # type: ignore
 
@@ -482,29 +502,37 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
 
         Caches the data in TWO separate formats: 1) erasure format, *replaces* unmatched array elements with placeholder
         text, and 2) access request format, which *removes* unmatched array elements altogether.  If no data was filtered
-        out, both cached versions will be the same.
+        out, the erasure format just refers to the access request format instead of storing a second copy.
         """
         post_processed_node_input_data: FieldPathNodeInput = (
             self.post_process_input_data(formatted_input_data)
         )
 
-        # For erasures: cache results with non-matching array elements *replaced* with placeholder text
-        placeholder_output: List[Row] = copy.deepcopy(output)
-        for row in placeholder_output:
-            filter_element_match(
-                row, query_paths=post_processed_node_input_data, delete_elements=False
-            )
+        # For erasures: results with non-matching array elements *replaced* with placeholder text
+        placeholder_output: Optional[List[Row]] = None
+        if post_processed_node_input_data:
+            placeholder_output = copy.deepcopy(output)
+            for row in placeholder_output:
+                filter_element_match(
+                    row,
+                    query_paths=post_processed_node_input_data,
+                    delete_elements=False,
+                )
+
+            # For access request results, non-matching array elements are *removed*
+            for row in output:
+                logger.info(
+                    "Filtering row in {} for matching array elements.",
+                    self.traversal_node.node.address,
+                )
+                filter_element_match(row, post_processed_node_input_data)
+
+            if placeholder_output == output:
+                placeholder_output = None
+
         self.resources.cache_results_with_placeholders(
             f"access_request__{self.key}", placeholder_output
         )
-
-        # For access request results, cache results with non-matching array elements *removed*
-        for row in output:
-            logger.info(
-                "Filtering row in {} for matching array elements.",
-                self.traversal_node.node.address,
-            )
-            filter_element_match(row, post_processed_node_input_data)
         self.resources.cache_object(f"access_request__{self.key}", output)
 
         # Return filtered rows with non-matched array data removed.
@@ -513,7 +541,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
     def skip_if_disabled(self) -> None:
         """Skip execution for the given collection if it is attached to a disabled ConnectionConfig."""
         connection_config: ConnectionConfig = self.connector.configuration
-        if connection_config.disabled:
+        if self.resources.connection_disabled(connection_config):
             raise CollectionDisabled(
                 f"Skipping collection {self.traversal_node.node.address}. "
                 f"ConnectionConfig {connection_config.key} is disabled.",
@@ -658,6 +686,17 @@ def update_mapping_from_cache(
         )
 
 
+def execute_task_graph(dsk: Dict[CollectionAddress, Any], num_workers: int = 1) -> Any:
+    """Run the dask graph and return the output of the terminator node.
+
+    Dask's threaded scheduler runs every node whose inputs are ready on a pool of
+    `num_workers` threads, so collections with no dependency on one another are
+    queried at the same time.
+    """
+    v = delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=num_workers))
+    return v.compute()
+
+
 def start_function(seed: List[Dict[str, Any]]) -> Callable[[], List[Dict[str, Any]]]:
     """Return a function for collections with no upstream dependencies, that just start
     with seed data.
@@ -681,7 +720,11 @@ async def run_access_request(
     """Run the access request"""
     traversal: Traversal = Traversal(graph, identity)
     with TaskResources(
-        privacy_request, policy, connection_configs, session
+        privacy_request,
+        policy,
+        connection_configs,
+        session,
+        get_num_workers(connection_configs),
     ) as resources:
 
         def collect_tasks_fn(
@@ -717,8 +760,7 @@ async def run_access_request(
         )
         privacy_request.cache_access_graph(format_graph_for_caching(env, end_nodes))
 
-        v = delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=1))
-        return v.compute()
+        return execute_task_graph(dsk, resources.num_workers)
 
 
 def get_cached_data_for_erasures(
@@ -730,9 +772,28 @@ def get_cached_data_for_erasures(
     Processing may have added indicators to not mask certain elements in array data.
     """
     cache = get_cache()
-    value_dict = cache.get_encoded_objects_by_prefix(
-        f"PLACEHOLDER_RESULTS__{privacy_request_id}"
+    value_dict = cache.get_encoded_objects_by_index(
+        get_privacy_request_index_key(privacy_request_id),
+        f"PLACEHOLDER_RESULTS__{privacy_request_id}",
     )
+
+    # Collections whose results didn't need placeholders refer to their access results
+    referenced_keys = {
+        k: k.replace("PLACEHOLDER_RESULTS__", "", 1)
+        for k, v in value_dict.items()
+        if v == ACCESS_RESULTS_REFERENCE
+    }
+    access_results = cache.get_values(list(referenced_keys.values()))
+    for k, access_results_key in referenced_keys.items():
+        if access_results.get(access_results_key) is None:
+            # Like a collection with no cached results, there is nothing to erase
+            logger.warning(
+                "Access results referenced by {} are missing from the cache", k
+            )
+            value_dict[k] = []
+        else:
+            value_dict[k] = FidesopsRedis.decode_obj(access_results[access_results_key])
+
     return {k.split("__")[-1]: v for k, v in value_dict.items()}
 
 
@@ -764,8 +825,13 @@ async def run_erasure(  # pylint: disable = too-many-arguments
     """Run an erasure request"""
     traversal: Traversal = Traversal(graph, identity)
     with TaskResources(
-        privacy_request, policy, connection_configs, session
+        privacy_request,
+        policy,
+        connection_configs,
+        session,
+        get_num_workers(connection_configs),
     ) as resources:
+        resources.prefetch_masking_secrets()
 
         def collect_tasks_fn(
             tn: TraversalNode, data: Dict[CollectionAddress, GraphTask]
@@ -826,8 +892,7 @@ async def run_erasure(  # pylint: disable = too-many-arguments
                 f"The values for the `erase_after` fields caused a cycle in the following collections {collection_cycle}"
             )
 
-        v = delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=1))
-        return v.compute()
+        return execute_task_graph(dsk, resources.num_workers)
 
 
 def _evaluate_erasure_dependencies(
@@ -864,6 +929,9 @@ async def run_consent_request(  # pylint: disable = too-many-arguments
 
     The DatasetGraph passed in is expected to have one Node per Dataset.  That Node is expected to carry out requests
     for the Dataset as a whole.
+
+    Consent requests always run on a single worker: connectors record consent reporting
+    state on the request's session as they go.
     """
 
     with TaskResources(
@@ -888,9 +956,7 @@ async def run_consent_request(  # pylint: disable = too-many-arguments
         # terminator function waits for all keys
         dsk[TERMINATOR_ADDRESS] = (termination_fn, *graph_keys)
 
-        v = delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=1))
-
-        update_successes: Tuple[bool, ...] = v.compute()
+        update_successes: Tuple[bool, ...] = execute_task_graph(dsk)
         # we combine the output of the termination function with the input keys to provide
         # a map of {collection_name: whether consent request succeeded}:
         consent_update_map: Dict[str, bool] = dict(
@@ -1,10 +1,17 @@
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from threading import BoundedSemaphore, Lock, RLock
+from time import monotonic
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Set, Union
 
 from fideslang.validation import FidesKey
 from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import ConnectorNotFoundException
+from fides.api.db.base_class import FidesBase
+from fides.api.db.session import ExtendedSession
 from fides.api.graph.config import CollectionAddress
 from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
 from fides.api.models.policy import Policy
@@ -14,6 +21,7 @@ from fides.api.models.privacy_request import (
     PrivacyRequest,
 )
 from fides.api.schemas.policy import ActionType
+from fides.api.schemas.saas.saas_config import SaaSRequest
 from fides.api.service.connectors import (
     BaseConnector,
     BigQueryConnector,
@@ -31,8 +39,23 @@ from fides.api.service.connectors import (
     TimescaleConnector,
 )
 from fides.api.service.connectors.base_email_connector import BaseEmailConnector
-from fides.api.util.cache import get_cache
+from fides.api.service.connectors.saas_connector import (
+    CONCURRENT_AUTHENTICATION_STRATEGIES,
+)
+from fides.api.util.cache import ACCESS_RESULTS_REFERENCE, get_cache
 from fides.api.util.collection_util import Row
+from fides.api.util.encryption.secrets_util import SecretsUtil
+from fides.core.config import CONFIG
+
+# Execution log statuses that are written right away, even when execution logs are
+# batched, so a collection that completes, is paused, skipped or fails shows up as
+# soon as it happens. Only the logs of collections starting or retrying are batched.
+IMMEDIATE_EXECUTION_LOG_STATUSES = {
+    ExecutionLogStatus.complete,
+    ExecutionLogStatus.paused,
+    ExecutionLogStatus.skipped,
+    ExecutionLogStatus.error,
+}
 
 
 class Connections:
@@ -40,6 +63,7 @@ class Connections:
 
     def __init__(self) -> None:
         self.connections: Dict[str, Union[BaseConnector, BaseEmailConnector]] = {}
+        self._lock = Lock()
 
     def get_connector(
         self, connection_config: ConnectionConfig
@@ -47,10 +71,11 @@ class Connections:
         """Return the connector corresponding to this config. Will return the existing
         connector or create one if it does not yet exist."""
         key = connection_config.key
-        if key not in self.connections:
-            connector = Connections.build_connector(connection_config)
-            self.connections[key] = connector
-        return self.connections[key]
+        with self._lock:
+            if key not in self.connections:
+                connector = Connections.build_connector(connection_config)
+                self.connections[key] = connector
+            return self.connections[key]
 
     @staticmethod
     def build_connector(  # pylint: disable=R0911,R0912
@@ -102,6 +127,17 @@ class TaskResources:
      - the policy
      - redis connection
      -  configurations to any outside resources the task will require to run
+
+    When the privacy request runs with more than one worker (see
+    `get_num_workers`), the nodes of the graph share these resources
+    across threads.  The request's db session is then only read from: what the nodes
+    read is loaded up front, and their writes go through `worker_session`, which
+    hands each of them a short-lived session of its own.  `connection_slot` caps how
+    many nodes may use the same connection at once.
+
+    Execution logs may be collected and written in batches (see
+    `execution.execution_log_batch_size`), in which case the logs still waiting to be
+    written are flushed when the resources are closed.
     """
 
     def __init__(
@@ -110,6 +146,7 @@ class TaskResources:
         policy: Policy,
         connection_configs: List[ConnectionConfig],
         session: Session,
+        num_workers: int = 1,
     ):
         self.request = request
         self.policy = policy
@@ -120,6 +157,79 @@ class TaskResources:
         }
         self.connections = Connections()
         self.session = session
+        self.num_workers = num_workers
+        self.session_lock = RLock()
+        self._execution_logs: List[Dict[str, Any]] = []
+        self._execution_logs_started_at: Optional[float] = None
+        self._execution_log_lock = Lock()
+        # Held while writing a batch of logs, so batches are written in order
+        self._execution_log_flush_lock = Lock()
+        self.connection_semaphores: Dict[str, BoundedSemaphore] = {}
+        for connection_config in connection_configs:
+            limit = get_connection_concurrency_limit(connection_config)
+            if limit:
+                self.connection_semaphores[connection_config.key] = BoundedSemaphore(
+                    limit
+                )
+        if self.num_workers > 1:
+            self._load_shared_state()
+
+    def _load_shared_state(self) -> None:
+        """Load what the nodes read from the request's session up front, so worker
+        threads don't lazy-load it from the shared session at the same time."""
+        for rule in self.policy.rules or []:  # type: ignore[attr-defined]
+            list(rule.targets)
+        list(self.request.privacy_preferences)  # type: ignore[attr-defined]
+        for connection_config in self.connection_configs.values():
+            connection_config.system_key  # pylint: disable=pointless-statement
+
+    @contextmanager
+    def worker_session(self) -> Iterator[Session]:
+        """A session a node may write to from its worker thread.
+
+        With a single worker this is the request's session.  Otherwise it is a
+        short-lived session of its own: committing on the shared session would expire
+        the objects other worker threads are reading from it.  Objects of the shared
+        session must be loaded again into the session yielded here before changing
+        them, see `load_into`.
+        """
+        if self.num_workers == 1:
+            with self.session_lock:
+                yield self.session
+            return
+
+        with ExtendedSession(bind=self.session.get_bind()) as db:  # type: ignore[attr-defined]
+            yield db
+
+    def load_into(self, db: Session, instance: FidesBase) -> Any:
+        """The given object of the request's session, loaded again into `db` if that
+        is a session of its own"""
+        if db is self.session:
+            return instance
+        return db.query(type(instance)).get(instance.id)
+
+    def connection_disabled(self, connection_config: ConnectionConfig) -> bool:
+        """Whether the given connection has been disabled, checked against the db
+        since it may be disabled while the request is running"""
+        with self.worker_session() as db:
+            if db is self.session:
+                return bool(connection_config.disabled)
+            return bool(
+                db.query(ConnectionConfig.disabled)
+                .filter(ConnectionConfig.id == connection_config.id)
+                .scalar()
+            )
+
+    def prefetch_masking_secrets(self) -> None:
+        """Load the masking secrets of the policy's erasure rules into memory, so that
+        masking each field of each collection doesn't need its own trip to Redis. They
+        are dropped again when the resources are closed."""
+        masking_strategies = {
+            rule.masking_strategy["strategy"]
+            for rule in self.policy.get_rules_for_action(action_type=ActionType.erasure)
+            if rule.masking_strategy
+        }
+        SecretsUtil.prefetch_masking_secrets(self.request.id, masking_strategies)
 
     def __enter__(self) -> "TaskResources":
         """Support 'with' usage for closing resources"""
@@ -129,22 +239,29 @@ class TaskResources:
         """Support 'with' usage for closing resources"""
         self.close()
 
-    def cache_results_with_placeholders(self, key: str, value: Any) -> None:
+    def cache_results_with_placeholders(self, key: str, value: Optional[Any]) -> None:
         """Cache raw results from node. Object will be
         stored in redis under 'PLACEHOLDER_RESULTS__PRIVACY_REQUEST_ID__TYPE__COLLECTION_ADDRESS
+
+        A value of None means the results are the same as the ones cached with
+        cache_object, so only a reference to those is stored.
         """
         self.cache.set_encoded_object(
-            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}", value
+            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}",
+            ACCESS_RESULTS_REFERENCE if value is None else value,
+            index=self.request.cache_index,
         )
 
     def cache_object(self, key: str, value: Any) -> None:
         """Store in cache. Object will be stored in redis under 'REQUEST_ID__TYPE__ADDRESS'"""
-        self.cache.set_encoded_object(f"{self.request.id}__{key}", value)
+        self.cache.set_encoded_object(
+            f"{self.request.id}__{key}", value, index=self.request.cache_index
+        )
 
     def get_all_cached_objects(self) -> Dict[str, Optional[List[Row]]]:
         """Retrieve the access results of all steps (cache_object)"""
-        value_dict = self.cache.get_encoded_objects_by_prefix(
-            f"{self.request.id}__access_request"
+        value_dict = self.cache.get_encoded_objects_by_index(
+            self.request.cache_index, f"{self.request.id}__access_request"
         )
         # extract request id to return a map of address:value
         return {k.split("__")[-1]: v for k, v in value_dict.items()}
@@ -154,13 +271,15 @@ class TaskResources:
         'REQUEST_ID__erasure_request__ADDRESS
         '"""
         self.cache.set_encoded_object(
-            f"{self.request.id}__erasure_request__{key}", value
+            f"{self.request.id}__erasure_request__{key}",
+            value,
+            index=self.request.cache_index,
         )
 
     def get_all_cached_erasures(self) -> Dict[str, int]:
         """Retrieve which collections have been masked and their row counts(cache_erasure)"""
-        value_dict = self.cache.get_encoded_objects_by_prefix(
-            f"{self.request.id}__erasure_request"
+        value_dict = self.cache.get_encoded_objects_by_index(
+            self.request.cache_index, f"{self.request.id}__erasure_request"
         )
         # extract request id to return a map of address:value
         return {k.split("__")[-1]: v for k, v in value_dict.items()}  # type: ignore
@@ -174,22 +293,70 @@ class TaskResources:
         status: ExecutionLogStatus,
         message: str = None,
     ) -> Any:
-        """Store in application db. Return the created or written-to id field value."""
-        db = self.session
-
-        ExecutionLog.create(
-            db=db,
-            data={
-                "connection_key": connection_key,
-                "dataset_name": collection_address.dataset,
-                "collection_name": collection_address.collection,
-                "fields_affected": fields_affected,
-                "action_type": action_type,
-                "status": status,
-                "privacy_request_id": self.request.id,
-                "message": message,
-            },
-        )
+        """Store in application db. Return the created or written-to id field value.
+
+        When execution logs are batched, the log is collected with the time it was
+        created and written with the rest of its batch. Whether the oldest collected
+        log is older than the flush interval is only checked here, when a log is
+        written: there is no timer writing logs in the background."""
+        data = {
+            "connection_key": connection_key,
+            "dataset_name": collection_address.dataset,
+            "collection_name": collection_address.collection,
+            "fields_affected": fields_affected,
+            "action_type": action_type,
+            "status": status,
+            "privacy_request_id": self.request.id,
+            "message": message,
+        }
+
+        if CONFIG.execution.execution_log_batch_size == 1:
+            self._write_execution_logs([data])
+            return
+
+        # Logs of a batch are inserted in the same transaction, so they can't rely on
+        # the database to timestamp them in the order they were created
+        data["created_at"] = data["updated_at"] = datetime.now(timezone.utc)
+        with self._execution_log_lock:
+            self._execution_logs.append(data)
+            if self._execution_logs_started_at is None:
+                self._execution_logs_started_at = monotonic()
+            flush = (
+                status in IMMEDIATE_EXECUTION_LOG_STATUSES
+                or len(self._execution_logs)
+                >= CONFIG.execution.execution_log_batch_size
+                or monotonic() - self._execution_logs_started_at
+                >= CONFIG.execution.execution_log_flush_interval
+            )
+        if flush:
+            self.flush_execution_logs()
+
+    def flush_execution_logs(self) -> None:
+        """Write the execution logs still waiting to be written to the application db"""
+        with self._execution_log_flush_lock:
+            with self._execution_log_lock:
+                execution_logs = self._execution_logs
+                self._execution_logs = []
+                self._execution_logs_started_at = None
+            if execution_logs:
+                self._write_execution_logs(execution_logs)
+
+    def _write_execution_logs(self, execution_logs: List[Dict[str, Any]]) -> None:
+        if CONFIG.execution.execution_log_separate_session:
+            with ExtendedSession(bind=self.session.get_bind()) as db:  # type: ignore[attr-defined]
+                insert_execution_logs(db, execution_logs)
+            return
+
+        with self.worker_session() as db:
+            insert_execution_logs(db, execution_logs)
+
+    @contextmanager
+    def connection_slot(self, key: FidesKey) -> Iterator[None]:
+        """Hold one of the concurrency slots of the given connection for the duration
+        of the block, waiting for one to free up if they are all in use."""
+        semaphore: ContextManager = self.connection_semaphores.get(key, nullcontext())
+        with semaphore:
+            yield
 
     def get_connector(self, key: FidesKey) -> Any:
         """Create or return the client corresponding to the given ConnectionConfig key"""
@@ -200,4 +367,80 @@ class TaskResources:
     def close(self) -> None:
         """Close any held resources"""
         logger.debug("Closing all task resources for {}", self.request.id)
+        try:
+            self.flush_execution_logs()
+        except SQLAlchemyError as exc:
+            logger.error(
+                "Unable to write the execution logs of {}: {}", self.request.id, exc
+            )
         self.connections.close()
+        SecretsUtil.clear_masking_secrets(self.request.id)
+
+
+def insert_execution_logs(db: Session, execution_logs: List[Dict[str, Any]]) -> None:
+    """Insert the given execution logs and commit them, with a single statement when
+    there is more than one"""
+    if len(execution_logs) == 1:
+        ExecutionLog.create(db=db, data=execution_logs[0])
+        return
+    db.bulk_insert_mappings(ExecutionLog, execution_logs)
+    db.commit()
+
+
+def get_connection_concurrency_limit(connection_config: ConnectionConfig) -> int:
+    """The number of nodes that may use the given connection at the same time during
+    a privacy request. Returns 0 if the connection is not limited beyond the size of
+    the worker pool.
+
+    SaaS connectors hold the state of the request they are currently executing on the
+    connector itself, so they are always limited to a single node at a time.
+    """
+    if connection_config.connection_type == ConnectionType.saas:
+        return 1
+    return CONFIG.execution.task_max_connection_concurrency
+
+
+def get_num_workers(connection_configs: List[ConnectionConfig]) -> int:
+    """The number of threads to run the access or erasure graph of a privacy request
+    on, see `execution.task_max_workers`.
+
+    Authentication strategies that may refresh a token save it to the connection config
+    on the session it was loaded from, which is the request's session shared by all the
+    nodes. Requests with a SaaS connection using one of them run on a single worker.
+    """
+    num_workers = CONFIG.execution.task_max_workers
+    if num_workers > 1 and any(
+        get_authentication_strategies(connection_config)
+        - CONCURRENT_AUTHENTICATION_STRATEGIES
+        for connection_config in connection_configs
+    ):
+        logger.debug("Running on a single worker to refresh SaaS tokens safely")
+        return 1
+    return num_workers
+
+
+def get_authentication_strategies(connection_config: ConnectionConfig) -> Set[str]:
+    """The names of the authentication strategies the requests of the given SaaS
+    connection may use"""
+    saas_config = connection_config.get_saas_config()
+    if not saas_config:
+        return set()
+
+    saas_requests: List[Optional[SaaSRequest]] = [saas_config.data_protection_request]
+    for endpoint in saas_config.endpoints:
+        read_requests = endpoint.requests.read
+        if isinstance(read_requests, SaaSRequest):
+            read_requests = [read_requests]
+        saas_requests.extend(read_requests)
+        saas_requests.extend([endpoint.requests.update, endpoint.requests.delete])
+
+    client_configs = [saas_config.client_config] + [
+        saas_request.client_config
+        for saas_request in saas_requests
+        if saas_request and saas_request.client_config
+    ]
+    return {
+        client_config.authentication.strategy
+        for client_config in client_configs
+        if client_config.authentication
+    }
@@ -1,4 +1,6 @@
 import json
+import zlib
+from base64 import b64decode, b64encode
 from datetime import date, datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
@@ -7,7 +9,6 @@ from urllib.parse import quote, unquote_to_bytes
 from bson.objectid import ObjectId
 from loguru import logger
 from redis import Redis
-from redis.client import Script  # type: ignore
 from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
 
 from fides.api import common_exceptions
@@ -23,6 +24,16 @@ _connection = None
 ENCODED_BYTES_PREFIX = "quote_encoded_"
 ENCODED_DATE_PREFIX = "date_encoded_"
 ENCODED_MONGO_OBJECT_ID_PREFIX = "encoded_object_id_"
+# Prefix of encoded objects whose JSON was compressed with zlib. Values are read back as
+# strings, so the compressed JSON is stored base64 encoded.
+COMPRESSED_OBJECT_PREFIX = "zlib_b64_v1:"
+# Encoded object cached in place of the results with placeholders of a collection when
+# they are the same as its access results
+ACCESS_RESULTS_REFERENCE = "__access_results__"
+
+# Member of a key index set that records that every key belonging to the index has been
+# added to it, so that the index can be read instead of scanning the keyspace.
+INDEX_COMPLETE_MARKER = "__index_complete__"
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -74,13 +85,25 @@ class FidesopsRedis(Redis):
         key: str,
         value: RedisValue,
         expire_time: int = CONFIG.redis.default_ttl_seconds,
+        index: Optional[str] = None,
     ) -> Optional[bool]:
-        """Call the connection class' default set method with ex= our default TTL"""
+        """Call the connection class' default set method with ex= our default TTL
+
+        If an index is given, the key is also added to that index set in the same
+        round trip.
+        """
         if not expire_time:
             # We have to check this condition for the edge case where `None` is explicitly
             # passed to this method.
             expire_time = CONFIG.redis.default_ttl_seconds
-        return self.set(key, value, ex=expire_time)
+        if not index:
+            return self.set(key, value, ex=expire_time)
+
+        pipe = self.pipeline(transaction=False)
+        pipe.set(key, value, ex=expire_time)
+        pipe.sadd(index, key)
+        pipe.expire(index, CONFIG.redis.default_ttl_seconds)
+        return pipe.execute()[0]
 
     def get_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> List[str]:
         """Retrieve all keys that match a given prefix."""
@@ -93,24 +116,88 @@ class FidesopsRedis(Redis):
             out.extend(keys)
         return out
 
-    def delete_keys_by_prefix(self, prefix: str) -> None:
-        """Delete all keys starting with a given prefix"""
-        s: Script = self.register_script(
-            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
-        )
-        s()
+    def delete_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> None:
+        """Delete all keys starting with a given prefix
+
+        The keyspace is scanned in chunks rather than with KEYS, so Redis can keep
+        serving other clients while the keys are found.
+        """
+        keys = self.get_keys_by_prefix(prefix, chunk_size)
+        for i in range(0, len(keys), chunk_size):
+            self.delete(*keys[i : i + chunk_size])
+
+    def add_to_index(self, index: str, *keys: str) -> None:
+        """Add keys written without set_with_autoexpire to an index set"""
+        pipe = self.pipeline(transaction=False)
+        pipe.sadd(index, *keys)
+        pipe.expire(index, CONFIG.redis.default_ttl_seconds)
+        pipe.execute()
+
+    def start_index(self, index: str) -> None:
+        """Mark an index as complete before any keys are added to it.
+
+        Only call this if every key belonging to the index will be written with the
+        index, for instance when the object the keys belong to is created.
+        """
+        self.add_to_index(index, INDEX_COMPLETE_MARKER)
+
+    def index_keys_by_pattern(
+        self, index: str, pattern: str, chunk_size: int = 1000
+    ) -> None:
+        """Add all existing keys matching a pattern to an index and mark it as complete.
+
+        This scans the whole keyspace once, for keys that were cached before they were
+        tracked in an index.
+        """
+        keys = [
+            key
+            for key in self.scan_iter(match=pattern, count=chunk_size)
+            if key != index
+        ]
+        for i in range(0, len(keys), chunk_size):
+            self.add_to_index(index, *keys[i : i + chunk_size])
+        self.start_index(index)
+
+    def is_index_complete(self, index: str) -> bool:
+        """Whether every key belonging to the index is known to be in it"""
+        return bool(self.sismember(index, INDEX_COMPLETE_MARKER))
+
+    def get_keys_by_index(self, index: str, prefix: str = "") -> List[str]:
+        """Retrieve all keys in an index that start with the given prefix.
+
+        Falls back to scanning the keyspace for the prefix if the index is not complete.
+        """
+        members = self.smembers(index)
+        if INDEX_COMPLETE_MARKER not in members:
+            return self.get_keys_by_prefix(prefix)
+        return [
+            key
+            for key in members
+            if key != INDEX_COMPLETE_MARKER and key.startswith(prefix)
+        ]
+
+    def delete_keys_by_index(self, index: str) -> None:
+        """Delete all keys in an index, and the index itself"""
+        keys = [key for key in self.smembers(index) if key != INDEX_COMPLETE_MARKER]
+        self.delete(*keys, index)
 
     def get_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         """Retrieve all values corresponding to the set of input keys and return them as a
         dictionary. Note that if a key does not exist in redis it will be returned as None
         """
+        if not keys:
+            return {}
         values = self.mget(keys)
         return {x[0]: x[1] for x in zip(keys, values)}
 
-    def set_encoded_object(self, key: str, obj: Any) -> Optional[bool]:
+    def set_encoded_object(
+        self, key: str, obj: Any, index: Optional[str] = None
+    ) -> Optional[bool]:
         """Set an object in redis in an encoded form. This object should be retrieved via
         get_objects_by_prefix or processed with decode_obj."""
-        return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
+        return self.set_with_autoexpire(
+            f"EN_{key}", FidesopsRedis.encode_obj(obj), index=index
+        )
 
     def get_encoded_by_key(self, key: str) -> Optional[Any]:
         """Returns cached obj decoded from base64"""
@@ -121,6 +208,17 @@ class FidesopsRedis(Redis):
         """Return all objects stored under a given prefix. This method
         assumes these objects have been stored encoded using set_object"""
         keys = self.get_keys_by_prefix(f"EN_{prefix}")
+        return self._get_encoded_objects(keys)
+
+    def get_encoded_objects_by_index(
+        self, index: str, prefix: str
+    ) -> Dict[str, Optional[Any]]:
+        """Return all objects in an index stored under a given prefix. This method
+        assumes these objects have been stored encoded using set_encoded_object"""
+        keys = self.get_keys_by_index(index, f"EN_{prefix}")
+        return self._get_encoded_objects(keys)
+
+    def _get_encoded_objects(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         encoded_object_dict = self.get_values(keys)
         return {
             key: FidesopsRedis.decode_obj(value)
@@ -129,15 +227,28 @@ class FidesopsRedis(Redis):
 
     @staticmethod
     def encode_obj(obj: Any) -> bytes:
-        """Encode an object to a JSON string that can be stored in Redis"""
-        return json.dumps(obj, cls=CustomJSONEncoder)  # type: ignore
+        """Encode an object to a JSON string that can be stored in Redis.
+
+        JSON longer than `redis.compression_threshold` is compressed."""
+        encoded = json.dumps(obj, cls=CustomJSONEncoder)
+        threshold = CONFIG.redis.compression_threshold
+        if threshold and len(encoded) > threshold:
+            compressed = zlib.compress(encoded.encode(CONFIG.redis.charset), 1)
+            return f"{COMPRESSED_OBJECT_PREFIX}{b64encode(compressed).decode()}"  # type: ignore
+        return encoded  # type: ignore
 
     @staticmethod
     def decode_obj(bs: Optional[str]) -> Optional[Dict[str, Any]]:
-        """Decode an object from its JSON.
+        """Decode an object from its JSON, decompressing it first if it was compressed.
 
         Since Redis may not contain a value
         for a given key it's possible we may try to decode an empty object."""
+        if isinstance(bs, bytes):
+            bs = bs.decode(CONFIG.redis.charset)
+        if bs and bs.startswith(COMPRESSED_OBJECT_PREFIX):
+            bs = zlib.decompress(b64decode(bs[len(COMPRESSED_OBJECT_PREFIX) :])).decode(
+                CONFIG.redis.charset
+            )
         if bs:
             try:
                 result = json.loads(bs, object_hook=_custom_decoder)
@@ -157,8 +268,11 @@ class FidesopsRedis(Redis):
         return None
 
 
-def get_cache() -> FidesopsRedis:
-    """Return a singleton connection to our Redis cache"""
+def get_cache_connection() -> FidesopsRedis:
+    """Return a singleton connection to our Redis cache, without testing it.
+
+    Commands sent on it raise a RedisError if Redis can't be reached.
+    """
     global _connection  # pylint: disable=W0603
     if _connection is None:
         logger.debug("Creating new Redis connection...")
@@ -175,10 +289,16 @@ def get_cache() -> FidesopsRedis:
             ssl_cert_reqs=CONFIG.redis.ssl_cert_reqs,
         )
         logger.debug("New Redis connection created.")
+    return _connection
+
+
+def get_cache() -> FidesopsRedis:
+    """Return a singleton connection to our Redis cache"""
+    connection = get_cache_connection()
 
     logger.debug("Testing Redis connection...")
     try:
-        connected = _connection.ping()
+        connected = connection.ping()
     except ConnectionErrorFromRedis:
         connected = False
     else:
@@ -190,7 +310,7 @@ def get_cache() -> FidesopsRedis:
             "Unable to establish Redis connection. Fidesops is unable to accept PrivacyRequsts."
         )
 
-    return _connection
+    return connection
 
 
 def get_identity_cache_key(privacy_request_id: str, identity_attribute: str) -> str:
@@ -220,12 +340,26 @@ def get_masking_secret_cache_key(
     )
 
 
+def get_privacy_request_index_key(privacy_request_id: str) -> str:
+    """Return the key of the set indexing all keys cached for this PrivacyRequest"""
+    return f"id-{privacy_request_id}-index"
+
+
 def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> List[Any]:
-    """Returns all cache keys related to this privacy request's cached identities"""
+    """Returns all cache keys related to this privacy request, including its index.
+
+    If the privacy request's index is not complete, only the keys of its cached
+    identities and other request details are found, by scanning the keyspace.
+    """
     cache: FidesopsRedis = get_cache()
-    return cache.keys(f"{privacy_request_id}-*") + cache.keys(
-        f"id-{privacy_request_id}-*"
-    )
+    index = get_privacy_request_index_key(privacy_request_id)
+    if cache.is_index_complete(index):
+        return [
+            key for key in cache.smembers(index) if key != INDEX_COMPLETE_MARKER
+        ] + [index]
+    return cache.get_keys_by_prefix(
+        f"{privacy_request_id}-"
+    ) + cache.get_keys_by_prefix(f"id-{privacy_request_id}-")
 
 
 def get_async_task_tracking_cache_key(privacy_request_id: str) -> str:
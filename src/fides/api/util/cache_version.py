@@ -0,0 +1,118 @@
+from itertools import chain
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Optional, Tuple, Type
+
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session  # type: ignore[attr-defined]
+
+from fides.api.util.cache import get_cache_connection
+from fides.core.config import CONFIG
+
+
+class CacheVersion:
+    """
+    A version of the records of the given models, shared by all processes through a
+    counter in Redis, which is bumped whenever a session commits a change to any of
+    them. Data kept in memory is stored with the version it was built from, and is
+    outdated once the version changes.
+
+    The version is read from Redis at most every `redis.version_check_interval_seconds`,
+    without testing the connection first. If Redis can't be reached, the version is
+    None and in-memory data shouldn't be used.
+
+    Sessions are watched for changes to the models with ORM events, including inserts,
+    updates and deletes run as statements. A session with uncommitted changes is
+    flagged (see `changed_in`), and the version is bumped once they are committed.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        models: Tuple[Type, ...],
+        on_invalidate: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.key = key
+        self.models = models
+        self.tables = tuple(model.__table__ for model in models)
+        # Session.info flag set when a session changes one of the models
+        self.session_flag = f"{key}_changed"
+        self.on_invalidate = on_invalidate
+        self._lock = Lock()
+        # The version last read from Redis, and the monotonic time it was read at
+        self._read: Optional[Tuple[float, Optional[str]]] = None
+
+        event.listen(Session, "before_flush", self.track_changes)
+        event.listen(Session, "do_orm_execute", self.track_statements)
+        event.listen(Session, "after_commit", self.changes_committed)
+        event.listen(Session, "after_rollback", self.changes_rolled_back)
+
+    def get(self) -> Optional[str]:
+        """The current version, or None if Redis can't be reached"""
+        with self._lock:
+            read = self._read
+        if (
+            read is not None
+            and monotonic() - read[0] < CONFIG.redis.version_check_interval_seconds
+        ):
+            return read[1]
+
+        version: Optional[str]
+        try:
+            version = get_cache_connection().get(self.key) or "0"
+        except RedisError as exc:
+            logger.warning("Unable to read {} from Redis: {}", self.key, exc)
+            version = None
+        with self._lock:
+            self._read = (monotonic(), version)
+        return version
+
+    def invalidate(self) -> None:
+        """Bump the version, so every process discards the data built from the
+        previous one"""
+        with self._lock:
+            self._read = None
+        if self.on_invalidate:
+            self.on_invalidate()
+        try:
+            get_cache_connection().incr(self.key)
+        except RedisError as exc:
+            logger.warning("Unable to bump {} in Redis: {}", self.key, exc)
+
+    def changed_in(self, session: Session) -> bool:
+        """Whether the session has uncommitted changes to the models"""
+        return bool(session.info.get(self.session_flag))
+
+    def track_changes(self, session: Session, _: Any, __: Any) -> None:
+        """Flag sessions that change a record of the models"""
+        if any(
+            isinstance(instance, self.models)
+            for instance in chain(session.new, session.dirty, session.deleted)
+        ):
+            session.info[self.session_flag] = True
+
+    def track_statements(self, orm_execute_state: ORMExecuteState) -> None:
+        """Flag sessions that insert, update or delete records of the models with
+        statements"""
+        if not (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            return
+        bind_mapper = orm_execute_state.bind_mapper
+        if (
+            bind_mapper is not None and issubclass(bind_mapper.class_, self.models)
+        ) or (getattr(orm_execute_state.statement, "table", None) in self.tables):
+            orm_execute_state.session.info[self.session_flag] = True
+
+    def changes_committed(self, session: Session) -> None:
+        """Bump the version once a change is committed"""
+        if session.info.pop(self.session_flag, False):
+            self.invalidate()
+
+    def changes_rolled_back(self, session: Session) -> None:
+        """Forget about changes that were rolled back"""
+        session.info.pop(self.session_flag, None)
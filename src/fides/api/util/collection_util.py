@@ -1,5 +1,5 @@
 from functools import reduce
-from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -52,3 +52,12 @@ def filter_nonempty_values(d: Optional[Dict[Any, Any]]) -> Dict[Any, Any]:
     if d:
         return {e[0]: e[1] for e in d.items() if e[1]}
     return {}
+
+
+def chunks(values: List[T], size: int) -> Iterator[List[T]]:
+    """Split a list into consecutive lists of at most `size` elements.
+
+    list(chunks([1, 2, 3, 4, 5], 2)) => [[1, 2], [3, 4], [5]]
+    """
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
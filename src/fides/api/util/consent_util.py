@@ -215,10 +215,7 @@ def get_fides_user_device_id_provided_identity(
         db=db,
         conditions=(
             (ProvidedIdentity.field_name == ProvidedIdentityType.fides_user_device_id)
-            & (
-                ProvidedIdentity.hashed_value
-                == ProvidedIdentity.hash_value(fides_user_device_id)
-            )
+            & ProvidedIdentity.value_matches(db, fides_user_device_id)
             & (ProvidedIdentity.privacy_request_id.is_(None))
         ),
     ).first()
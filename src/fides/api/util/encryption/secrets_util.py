@@ -1,5 +1,6 @@
 import secrets
-from typing import Dict, List, Optional, TypeVar
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from loguru import logger
 
@@ -8,10 +9,16 @@ from fides.api.schemas.masking.masking_secrets import (
     MaskingSecretMeta,
     SecretType,
 )
-from fides.api.util.cache import get_cache, get_masking_secret_cache_key
+from fides.api.util.cache import FidesopsRedis, get_cache, get_masking_secret_cache_key
 
 T = TypeVar("T")
 
+# Masking secrets of the privacy requests currently being processed by this worker,
+# keyed by privacy request id, then by masking strategy and secret type. Only requests
+# registered through SecretsUtil.prefetch_masking_secrets are held here.
+_request_secrets_lock = Lock()
+_request_secrets: Dict[str, Dict[Tuple[str, SecretType], Any]] = {}
+
 
 class SecretsUtil:
     @staticmethod
@@ -43,13 +50,66 @@ class SecretsUtil:
         secret_type: SecretType,
         masking_secret_meta: MaskingSecretMeta[T],
     ) -> Optional[T]:
+        secret_key = (masking_secret_meta.masking_strategy, secret_type)
+        with _request_secrets_lock:
+            request_secrets = _request_secrets.get(privacy_request_id)
+            if request_secrets is not None and secret_key in request_secrets:
+                return request_secrets[secret_key]
+
         cache = get_cache()
         masking_secret_cache_key: str = get_masking_secret_cache_key(
             privacy_request_id=privacy_request_id,
             masking_strategy=masking_secret_meta.masking_strategy,
             secret_type=secret_type,
         )
-        return cache.get_encoded_by_key(masking_secret_cache_key)
+        secret = cache.get_encoded_by_key(masking_secret_cache_key)
+        if secret is not None and request_secrets is not None:
+            with _request_secrets_lock:
+                if privacy_request_id in _request_secrets:
+                    _request_secrets[privacy_request_id][secret_key] = secret
+        return secret
+
+    @staticmethod
+    def prefetch_masking_secrets(
+        privacy_request_id: str, masking_strategies: Iterable[str]
+    ) -> None:
+        """Load all cached secrets of the given masking strategies for a privacy request
+        with a single round trip to Redis, and hold them in memory until
+        clear_masking_secrets is called for the request.
+
+        A masking strategy looks its secrets up once each time it masks the values of
+        a field, so without this every masked field of every collection would make its
+        own trip to Redis for secrets that are the same across the whole request.
+        """
+        secret_keys: List[Tuple[str, SecretType]] = [
+            (masking_strategy, secret_type)
+            for masking_strategy in sorted(set(masking_strategies))
+            for secret_type in SecretType
+        ]
+        request_secrets: Dict[Tuple[str, SecretType], Any] = {}
+        if secret_keys:
+            cache_keys: List[str] = [
+                get_masking_secret_cache_key(
+                    privacy_request_id=privacy_request_id,
+                    masking_strategy=masking_strategy,
+                    secret_type=secret_type,
+                )
+                for masking_strategy, secret_type in secret_keys
+            ]
+            cached_values = get_cache().get_values(cache_keys)
+            for secret_key, cache_key in zip(secret_keys, cache_keys):
+                secret = FidesopsRedis.decode_obj(cached_values[cache_key])
+                if secret is not None:
+                    request_secrets[secret_key] = secret
+
+        with _request_secrets_lock:
+            _request_secrets[privacy_request_id] = request_secrets
+
+    @staticmethod
+    def clear_masking_secrets(privacy_request_id: str) -> None:
+        """Drop the in-memory masking secrets held for a privacy request"""
+        with _request_secrets_lock:
+            _request_secrets.pop(privacy_request_id, None)
 
     @staticmethod
     def generate_secret_string(length: int) -> str:
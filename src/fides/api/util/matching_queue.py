@@ -1,23 +1,41 @@
 from __future__ import annotations
 
-from typing import Callable, Generic, Optional, TypeVar
+import heapq
+from collections import Counter, defaultdict
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
 
 class MatchingQueue(Generic[T]):
-    """A basic LILO queue with the added ability to pop not only the head, but the first value matching a given input function."""
+    """A basic LILO queue with the added ability to pop not only the head, but the first value matching a given input function.
+
+    Values must be hashable, so that membership checks don't require a scan of the queue.
+    """
 
     def __init__(self, *values: T):
         self.data = list(values)
+        self._counts: Counter[T] = Counter(self.data)
 
     def push(self, t: T) -> None:
         """insert into the queue"""
         self.data.append(t)
+        self._counts[t] += 1
 
     def push_if_new(self, t: T) -> None:
         """insert into the queue only if this value is not already in the queue."""
-        if t not in self.data:
+        if t not in self._counts:
             self.push(t)
 
     def pop(self) -> Optional[T]:
@@ -25,6 +43,7 @@ class MatchingQueue(Generic[T]):
         if self.data:
             v = self.data[0]
             del self.data[0]
+            self._discard(v)
             return v
         return None
 
@@ -33,6 +52,7 @@ class MatchingQueue(Generic[T]):
         for idx, val in enumerate(self.data):
             if fn(val):
                 del self.data[idx]
+                self._discard(val)
                 return val
         # if no matching value exists, return None
         return None
@@ -41,5 +61,82 @@ class MatchingQueue(Generic[T]):
         """is the queue empty?"""
         return len(self.data) == 0
 
+    def _discard(self, t: T) -> None:
+        """Stop counting one occurrence of a value that has been removed from the queue"""
+        self._counts[t] -= 1
+        if not self._counts[t]:
+            del self._counts[t]
+
+    def __repr__(self) -> str:
+        return f"Queue {self.data}"
+
+
+class ReadyQueue(Generic[T]):
+    """A LILO queue of values that may have to wait for others before they can be popped.
+
+    Each value is pushed along with the keys it is waiting on, and can be popped once
+    all of them have been released. Popping returns the first value in insertion order
+    that isn't waiting on anything, like `MatchingQueue.pop_first_match` would with a
+    predicate that only ever turns from False to True, but without scanning the
+    values that are still waiting.
+
+    Values must be hashable, so that membership checks don't require a scan of the queue.
+    """
+
+    def __init__(self) -> None:
+        self._sequence = 0
+        # the values that can be popped, ordered by the time they were pushed
+        self._ready: List[Tuple[int, T]] = []
+        # the values still waiting, with the keys each of them is waiting on
+        self._waiting: Dict[int, Tuple[T, Set[Hashable]]] = {}
+        self._waiting_by_key: Dict[Hashable, Set[int]] = defaultdict(set)
+        self._counts: Counter[T] = Counter()
+
+    @property
+    def data(self) -> List[T]:
+        """The values in the queue, in insertion order"""
+        entries = self._ready + [(seq, v) for seq, (v, _) in self._waiting.items()]
+        return [v for _, v in sorted(entries, key=lambda entry: entry[0])]
+
+    def push(self, t: T, waiting_on: Iterable[Hashable] = ()) -> None:
+        """insert into the queue, to be popped once every key in waiting_on is released"""
+        self._sequence += 1
+        keys = set(waiting_on)
+        if keys:
+            self._waiting[self._sequence] = (t, keys)
+            for key in keys:
+                self._waiting_by_key[key].add(self._sequence)
+        else:
+            heapq.heappush(self._ready, (self._sequence, t))
+        self._counts[t] += 1
+
+    def push_if_new(self, t: T, waiting_on: Iterable[Hashable] = ()) -> None:
+        """insert into the queue only if this value is not already in the queue."""
+        if t not in self._counts:
+            self.push(t, waiting_on)
+
+    def release(self, key: Hashable) -> None:
+        """Stop the values waiting on the given key from waiting on it"""
+        for seq in self._waiting_by_key.pop(key, ()):
+            t, waiting_on = self._waiting[seq]
+            waiting_on.discard(key)
+            if not waiting_on:
+                del self._waiting[seq]
+                heapq.heappush(self._ready, (seq, t))
+
+    def pop(self) -> Optional[T]:
+        """return the first value that isn't waiting on anything, or None if there is none."""
+        if not self._ready:
+            return None
+        _, t = heapq.heappop(self._ready)
+        self._counts[t] -= 1
+        if not self._counts[t]:
+            del self._counts[t]
+        return t
+
+    def is_empty(self) -> bool:
+        """is the queue empty?"""
+        return not self._ready and not self._waiting
+
     def __repr__(self) -> str:
         return f"Queue {self.data}"
@@ -0,0 +1,150 @@
+from collections import OrderedDict
+from copy import copy
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import (  # type: ignore[attr-defined]
+    Session,
+    make_transient_to_detached,
+)
+
+from fides.api.models.client import ClientDetail
+from fides.api.models.fides_user_permissions import FidesUserPermissions
+from fides.api.util.cache_version import CacheVersion
+from fides.core.config import CONFIG
+
+V = TypeVar("V")
+
+
+class ExpiringLRUCache(Generic[V]):
+    """
+    A thread-safe, least recently used cache whose entries expire after
+    `security.oauth_cache_ttl_seconds`, holding at most `security.oauth_cache_size`
+    entries. Caching is disabled when either is 0.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+
+    @staticmethod
+    def enabled() -> bool:
+        return (
+            CONFIG.security.oauth_cache_size > 0
+            and CONFIG.security.oauth_cache_ttl_seconds > 0
+        )
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        if not self.enabled():
+            return
+        with self._lock:
+            self._entries[key] = (
+                monotonic() + CONFIG.security.oauth_cache_ttl_seconds,
+                value,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > CONFIG.security.oauth_cache_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Decrypted claims of the API tokens recently seen, keyed by a digest of the token
+_token_data: ExpiringLRUCache[Dict[str, Any]] = ExpiringLRUCache()
+# Column values of the clients recently authenticated, stored with the version of the
+# clients they were loaded at
+_clients: ExpiringLRUCache[Tuple[str, Dict[str, Any]]] = ExpiringLRUCache()
+
+
+def _token_digest(token: str) -> str:
+    return sha256(token.encode(CONFIG.security.encoding)).hexdigest()
+
+
+def get_cached_token_data(token: str) -> Optional[Dict[str, Any]]:
+    """The decrypted claims of the given API token, if it was recently decrypted"""
+    token_data = _token_data.get(_token_digest(token))
+    return dict(token_data) if token_data is not None else None
+
+
+def cache_token_data(token: str, token_data: Dict[str, Any]) -> None:
+    """
+    Keep the decrypted claims of a valid API token. Claims can't change without changing
+    the token, so they don't need to be invalidated, but whether the token expired is
+    still checked on every request.
+    """
+    _token_data.set(_token_digest(token), dict(token_data))
+
+
+# The version of the clients, shared by all webservers through Redis and bumped every
+# time a client or a user's permissions change. If Redis can't be reached, clients
+# aren't cached.
+oauth_client_version = CacheVersion(
+    "oauth_client_version",
+    (ClientDetail, FidesUserPermissions),
+    on_invalidate=_clients.clear,
+)
+
+
+def invalidate_oauth_clients() -> None:
+    """Discard the clients cached by every webserver"""
+    oauth_client_version.invalidate()
+
+
+def load_client(db: Session, client_id: str) -> Optional[ClientDetail]:
+    """
+    The client with the given id, attached to the given session.
+
+    Clients are reused until they expire from the cache or a client or user's
+    permissions change on any webserver. A cached client is merged into the session
+    without a query, so its relationships can still be loaded. Sessions that already
+    hold the client, or have uncommitted changes to clients, don't use the cache.
+    """
+    version = oauth_client_version.get() if _clients.enabled() else None
+    if (
+        version is None
+        or oauth_client_version.changed_in(db)
+        or db.identity_key(ClientDetail, client_id) in db.identity_map
+    ):
+        return ClientDetail.get(db, object_id=client_id, config=CONFIG)
+
+    cached = _clients.get(client_id)
+    if cached and cached[0] == version:
+        cached_client = ClientDetail(
+            **{
+                key: list(value) if isinstance(value, list) else value
+                for key, value in cached[1].items()
+            }
+        )
+        make_transient_to_detached(cached_client)
+        return db.merge(cached_client, load=False)
+
+    client = ClientDetail.get(db, object_id=client_id, config=CONFIG)
+    if client:
+        _clients.set(
+            client_id,
+            (
+                version,
+                {
+                    attribute.key: copy(getattr(client, attribute.key))
+                    for attribute in inspect(ClientDetail).column_attrs
+                },
+            ),
+        )
+    return client
@@ -0,0 +1,173 @@
+import json
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from fides.api.models.privacy_experience import (
+    ComponentType,
+    PrivacyExperience,
+    PrivacyExperienceConfig,
+)
+from fides.api.models.privacy_notice import PrivacyNotice, PrivacyNoticeRegion
+from fides.api.models.privacy_preference import CurrentPrivacyPreference
+from fides.api.models.privacy_request import ProvidedIdentity
+from fides.api.schemas.privacy_experience import PrivacyExperienceResponse
+from fides.api.util.cache_version import CacheVersion
+
+SnapshotKey = Tuple[Optional[bool], Optional[str], Optional[str], Optional[bool]]
+
+_lock = Lock()
+# Serialized privacy experiences, without any user's preferences, keyed by the filters
+# they were queried with. Each snapshot is stored with the version of the privacy
+# experiences it was built from.
+_snapshots: Dict[SnapshotKey, Tuple[str, List[Dict[str, Any]]]] = {}
+
+
+def _clear_snapshots() -> None:
+    with _lock:
+        _snapshots.clear()
+
+
+# The version of the privacy experiences, shared by all webservers through Redis and
+# bumped every time a privacy experience, experience config or notice changes. If
+# Redis can't be reached, snapshots aren't used.
+privacy_experience_version = CacheVersion(
+    "privacy_experience_version",
+    (PrivacyExperience, PrivacyExperienceConfig, PrivacyNotice),
+    on_invalidate=_clear_snapshots,
+)
+
+
+def invalidate_privacy_experience_snapshots() -> None:
+    """Discard the privacy experience snapshots of every webserver"""
+    privacy_experience_version.invalidate()
+
+
+def build_privacy_experience_snapshot(
+    db: Session,
+    show_disabled: Optional[bool] = True,
+    region: Optional[PrivacyNoticeRegion] = None,
+    component: Optional[ComponentType] = None,
+    has_config: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """Query the privacy experiences matching the given filters, along with their
+    relevant privacy notices, and serialize them for a response"""
+    experience_query = db.query(PrivacyExperience)
+
+    if show_disabled is False:
+        # This field is actually stored on the PrivacyExperienceConfig.  This is a useful filter in that
+        # it forces the ExperienceConfig to exist, and it has to be enabled.
+        experience_query = experience_query.join(
+            PrivacyExperienceConfig,
+            PrivacyExperienceConfig.id == PrivacyExperience.experience_config_id,
+        ).filter(PrivacyExperienceConfig.disabled.is_(False))
+
+    if region is not None:
+        experience_query = experience_query.filter(PrivacyExperience.region == region)
+    if component is not None:
+        experience_query = experience_query.filter(
+            PrivacyExperience.component == component
+        )
+    if has_config is True:
+        experience_query = experience_query.filter(
+            PrivacyExperience.experience_config_id.isnot(None)
+        )
+    if has_config is False:
+        experience_query = experience_query.filter(
+            PrivacyExperience.experience_config_id.is_(None)
+        )
+
+    snapshot: List[Dict[str, Any]] = []
+    for privacy_experience in experience_query.order_by(
+        PrivacyExperience.created_at.desc()
+    ):
+        # Temporarily save privacy notices on the privacy experience object
+        privacy_experience.privacy_notices = (
+            privacy_experience.get_related_privacy_notices(db, show_disabled)
+        )
+        # Temporarily save "show_banner" on the privacy experience object
+        privacy_experience.show_banner = privacy_experience.get_should_show_banner(
+            db, show_disabled
+        )
+        snapshot.append(
+            json.loads(PrivacyExperienceResponse.from_orm(privacy_experience).json())
+        )
+    return snapshot
+
+
+def get_privacy_experience_snapshot(
+    db: Session,
+    show_disabled: Optional[bool] = True,
+    region: Optional[PrivacyNoticeRegion] = None,
+    component: Optional[ComponentType] = None,
+    has_config: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Serialized privacy experiences matching the given filters, reused until a privacy
+    experience, experience config or notice changes on any webserver.
+
+    The snapshot is shared between requests and must not be modified.
+    """
+    key: SnapshotKey = (
+        show_disabled is not False,
+        region.value if region else None,
+        component.value if component else None,
+        has_config,
+    )
+    version = privacy_experience_version.get()
+    if version is not None:
+        with _lock:
+            cached = _snapshots.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+
+    snapshot = build_privacy_experience_snapshot(
+        db, show_disabled, region, component, has_config
+    )
+    if version is not None:
+        with _lock:
+            _snapshots[key] = (version, snapshot)
+    return snapshot
+
+
+def add_user_preferences(
+    db: Session,
+    experiences: List[Dict[str, Any]],
+    fides_user_provided_identity: ProvidedIdentity,
+) -> List[Dict[str, Any]]:
+    """
+    Copies of the given serialized privacy experiences, with the preferences saved by
+    the given fides user device on each notice, loaded with a single query.
+    """
+    saved_preferences: Dict[str, Tuple[str, str]] = {
+        privacy_notice_id: (preference.value, privacy_notice_history_id)
+        for privacy_notice_id, preference, privacy_notice_history_id in db.query(
+            CurrentPrivacyPreference.privacy_notice_id,
+            CurrentPrivacyPreference.preference,
+            CurrentPrivacyPreference.privacy_notice_history_id,
+        ).filter(
+            CurrentPrivacyPreference.fides_user_device_provided_identity_id
+            == fides_user_provided_identity.id
+        )
+    }
+    if not saved_preferences:
+        return experiences
+
+    results: List[Dict[str, Any]] = []
+    for experience in experiences:
+        notices: List[Dict[str, Any]] = []
+        for notice in experience.get("privacy_notices") or []:
+            saved_preference = saved_preferences.get(notice["id"])
+            if saved_preference:
+                preference, privacy_notice_history_id = saved_preference
+                notice = dict(notice)
+                if privacy_notice_history_id == notice["privacy_notice_history_id"]:
+                    notice["current_preference"] = preference
+                    notice["outdated_preference"] = None
+                else:
+                    notice["current_preference"] = None
+                    notice["outdated_preference"] = preference
+            notices.append(notice)
+        results.append({**experience, "privacy_notices": notices})
+    return results
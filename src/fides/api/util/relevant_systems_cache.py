@@ -0,0 +1,89 @@
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fideslang.validation import FidesKey
+from sqlalchemy.orm import Session
+
+from fides.api.ctl.sql_models import (  # type: ignore[attr-defined]
+    PrivacyDeclaration,
+    System,
+)
+from fides.api.models.privacy_notice import (
+    EnforcementLevel,
+    PrivacyNoticeHistory,
+    get_system_data_uses,
+)
+from fides.api.util.cache_version import CacheVersion
+
+_lock = Lock()
+# The relevant systems of each privacy notice history, stored with the version of the
+# systems they were calculated from. Privacy notice histories don't change, so only a
+# change to the systems or their data uses makes them outdated.
+_relevant_systems: Dict[str, Tuple[str, List[FidesKey]]] = {}
+
+
+def _clear_relevant_systems() -> None:
+    with _lock:
+        _relevant_systems.clear()
+
+
+# The version of the systems' data uses, shared by all webservers through Redis and
+# bumped every time a system or privacy declaration changes, including through the
+# statements the generic ctl resource endpoints run. If Redis can't be reached,
+# relevant systems aren't cached.
+relevant_systems_version = CacheVersion(
+    "relevant_systems_version",
+    (System, PrivacyDeclaration),
+    on_invalidate=_clear_relevant_systems,
+)
+
+
+def invalidate_relevant_systems() -> None:
+    """Discard the relevant systems cached by every webserver"""
+    relevant_systems_version.invalidate()
+
+
+def get_relevant_systems(
+    db: Session, privacy_notice_histories: Iterable[PrivacyNoticeHistory]
+) -> Dict[str, List[FidesKey]]:
+    """
+    The relevant systems of each of the given privacy notice histories, keyed by privacy
+    notice history id.
+
+    Relevant systems are reused until a system or privacy declaration changes on any
+    webserver, and the ones that aren't cached are calculated with a single query.
+    """
+    version = relevant_systems_version.get()
+    relevant_systems: Dict[str, List[FidesKey]] = {}
+    missing: List[PrivacyNoticeHistory] = []
+    with _lock:
+        for privacy_notice_history in privacy_notice_histories:
+            cached = _relevant_systems.get(privacy_notice_history.id)
+            if version is not None and cached and cached[0] == version:
+                relevant_systems[privacy_notice_history.id] = list(cached[1])
+            else:
+                missing.append(privacy_notice_history)
+
+    if not missing:
+        return relevant_systems
+
+    system_data_uses = (
+        get_system_data_uses(db)
+        if any(
+            privacy_notice_history.enforcement_level == EnforcementLevel.system_wide
+            for privacy_notice_history in missing
+        )
+        else {}
+    )
+    calculated = {
+        privacy_notice_history.id: privacy_notice_history.calculate_relevant_systems(
+            db, system_data_uses
+        )
+        for privacy_notice_history in missing
+    }
+    if version is not None:
+        with _lock:
+            for privacy_notice_history_id, systems in calculated.items():
+                _relevant_systems[privacy_notice_history_id] = (version, list(systems))
+    relevant_systems.update(calculated)
+    return relevant_systems
@@ -104,7 +104,9 @@ def generate_dataset_bigquery(
         credentials_id=credentials_id,
     )
 
-    bigquery_datasets = _dataset.generate_bigquery_datasets(bigquery_config)
+    bigquery_datasets = _dataset.generate_bigquery_datasets(
+        bigquery_config, show_progress=True
+    )
 
     _dataset.write_dataset_manifest(
         file_name=output_filename, include_null=include_null, datasets=bigquery_datasets
@@ -1,5 +1,5 @@
 """A wrapper to make calling the API consistent across fides."""
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 import requests
 
@@ -28,6 +28,16 @@ def get(
     return requests.get(resource_url, headers=headers)
 
 
+def bulk_get(
+    url: str, resource_type: str, resource_ids: Iterable[str], headers: Dict[str, str]
+) -> requests.Response:
+    """
+    Get the resources of a certain type with any of the given ids.
+    """
+    resource_url = generate_resource_url(url, resource_type) + "bulk-get"
+    return requests.post(resource_url, headers=headers, json=list(resource_ids))
+
+
 def create(
     url: str, resource_type: str, json_resource: str, headers: Dict[str, str]
 ) -> requests.Response:
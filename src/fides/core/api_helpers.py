@@ -2,7 +2,8 @@
 Reusable utilities meant to make repetitive api-related tasks easier.
 """
 
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union, cast
 
 from fideslang import FidesModel
 from fideslang.parse import parse_dict
@@ -11,6 +12,10 @@ from requests import Response
 
 from fides.common.utils import check_response_auth
 from fides.core import api
+from fides.core.config import CONFIG
+
+# Servers without the bulk endpoint match its path with the `/{fides_key}` routes
+BULK_GET_UNSUPPORTED_STATUS_CODES = (404, 405)
 
 
 def get_server_resources(
@@ -23,22 +28,95 @@ def get_server_resources(
     Get a list of resources from the server that match the provided keys.
 
     If the resource does not exist on the server, an error will _not_ be thrown.
-    Instead, an empty object will be stored and then filtered out.
+    Instead, it is left out of the list.
+    """
+    return [
+        parse_dict(
+            resource_type=resource_type,
+            resource=resource_dict,
+            from_server=True,
+        )
+        for resource_dict in get_raw_server_resources(
+            url=url,
+            resource_type=resource_type,
+            existing_keys=existing_keys,
+            headers=headers,
+        )
+    ]
+
+
+def get_raw_server_resources(
+    url: str,
+    resource_type: str,
+    existing_keys: List[FidesKey],
+    headers: Dict[str, str],
+) -> List[Dict]:
+    """
+    Get the dictionaries of the resources from the server that match the provided keys.
+
+    The resources are fetched with a single request, falling back to concurrent
+    requests for each key against servers that don't have the bulk endpoint.
     """
-    server_resources: List[FidesModel] = list(
-        filter(
-            None,
-            [
-                get_server_resource(
-                    url=url,
-                    resource_type=resource_type,
-                    resource_key=key,
-                    headers=headers,
-                )
-                for key in existing_keys
-            ],
+    if not existing_keys:
+        return []
+
+    raw_server_response: Response = check_response_auth(
+        api.bulk_get(
+            url=url,
+            resource_type=resource_type,
+            resource_ids=existing_keys,
+            headers=headers,
         )
     )
+    if raw_server_response.status_code in BULK_GET_UNSUPPORTED_STATUS_CODES:
+        return get_raw_server_resources_concurrently(
+            url=url,
+            resource_type=resource_type,
+            existing_keys=existing_keys,
+            headers=headers,
+        )
+
+    server_resources: List[Dict] = (
+        raw_server_response.json()
+        if raw_server_response.status_code >= 200
+        and raw_server_response.status_code <= 299
+        else []
+    )
+    return server_resources
+
+
+def get_raw_server_resources_concurrently(
+    url: str,
+    resource_type: str,
+    existing_keys: List[FidesKey],
+    headers: Dict[str, str],
+) -> List[Dict]:
+    """
+    Get the dictionaries of the resources from the server that match the provided
+    keys, with a request for each key, sending up to `cli.max_concurrent_requests`
+    at once.
+    """
+    with ThreadPoolExecutor(
+        max_workers=min(CONFIG.cli.max_concurrent_requests, len(existing_keys))
+    ) as executor:
+        server_resources: List[Dict] = list(
+            filter(
+                None,
+                executor.map(
+                    lambda key: cast(
+                        Dict,
+                        get_server_resource(
+                            url=url,
+                            resource_type=resource_type,
+                            resource_key=key,
+                            headers=headers,
+                            raw=True,
+                        ),
+                    ),
+                    existing_keys,
+                ),
+            )
+        )
     return server_resources
 
 
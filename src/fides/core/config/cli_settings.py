@@ -21,6 +21,11 @@ class CLISettings(FidesSettings):
         default=False,
         description="When set to True, disables functionality that requires making calls to a Fides webserver.",
     )
+    max_concurrent_requests: int = Field(
+        default=10,
+        ge=1,
+        description="The maximum number of requests sent to the Fides webserver at once when fetching resources one by one from servers without the bulk endpoints.",
+    )
     server_protocol: str = Field(
         default="http", description="The protocol used by the Fides webserver."
     )
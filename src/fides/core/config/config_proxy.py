@@ -79,6 +79,7 @@ class ConfigProxy:
     Lookups (i.e. attribute access) with the `ConfigProxy` do leverage
     the underlying ORM model, but any db calls that are needed should be straightforward -
     it leverages only a fixed single-row table holding the config state.
+    That row is cached in memory until it changes, so most lookups don't query the db.
     """
 
     def __init__(self, db: Session) -> None:
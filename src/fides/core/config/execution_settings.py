@@ -8,6 +8,25 @@ ENV_PREFIX = "FIDES__EXECUTION__"
 class ExecutionSettings(FidesSettings):
     """Configuration settings for DSR execution."""
 
+    execution_log_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="The number of execution logs a privacy request collects before writing them to the application database at once. Logs are always written right away when a collection completes, is paused, skipped or fails, when a log is created after execution_log_flush_interval has passed since the oldest unwritten log, and when the privacy request finishes running its collections. A value of 1 writes each log as it is created. Because writing a log commits the privacy request's session, connections disabled while a request is running are only noticed by the request once its next batch of logs is written.",
+    )
+    execution_log_flush_interval: float = Field(
+        default=5.0,
+        gt=0,
+        description="When execution_log_batch_size is greater than 1, the number of seconds after which the unwritten execution logs are written along with the next log created. There is no timer: logs are only written when another log is created, so a collection's start may wait until that collection completes.",
+    )
+    execution_log_separate_session: bool = Field(
+        default=False,
+        description="Whether execution logs are written on a database session of their own, rather than on the session of the privacy request, so that writing them never commits or waits on the privacy request's transaction. Logs always use their own session when a privacy request runs on more than one worker (see task_max_workers).",
+    )
+    masking_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="The maximum number of rows masked by a single statement or bulk write during an erasure on a SQL, MongoDB or DynamoDB collection. Values above 1 mask SQL rows in one transaction, grouping rows that receive identical masked values into a single UPDATE, and use bulk writes for MongoDB and DynamoDB (at most 25 items per DynamoDB batch). A value of 1 masks each row with its own write.",
+    )
     masking_strict: bool = Field(
         default=True,
         description="If set to True, only use UPDATE requests to mask data. If False, Fides will use any defined DELETE or GDPR DELETE endpoints to remove PII, which may extend beyond the specific data categories that configured in your execution policy.",
@@ -16,10 +35,49 @@ class ExecutionSettings(FidesSettings):
         default=3600,
         description="The amount of time to wait for actions which delay privacy requests (e.g., pre- and post-processing webhooks).",
     )
+    rate_limit_lease_size: int = Field(
+        default=1,
+        ge=1,
+        description="The number of calls a worker reserves at once against the rate limits of a SaaS connection, handing them out to later requests without going back to Redis. Values above 1 save round trips to Redis for busy connections, at the cost of occasionally letting slightly more calls through than the limit allows.",
+    )
+    retrieval_batch_size: int = Field(
+        default=0,
+        ge=0,
+        description="The number of rows fetched at a time when retrieving data from a SQL or MongoDB collection. SQL rows are streamed from a server-side cursor where the database supports it. This bounds what the database driver buffers, the rows retrieved from a collection are still held in memory together. A value of 0 uses the default behavior of the database driver, which for most SQL databases loads all rows at once.",
+    )
+    retrieval_row_limit: int = Field(
+        default=0,
+        ge=0,
+        description="The maximum number of rows retrieved from a single SQL or MongoDB collection during a privacy request. A collection with more rows fails, along with the privacy request, rather than being processed incompletely. A value of 0 does not limit the number of rows.",
+    )
     require_manual_request_approval: bool = Field(
         default=False,
         description="Whether privacy requests require explicit approval to execute.",
     )
+    saas_request_max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="The number of threads used to send the independent read requests of a SaaS collection, for instance one for each identity. Pages of the same request are always fetched one after another, and the rate limits of the connection apply across all threads. Requests of connectors authenticating with OAuth2 or a custom authentication strategy, which may refresh their tokens, are always sent one at a time.",
+    )
+    sql_engine_reuse: bool = Field(
+        default=False,
+        description="Whether SQL connectors keep their connection pool open between privacy requests. The pool of a connection is replaced when its secrets change and closed when the connection is deleted.",
+    )
+    sql_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="The number of connections kept open in the connection pool of each SQL connection.",
+    )
+    sql_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="The number of connections a SQL connection pool may open beyond sql_pool_size when all of its connections are in use.",
+    )
+    sql_pool_recycle: int = Field(
+        default=-1,
+        ge=-1,
+        description="The number of seconds after which a pooled SQL connection is replaced with a new one. A value of -1 never replaces connections.",
+    )
     subject_identity_verification_required: bool = Field(
         default=False,
         description="Whether privacy requests require user identity verification.",
@@ -34,6 +92,16 @@ class ExecutionSettings(FidesSettings):
     task_retry_delay: int = Field(
         default=1, description="The delays between retries in seconds."
     )
+    task_max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="The number of threads used to run the collections of a single privacy request. Collections that do not depend on one another are run concurrently when this is greater than 1, except for privacy requests with a SaaS connection whose authentication may refresh its token, which run on a single thread.",
+    )
+    task_max_connection_concurrency: int = Field(
+        default=0,
+        ge=0,
+        description="The maximum number of collections belonging to the same connection that may run at once during a privacy request. A value of 0 only limits concurrency by task_max_workers.",
+    )
 
     class Config:
         env_prefix = ENV_PREFIX
@@ -15,6 +15,11 @@ class RedisSettings(FidesSettings):
         default="utf8",
         description="Character set to use for Redis, defaults to 'utf8'. Not recommended to change.",
     )
+    compression_threshold: int = Field(
+        default=0,
+        ge=0,
+        description="The size in bytes above which encoded objects, such as the results of each collection of a privacy request, are compressed before being stored in Redis. A value of 0 never compresses objects. Compressed objects can't be read by versions of the application that don't support compression.",
+    )
     db_index: int = Field(
         default=0,
         description="The application will use this index in the Redis cache to cache data.",
@@ -62,6 +67,11 @@ class RedisSettings(FidesSettings):
     user: str = Field(
         default="", description="The user with which to login to the Redis cache."
     )
+    version_check_interval_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        description="How long a process reuses the versions it read from Redis for data it keeps in memory, such as the application config, privacy experiences and API clients. Changes made by other processes may take this long to be seen. A value of 0 reads the version from Redis every time.",
+    )
 
     # This relies on other values to get built so must be last
     connection_url: Optional[str] = Field(
@@ -69,6 +69,16 @@ class SecuritySettings(FidesSettings):
         default=11520,
         description="The time in minutes for which Fides API tokens will be valid. Default value is equal to 8 days.",
     )
+    oauth_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        description="The maximum number of decrypted API tokens, and of API clients, each webserver keeps in memory to authenticate requests without querying the database. Set to 0 to disable caching.",
+    )
+    oauth_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="The number of seconds a webserver may reuse a decrypted API token or an API client before loading it again. Clients are also reloaded as soon as any client or user permissions change. Set to 0 to disable caching.",
+    )
     oauth_client_id_length_bytes: int = Field(
         default=16,
         description="Sets desired length in bytes of generated client id used for oauth.",
@@ -85,6 +95,11 @@ class SecuritySettings(FidesSettings):
         default=None,
         description="When using a parent/child Fides deployment, this username will be used by the child server to access the parent server.",
     )
+    public_request_cache_max_age: int = Field(
+        default=0,
+        ge=0,
+        description="The number of seconds browsers and CDNs may reuse cacheable responses of public endpoints, such as the privacy experience list, before revalidating them with their ETag.",
+    )
     public_request_rate_limit: str = Field(
         default="2000/minute",
         description="The number of requests from a single IP address allowed to hit a public endpoint within the specified time period",
@@ -126,6 +141,21 @@ class SecuritySettings(FidesSettings):
         default=False,
         description="Either enables the collection of audit log resource data or bypasses the middleware",
     )
+    audit_log_resource_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="The maximum number of audit log resource records written to the database at once.",
+    )
+    audit_log_resource_flush_interval_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="The maximum number of seconds audit log resource records wait in memory before being written to the database.",
+    )
+    audit_log_resource_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="The maximum number of audit log resource records each webserver keeps in memory waiting to be written. Records of requests received while the queue is full are dropped.",
+    )
 
     @validator("app_encryption_key")
     @classmethod
@@ -1,12 +1,13 @@
 """Module that adds functionality for generating or scanning datasets."""
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import sqlalchemy
 from fideslang import manifests
 from fideslang.models import Dataset, DatasetCollection, DatasetField
 from pydantic import AnyHttpUrl
 from sqlalchemy.engine import Engine
-from sqlalchemy.sql import text
+from sqlalchemy.sql import bindparam, text
 
 from fides.common.utils import echo_green, echo_red
 from fides.connectors.aws import (
@@ -29,6 +30,31 @@ SCHEMA_EXCLUSION = {
     "redshift": ["information_schema"],
 }
 
+# The table types listed in the information_schema for the tables the inspector of each
+# dialect would return. The tables and columns of the databases of these dialects are
+# read with a single query per schema instead of a query per table.
+INFORMATION_SCHEMA_TABLE_TYPES = {
+    "postgresql": ["BASE TABLE"],
+    "mysql": ["BASE TABLE"],
+    "mssql": ["BASE TABLE"],
+    "redshift": ["BASE TABLE"],
+    "snowflake": ["BASE TABLE", "TEMPORARY TABLE", "LOCAL TEMPORARY"],
+}
+
+INFORMATION_SCHEMA_COLUMNS_QUERY = text(
+    """
+    SELECT t.table_name, c.column_name
+    FROM information_schema.tables t
+    LEFT JOIN information_schema.columns c
+        ON c.table_schema = t.table_schema AND c.table_name = t.table_name
+    WHERE t.table_schema = :schema AND t.table_type IN :table_types
+    ORDER BY t.table_name, c.ordinal_position
+    """
+).bindparams(bindparam("table_types", expanding=True))
+
+# The number of schemas introspected at once
+SCHEMA_INTROSPECTION_WORKERS = 8
+
 
 def get_all_server_datasets(
     url: AnyHttpUrl, headers: Dict[str, str], exclude_datasets: List[Dataset]
@@ -61,25 +87,85 @@ def include_dataset_schema(schema: str, database_type: str) -> bool:
 
 
 def get_db_schemas(
-    engine: Engine,
+    engine: Engine, show_progress: bool = False
 ) -> Dict[str, Dict[str, List[str]]]:
     """
     Extract the schema, table and column names from a database given a sqlalchemy engine
+
+    The schemas are introspected concurrently, with a single information_schema query
+    per schema for the dialects that support it.
     """
-    if engine.dialect.name != "snowflake":
-        inspector = sqlalchemy.inspect(engine)
-        db_schemas: Dict[str, Dict[str, List]] = {}
-        for schema in inspector.get_schema_names():
-            if include_dataset_schema(schema=schema, database_type=engine.dialect.name):
-                db_schemas[schema] = {}
-                for table in inspector.get_table_names(schema=schema):
-                    db_schemas[schema][table] = [
-                        column["name"]
-                        for column in inspector.get_columns(table, schema=schema)
-                    ]
+    if engine.dialect.name == "snowflake":
+        schema_names = get_snowflake_schema_names(engine=engine)
     else:
-        db_schemas = get_snowflake_schemas(engine=engine)
-    return db_schemas
+        schema_names = sqlalchemy.inspect(engine).get_schema_names()
+    schemas = [
+        schema
+        for schema in schema_names
+        if include_dataset_schema(schema=schema, database_type=engine.dialect.name)
+    ]
+    if not schemas:
+        return {}
+
+    get_schema_tables: Callable[[Engine, str], Dict[str, List[str]]] = (
+        get_information_schema_tables
+        if engine.dialect.name in INFORMATION_SCHEMA_TABLE_TYPES
+        else get_inspector_schema_tables
+    )
+    schema_tables: Dict[str, Dict[str, List[str]]] = {}
+    with ThreadPoolExecutor(
+        max_workers=min(SCHEMA_INTROSPECTION_WORKERS, len(schemas))
+    ) as executor:
+        futures = {
+            executor.submit(get_schema_tables, engine, schema): schema
+            for schema in schemas
+        }
+        for future in as_completed(futures):
+            schema = futures[future]
+            schema_tables[schema] = future.result()
+            if show_progress:
+                echo_green(
+                    f"Fetched {len(schema_tables[schema])} table(s) from schema "
+                    f"'{schema}' ({len(schema_tables)}/{len(schemas)})"
+                )
+
+    # Keep the schemas in the order the database listed them
+    return {schema: schema_tables[schema] for schema in schemas}
+
+
+def get_information_schema_tables(engine: Engine, schema: str) -> Dict[str, List[str]]:
+    """
+    Returns the column names of each table of a schema, read from the information_schema
+    with a single query
+    """
+    db_tables: Dict[str, List[str]] = {}
+    with engine.connect() as connection:
+        result = connection.execute(
+            INFORMATION_SCHEMA_COLUMNS_QUERY,
+            {
+                "schema": schema,
+                "table_types": INFORMATION_SCHEMA_TABLE_TYPES[engine.dialect.name],
+            },
+        )
+        for table_name, column_name in result:
+            columns = db_tables.setdefault(table_name, [])
+            if column_name is not None:
+                columns.append(column_name)
+    return db_tables
+
+
+def get_inspector_schema_tables(engine: Engine, schema: str) -> Dict[str, List[str]]:
+    """
+    Returns the column names of each table of a schema, using the inspector of the
+    dialect
+    """
+    inspector = sqlalchemy.inspect(engine)
+    return {
+        table: [
+            column["name"] for column in inspector.get_columns(table, schema=schema)
+        ]
+        for table in inspector.get_table_names(schema=schema)
+    }
 
 
 def create_db_datasets(db_schemas: Dict[str, Dict[str, List[str]]]) -> List[Dataset]:
@@ -153,33 +239,27 @@ def find_uncategorized_dataset_fields(
     uncategorized_fields = []
     total_field_count = 0
 
-    for source_dataset_collection in source_dataset.collections:
-        existing_dataset_collection = (
-            next(
-                (
-                    existing_dataset_collection
-                    for existing_dataset_collection in existing_dataset.collections
-                    if existing_dataset_collection.name
-                    == source_dataset_collection.name
-                ),
-                None,
-            )
-            if existing_dataset
-            else None
+    # The names of the categorized fields of each collection of the existing dataset
+    categorized_field_names: Dict[str, Set[str]] = {}
+    for existing_dataset_collection in (
+        existing_dataset.collections if existing_dataset else []
+    ):
+        categorized_field_names.setdefault(
+            existing_dataset_collection.name,
+            {
+                field.name
+                for field in existing_dataset_collection.fields
+                if field.data_categories
+            },
         )
 
+    for source_dataset_collection in source_dataset.collections:
+        collection_categorized_field_names = categorized_field_names.get(
+            source_dataset_collection.name, set()
+        )
         for db_dataset_field in source_dataset_collection.fields:
             total_field_count += 1
-            field_uncategorized = (
-                all(
-                    field.name != db_dataset_field.name or not field.data_categories
-                    for field in existing_dataset_collection.fields
-                )
-                if existing_dataset_collection
-                else True
-            )
-
-            if field_uncategorized:
+            if db_dataset_field.name not in collection_categorized_field_names:
                 uncategorized_fields.append(
                     f"{source_dataset.name}.{source_dataset_collection.name}.{db_dataset_field.name}"
                 )
@@ -195,21 +275,17 @@ def find_all_uncategorized_dataset_fields(
     """
     uncategorized_fields = []
     total_field_count = 0
-    for source_dataset in source_datasets:
-        existing_dataset = next(
-            (
-                existing_dataset
-                for existing_dataset in existing_datasets
-                if existing_dataset.name == source_dataset.name
-            ),
-            None,
-        )
+    existing_datasets_by_name: Dict[Optional[str], Dataset] = {}
+    for existing_dataset in existing_datasets:
+        existing_datasets_by_name.setdefault(existing_dataset.name, existing_dataset)
 
+    for source_dataset in source_datasets:
         (
             current_uncategorized_keys,
             current_field_count,
         ) = find_uncategorized_dataset_fields(
-            existing_dataset=existing_dataset, source_dataset=source_dataset
+            existing_dataset=existing_datasets_by_name.get(source_dataset.name),
+            source_dataset=source_dataset,
         )
         total_field_count += current_field_count
         uncategorized_fields += current_uncategorized_keys
@@ -281,7 +357,9 @@ def scan_dataset_db(
     )
 
     # Generate the collections and fields for the target database
-    db_datasets = generate_db_datasets(connection_string=connection_string)
+    db_datasets = generate_db_datasets(
+        connection_string=connection_string, show_progress=True
+    )
     uncategorized_fields, db_field_count = find_all_uncategorized_dataset_fields(
         existing_datasets=manifest_datasets + server_datasets,
         source_datasets=db_datasets,
@@ -301,13 +379,15 @@ def scan_dataset_db(
     )
 
 
-def generate_db_datasets(connection_string: str) -> List[Dataset]:
+def generate_db_datasets(
+    connection_string: str, show_progress: bool = False
+) -> List[Dataset]:
     """
     Given a database connection string, extract all tables/fields from it
     and generate corresponding datasets.
     """
     db_engine = get_db_engine(connection_string)
-    db_schemas = get_db_schemas(engine=db_engine)
+    db_schemas = get_db_schemas(engine=db_engine, show_progress=show_progress)
     db_datasets = create_db_datasets(db_schemas=db_schemas)
     unique_db_datasets = [
         make_dataset_key_unique(dataset, db_engine.url.host, db_engine.url.database)
@@ -339,19 +419,25 @@ def generate_dataset_db(
     Given a database connection string, extract all tables/fields from it
     and write out a boilerplate dataset manifest, excluding optional null attributes.
     """
-    db_datasets = generate_db_datasets(connection_string=connection_string)
+    db_datasets = generate_db_datasets(
+        connection_string=connection_string, show_progress=True
+    )
     write_dataset_manifest(
         file_name=file_name, include_null=include_null, datasets=db_datasets
     )
     return file_name
 
 
-def generate_bigquery_datasets(bigquery_config: BigQueryConfig) -> List[Dataset]:
+def generate_bigquery_datasets(
+    bigquery_config: BigQueryConfig, show_progress: bool = False
+) -> List[Dataset]:
     """
     Given a BigQuery config, extract all tables/fields and generate corresponding datasets.
     """
     bigquery_engine = get_bigquery_engine(bigquery_config)
-    bigquery_schemas = get_db_schemas(engine=bigquery_engine)
+    bigquery_schemas = get_db_schemas(
+        engine=bigquery_engine, show_progress=show_progress
+    )
     bigquery_datasets = create_db_datasets(db_schemas=bigquery_schemas)
     unique_bigquery_datasets = [
         make_dataset_key_unique(
@@ -373,13 +459,10 @@ def generate_dynamo_db_datasets(aws_config: Optional[AWSConfig]) -> Dataset:
     return dynamo_dataset
 
 
-def get_snowflake_schemas(
-    engine: Engine,
-) -> Dict[str, Dict[str, List[str]]]:
+def get_snowflake_schema_names(engine: Engine) -> List[str]:
     """
-    Returns Datasets that match the case-sensitivity that may be
-    required by Snowflake. Iterates through each schema.table.column
-    the logged in user has access to.
+    Returns the names of the schemas the logged in user has access to, matching the
+    case-sensitivity that may be required by Snowflake.
 
     This is currently required because of the inferred casing of Snowflake,
     which defaults to upper-case. Anything else must be double-quoted, however
@@ -387,7 +470,7 @@ def get_snowflake_schemas(
     it's implementation of the `inspect()` method, forcing everything to what
     is deemed to be normalized (i.e. lower-case).
 
-    The following code maintains casing as defined in Snowflake which combines
+    The information_schema maintains casing as defined in Snowflake, which combines
     well with our DSR implementation in always using double-quoted query syntax.
 
     It may be worthwhile for us to invest some time in resolving the core issue
@@ -396,17 +479,4 @@ def get_snowflake_schemas(
     Reference: https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157
     """
     schema_cursor = engine.execute(text("SHOW SCHEMAS"))
-    db_schemas = [row[1] for row in schema_cursor]
-    metadata: Dict[str, Dict[str, List]] = {}
-    for schema in db_schemas:
-        if include_dataset_schema(schema=schema, database_type=engine.dialect.name):
-            metadata[schema] = {}
-            table_cursor = engine.execute(text(f'SHOW TABLES IN "{schema}"'))
-            db_tables = [row[1] for row in table_cursor]
-            for table in db_tables:
-                column_cursor = engine.execute(
-                    text(f'SHOW COLUMNS IN "{schema}"."{table}"')
-                )
-                columns = [row[2] for row in column_cursor]
-                metadata[schema][table] = columns
-    return metadata
+    return [row[1] for row in schema_cursor]
@@ -1,11 +1,12 @@
 """Module for evaluating policies."""
 import uuid
-from typing import Callable, Dict, List, Optional, Set, cast
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from fideslang.default_taxonomy import DEFAULT_TAXONOMY
 from fideslang.models import (
     Dataset,
     Evaluation,
+    FidesModel,
     MatchesEnum,
     Policy,
     PolicyRule,
@@ -17,7 +18,6 @@ from fideslang.models import (
     ViolationAttributes,
 )
 from fideslang.relationships import get_referenced_missing_keys
-from fideslang.utils import get_resource_by_fides_key
 from fideslang.validation import FidesKey
 from pydantic import AnyHttpUrl
 
@@ -104,6 +104,67 @@ def validate_policies_exist(policies: List[Policy], evaluate_fides_key: str) ->
         raise SystemExit(1)
 
 
+class TaxonomyIndex:
+    """
+    A view of a taxonomy that looks resources up by fides key, and remembers the
+    parent hierarchy of every key it resolves.
+
+    Built once per evaluation, so that evaluating each declaration doesn't scan the
+    whole taxonomy for every one of its data categories, data use and data qualifier.
+    """
+
+    def __init__(self, taxonomy: Taxonomy) -> None:
+        self.taxonomy = taxonomy
+        # When a key is used by several resources, the last one is used
+        self.resources: Dict[str, FidesModel] = {}
+        for resource_type in taxonomy.__fields_set__:
+            for resource in getattr(taxonomy, resource_type):
+                self.resources[resource.fides_key] = resource
+        self.datasets: Dict[str, Dataset] = {}
+        for dataset in taxonomy.dataset:
+            self.datasets.setdefault(dataset.fides_key, dataset)
+        self._hierarchies: Dict[str, Tuple[FidesKey, ...]] = {}
+
+    def get_dataset(self, fides_key: str) -> Optional[Dataset]:
+        """Returns the first dataset of the taxonomy with the given fides key"""
+        return self.datasets.get(fides_key)
+
+    def get_parent_hierarchy(self, fides_key: str) -> Tuple[FidesKey, ...]:
+        """
+        Returns the hierarchy of parents of the given fides key, starting with the
+        given fides key.
+        """
+        hierarchy = self._hierarchies.get(fides_key)
+        if hierarchy is not None:
+            return hierarchy
+
+        # Walk up the parents until reaching the top or a key that was already resolved
+        unresolved_keys: List[FidesKey] = []
+        resolved: Tuple[FidesKey, ...] = ()
+        current_key = fides_key
+        while True:
+            if current_key in self._hierarchies:
+                resolved = self._hierarchies[current_key]
+                break
+            unresolved_keys.append(current_key)
+            found_resource = self.resources.get(current_key)
+            if not found_resource:
+                echo_red(
+                    "Found missing key ({}) referenced in taxonomy".format(current_key)
+                )
+                raise SystemExit(1)
+            if "parent_key" not in found_resource.__fields_set__:
+                break
+            current_key = getattr(found_resource, "parent_key")
+            if not current_key:
+                break
+
+        for key in reversed(unresolved_keys):
+            resolved = (key, *resolved)
+            self._hierarchies[key] = resolved
+        return resolved
+
+
 def get_fides_key_parent_hierarchy(
     taxonomy: Taxonomy, fides_key: str
 ) -> List[FidesKey]:
@@ -111,32 +172,12 @@ def get_fides_key_parent_hierarchy(
     Traverses a hierarchy of parents for a given fides key and returns
     the hierarchy starting with the given fides key.
     """
-    current_key = fides_key
-    fides_key_parent_hierarchy = []
-    while True:
-        fides_key_parent_hierarchy.append(current_key)
-        found_resource_map = get_resource_by_fides_key(
-            taxonomy=taxonomy, fides_key=current_key
-        )
-        if found_resource_map:
-            found_resource = list(found_resource_map.values())[-1]
-            if found_resource and "parent_key" in found_resource.__fields_set__:
-                current_key = getattr(found_resource, "parent_key")
-                if not current_key:
-                    break
-            else:
-                break
-        else:
-            echo_red(
-                "Found missing key ({}) referenced in taxonomy".format(current_key)
-            )
-            raise SystemExit(1)
-    return fides_key_parent_hierarchy
+    return list(TaxonomyIndex(taxonomy).get_parent_hierarchy(fides_key))
 
 
 def compare_rule_to_declaration(
-    rule_types: List[FidesKey],
-    declaration_type_hierarchies: List[List[FidesKey]],
+    rule_types: Iterable[FidesKey],
+    declaration_type_hierarchies: Sequence[Sequence[FidesKey]],
     rule_match: MatchesEnum,
 ) -> Set[str]:
     """
@@ -145,11 +186,12 @@ def compare_rule_to_declaration(
     field to determine whether the rule is triggered or not. Returns the offending
     keys, prioritizing the first descendant in the hierarchy.
     """
+    rule_type_set = set(rule_types)
     matched_declaration_types = set()
     mismatched_declaration_types = set()
     for declaration_type_hierarchy in declaration_type_hierarchies:
         declared_declaration_type = declaration_type_hierarchy[0]
-        if len(set(declaration_type_hierarchy).intersection(set(rule_types))) > 0:
+        if not rule_type_set.isdisjoint(declaration_type_hierarchy):
             matched_declaration_types.add(declared_declaration_type)
         else:
             mismatched_declaration_types.add(declared_declaration_type)
@@ -173,7 +215,7 @@ def compare_rule_to_declaration(
 
 
 def evaluate_policy_rule(
-    taxonomy: Taxonomy,
+    taxonomy_index: TaxonomyIndex,
     policy_rule: PolicyRule,
     data_subjects: List[str],
     data_categories: List[str],
@@ -187,26 +229,34 @@ def evaluate_policy_rule(
     policy rule
     """
     category_hierarchies = [
-        get_fides_key_parent_hierarchy(
-            taxonomy=taxonomy, fides_key=declaration_category
-        )
+        taxonomy_index.get_parent_hierarchy(declaration_category)
         for declaration_category in data_categories
     ]
+    # A declaration only has one data use, so its hierarchy gets put in a list
+    data_use_hierarchies = [taxonomy_index.get_parent_hierarchy(data_use)]
+    data_qualifier_hierarchy = taxonomy_index.get_parent_hierarchy(data_qualifier)
+
+    # The rule is only violated when every one of its constraints is, so stop
+    # comparing as soon as one of them isn't
+    data_qualifier_violation = policy_rule.data_qualifier in data_qualifier_hierarchy
+    if not data_qualifier_violation:
+        return []
+
     data_category_violations = compare_rule_to_declaration(
         rule_types=policy_rule.data_categories.values,
         declaration_type_hierarchies=category_hierarchies,
         rule_match=policy_rule.data_categories.matches,
     )
+    if not data_category_violations:
+        return []
 
-    # A declaration only has one data use, so its hierarchy gets put in a list
-    data_use_hierarchies = [
-        get_fides_key_parent_hierarchy(taxonomy=taxonomy, fides_key=data_use)
-    ]
     data_use_violations = compare_rule_to_declaration(
         rule_types=policy_rule.data_uses.values,
         declaration_type_hierarchies=data_use_hierarchies,
         rule_match=policy_rule.data_uses.matches,
     )
+    if not data_use_violations:
+        return []
 
     # A data subject does not have a hierarchical structure
     data_subject_violations = compare_rule_to_declaration(
@@ -214,58 +264,37 @@ def evaluate_policy_rule(
         declaration_type_hierarchies=[[data_subject] for data_subject in data_subjects],
         rule_match=policy_rule.data_subjects.matches,
     )
-
-    data_qualifier_violation = (
-        policy_rule.data_qualifier
-        in get_fides_key_parent_hierarchy(taxonomy=taxonomy, fides_key=data_qualifier)
-    )
-
-    evaluation_result = all(
-        [
-            data_category_violations,
-            data_use_violations,
-            data_subject_violations,
-            data_qualifier_violation,
-        ]
-    )
-
-    if evaluation_result:
-        violations = [
-            Violation(
-                detail="{}. Violated usage of data categories ({}) with qualifier ({}) for data uses ({}) and subjects ({})".format(
-                    declaration_violation_message,
-                    ",".join(data_category_violations),
-                    data_qualifier,
-                    ",".join(data_use_violations),
-                    ",".join(data_subject_violations),
-                ),
-                violating_attributes=ViolationAttributes(
-                    data_categories=data_category_violations,
-                    data_uses=data_use_violations,
-                    data_subjects=data_subject_violations,
-                    data_qualifier=data_qualifier,
-                ),
-            )
-        ]
-        return violations
-    return []
+    if not data_subject_violations:
+        return []
+
+    return [
+        Violation(
+            detail="{}. Violated usage of data categories ({}) with qualifier ({}) for data uses ({}) and subjects ({})".format(
+                declaration_violation_message,
+                ",".join(data_category_violations),
+                data_qualifier,
+                ",".join(data_use_violations),
+                ",".join(data_subject_violations),
+            ),
+            violating_attributes=ViolationAttributes(
+                data_categories=data_category_violations,
+                data_uses=data_use_violations,
+                data_subjects=data_subject_violations,
+                data_qualifier=data_qualifier,
+            ),
+        )
+    ]
 
 
 def get_dataset_by_fides_key(taxonomy: Taxonomy, fides_key: str) -> Optional[Dataset]:
     """
     Returns a dataset within the taxonomy for a given fides key
     """
-    dataset = next(
-        iter(
-            [dataset for dataset in taxonomy.dataset if dataset.fides_key == fides_key]
-        ),
-        None,
-    )
-    return cast(Dataset, dataset)
+    return TaxonomyIndex(taxonomy).get_dataset(fides_key)
 
 
 def evaluate_dataset_reference(
-    taxonomy: Taxonomy,
+    taxonomy_index: TaxonomyIndex,
     policy: Policy,
     system: System,
     policy_rule: PolicyRule,
@@ -287,7 +316,7 @@ def evaluate_dataset_reference(
         )
 
         dataset_result_violations = evaluate_policy_rule(
-            taxonomy=taxonomy,
+            taxonomy_index=taxonomy_index,
             policy_rule=policy_rule,
             data_subjects=privacy_declaration.data_subjects,
             data_categories=dataset.data_categories,
@@ -309,7 +338,7 @@ def evaluate_dataset_reference(
 
         if collection.data_categories:
             dataset_collection_result_violations = evaluate_policy_rule(
-                taxonomy=taxonomy,
+                taxonomy_index=taxonomy_index,
                 policy_rule=policy_rule,
                 data_subjects=privacy_declaration.data_subjects,
                 data_categories=collection.data_categories,
@@ -331,7 +360,7 @@ def evaluate_dataset_reference(
 
             if field.data_categories:
                 field_result_violations = evaluate_policy_rule(
-                    taxonomy=taxonomy,
+                    taxonomy_index=taxonomy_index,
                     policy_rule=policy_rule,
                     data_subjects=privacy_declaration.data_subjects,
                     data_categories=field.data_categories,
@@ -346,7 +375,7 @@ def evaluate_dataset_reference(
 
 
 def evaluate_privacy_declaration(
-    taxonomy: Taxonomy,
+    taxonomy_index: TaxonomyIndex,
     policy: Policy,
     system: System,
     policy_rule: PolicyRule,
@@ -368,7 +397,7 @@ def evaluate_privacy_declaration(
     )
 
     declaration_result_violations = evaluate_policy_rule(
-        taxonomy=taxonomy,
+        taxonomy_index=taxonomy_index,
         policy_rule=policy_rule,
         data_subjects=privacy_declaration.data_subjects,
         data_categories=privacy_declaration.data_categories,
@@ -380,12 +409,10 @@ def evaluate_privacy_declaration(
     evaluation_violation_list += declaration_result_violations
 
     for dataset_reference in privacy_declaration.dataset_references or []:
-        dataset = get_dataset_by_fides_key(
-            taxonomy=taxonomy, fides_key=dataset_reference
-        )
+        dataset = taxonomy_index.get_dataset(dataset_reference)
         if dataset:
             evaluation_violation_list += evaluate_dataset_reference(
-                taxonomy=taxonomy,
+                taxonomy_index=taxonomy_index,
                 policy=policy,
                 system=system,
                 policy_rule=policy_rule,
@@ -407,13 +434,14 @@ def execute_evaluation(taxonomy: Taxonomy) -> Evaluation:
     Check the stated constraints of each Privacy Policy's rules against
     each system's privacy declarations.
     """
+    taxonomy_index = TaxonomyIndex(taxonomy)
     evaluation_violation_list = []
     for policy in taxonomy.policy:
         for rule in policy.rules:
             for system in taxonomy.system:
                 for declaration in system.privacy_declarations:
                     evaluation_violation_list += evaluate_privacy_declaration(
-                        taxonomy=taxonomy,
+                        taxonomy_index=taxonomy_index,
                         policy=policy,
                         system=system,
                         policy_rule=rule,
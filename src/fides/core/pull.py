@@ -6,7 +6,7 @@ from fideslang import model_list
 from fideslang.manifests import load_yaml_into_dict
 
 from fides.common.utils import print_divider
-from fides.core.api_helpers import get_server_resource, list_server_resources
+from fides.core.api_helpers import get_raw_server_resources, list_server_resources
 from fides.core.utils import echo_green, get_manifest_list
 
 MODEL_LIST = model_list
@@ -42,13 +42,22 @@ def pull_existing_resources(
             resource_list = manifest[resource_type]
             updated_resource_list = []
 
+            # Fetch every resource of the manifest with this type at once
+            server_resources = {
+                server_resource["fides_key"]: server_resource
+                for server_resource in get_raw_server_resources(
+                    url,
+                    resource_type,
+                    [resource["fides_key"] for resource in resource_list],
+                    headers,
+                )
+            }
+
             for resource in resource_list:
                 fides_key = resource["fides_key"]
                 existing_keys.append(fides_key)
 
-                server_resource = get_server_resource(
-                    url, resource_type, fides_key, headers, raw=True
-                )
+                server_resource = server_resources.get(fides_key)
 
                 if server_resource:
                     updated_resource_list.append(server_resource)
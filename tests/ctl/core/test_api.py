@@ -207,6 +207,39 @@ class TestCrud:
         )
         assert result.status_code == 403
 
+    @pytest.mark.parametrize("endpoint", model_list)
+    def test_api_bulk_get(
+        self, test_config: FidesConfig, endpoint: str, generate_auth_header
+    ) -> None:
+        token_scopes: List[str] = [f"{CLI_SCOPE_PREFIX_MAPPING[endpoint]}:{READ}"]
+        auth_header = generate_auth_header(scopes=token_scopes)
+
+        existing_id = get_existing_key(test_config, endpoint)
+        result = _api.bulk_get(
+            url=test_config.cli.server_url,
+            headers=auth_header,
+            resource_type=endpoint,
+            resource_ids=[existing_id, "missing_key", existing_id],
+        )
+        assert result.status_code == 200
+        assert [resource["fides_key"] for resource in result.json()] == [existing_id]
+
+    @pytest.mark.parametrize("endpoint", model_list)
+    def test_api_bulk_get_wrong_scope(
+        self, test_config: FidesConfig, endpoint: str, generate_auth_header
+    ) -> None:
+        token_scopes: List[str] = [PRIVACY_REQUEST_READ]
+        auth_header = generate_auth_header(scopes=token_scopes)
+
+        existing_id = get_existing_key(test_config, endpoint)
+        result = _api.bulk_get(
+            url=test_config.cli.server_url,
+            headers=auth_header,
+            resource_type=endpoint,
+            resource_ids=[existing_id],
+        )
+        assert result.status_code == 403
+
     @pytest.mark.parametrize("endpoint", model_list)
     def test_sent_is_received(
         self, test_config: FidesConfig, resources_dict: Dict, endpoint: str
@@ -1,9 +1,10 @@
 # pylint: disable=missing-docstring, redefined-outer-name
 import uuid
-from typing import Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional
 
 import pytest
 from fideslang import FidesModel, model_list
+from requests import Response
 
 from fides.core import api as _api
 from fides.core import api_helpers as _api_helpers
@@ -150,6 +151,35 @@ class TestGetServerResources:
         )
         assert result == []
 
+    @pytest.mark.parametrize(
+        "created_resources", PARAM_MODEL_LIST, indirect=["created_resources"]
+    )
+    def test_get_server_resources_without_bulk_endpoint(
+        self,
+        test_config: FidesConfig,
+        created_resources: List,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Tests that resources are fetched one by one from servers without the bulk endpoint
+        """
+        resource_type = created_resources[0]
+        resource_keys = created_resources[1]
+
+        def bulk_get_unsupported(**kwargs: Any) -> Response:
+            response = Response()
+            response.status_code = 405
+            return response
+
+        monkeypatch.setattr(_api, "bulk_get", bulk_get_unsupported)
+        result: List[FidesModel] = _api_helpers.get_server_resources(
+            url=test_config.cli.server_url,
+            resource_type=resource_type,
+            existing_keys=resource_keys + [str(uuid.uuid4())],
+            headers=test_config.user.auth_header,
+        )
+        assert set(resource_keys) == set(resource.fides_key for resource in result)
+
 
 @pytest.mark.integration
 class TestListServerResources:
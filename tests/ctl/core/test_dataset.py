@@ -356,6 +356,25 @@ def test_unsupported_dialect_error() -> None:
         _dataset.generate_dataset_db(test_url, "test_file.yml", False)
 
 
+@pytest.mark.unit
+def test_get_db_schemas_with_inspector(tmpdir: LocalPath) -> None:
+    """Dialects without an information_schema are introspected table by table"""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmpdir}/test.db")
+    engine.execute(sqlalchemy.text("CREATE TABLE visit (email TEXT, last_visit TEXT)"))
+    engine.execute(
+        sqlalchemy.text(
+            "CREATE TABLE login (id INTEGER, customer_id INTEGER, time TEXT)"
+        )
+    )
+
+    assert _dataset.get_db_schemas(engine=engine, show_progress=True) == {
+        "main": {
+            "visit": ["email", "last_visit"],
+            "login": ["id", "customer_id", "time"],
+        }
+    }
+
+
 # Generate Dataset Database Integration Tests
 
 # These URLs are for the databases in the docker-compose.integration-tests.yml file
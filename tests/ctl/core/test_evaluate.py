@@ -557,6 +557,32 @@ def test_get_fides_key_parent_hierarchy_missing_parent() -> None:
         )
 
 
+@pytest.mark.unit
+def test_taxonomy_index_memoizes_parent_hierarchies(
+    evaluation_hierarchical_key_basic_taxonomy: Taxonomy,
+) -> None:
+    taxonomy_index = evaluate.TaxonomyIndex(evaluation_hierarchical_key_basic_taxonomy)
+    assert taxonomy_index.get_parent_hierarchy("data_category.parent") == (
+        "data_category.parent",
+        "data_category",
+    )
+
+    # Resolved hierarchies are reused without looking their resources up again
+    with patch.dict(taxonomy_index.resources, clear=True):
+        assert taxonomy_index.get_parent_hierarchy("data_category.parent") == (
+            "data_category.parent",
+            "data_category",
+        )
+        with pytest.raises(SystemExit):
+            taxonomy_index.get_parent_hierarchy("data_category.parent.child")
+
+    assert taxonomy_index.get_parent_hierarchy("data_category.parent.child") == (
+        "data_category.parent.child",
+        "data_category.parent",
+        "data_category",
+    )
+
+
 @pytest.mark.unit
 def test_failed_evaluation_error_message(
     test_config: FidesConfig, capsys: pytest.CaptureFixture
@@ -2,9 +2,12 @@
 
 import json
 from datetime import datetime
+from unittest import mock
+from uuid import uuid4
 
 import pytest
 from fastapi.security import SecurityScopes
+from sqlalchemy.orm import Session
 
 from fides.api.api.v1.scope_registry import (
     DATASET_CREATE_OR_UPDATE,
@@ -200,6 +203,71 @@ async def test_verify_oauth_client_wrong_client_scope(db, config, user):
         )
 
 
+class TestOauthCache:
+    @pytest.fixture
+    def token_payload(self, oauth_client):
+        return json.dumps(
+            {
+                JWE_PAYLOAD_SCOPES: [USER_READ],
+                JWE_PAYLOAD_CLIENT_ID: oauth_client.id,
+                JWE_ISSUED_AT: datetime.now().isoformat(),
+            }
+        )
+
+    @pytest.fixture
+    def other_session(self, db):
+        session = Session(bind=db.get_bind())
+        yield session
+        session.close()
+
+    async def test_token_and_client_cached(
+        self, db, other_session, oauth_client, token_payload
+    ):
+        token = f"token-{uuid4()}"
+        with mock.patch(
+            "fides.api.oauth.utils.extract_payload", return_value=token_payload
+        ) as extract_payload:
+            client = await verify_oauth_client(
+                SecurityScopes([USER_READ]), token, db=other_session
+            )
+            assert client.id == oauth_client.id
+
+            request_session = Session(bind=db.get_bind())
+            try:
+                with mock.patch.object(
+                    request_session, "query", wraps=request_session.query
+                ) as query:
+                    client = await verify_oauth_client(
+                        SecurityScopes([USER_READ]), token, db=request_session
+                    )
+                    assert not query.called
+                assert client.id == oauth_client.id
+                assert client.scopes == oauth_client.scopes
+            finally:
+                request_session.close()
+
+        assert extract_payload.call_count == 1
+
+    async def test_cached_client_invalidated(
+        self, db, other_session, oauth_client, token_payload
+    ):
+        token = f"token-{uuid4()}"
+        with mock.patch(
+            "fides.api.oauth.utils.extract_payload", return_value=token_payload
+        ):
+            await verify_oauth_client(
+                SecurityScopes([USER_READ]), token, db=other_session
+            )
+            other_session.close()
+
+            oauth_client.update(db, data={"scopes": [USER_DELETE]})
+
+            with pytest.raises(AuthorizationError):
+                await verify_oauth_client(
+                    SecurityScopes([USER_READ]), token, db=other_session
+                )
+
+
 class TestVerifyOauthClientRoles:
     async def test_token_does_not_have_roles(self, db, config):
         """Test that roles aren't required to be on the token - scopes can still be assigned directly"""
@@ -485,3 +485,61 @@ class TestGetPrivacyExperiences:
             data["privacy_notices"][0]["notice_key"]
             == "example_privacy_notice_us_ca_provide"
         )
+
+    @pytest.mark.usefixtures("privacy_experience_privacy_center")
+    def test_get_privacy_experiences_etag(self, api_client: TestClient, url):
+        resp = api_client.get(url)
+        assert resp.status_code == 200
+        etag = resp.headers["ETag"]
+        assert resp.headers["Cache-Control"] == "public, max-age=0, must-revalidate"
+
+        resp = api_client.get(url, headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["ETag"] == etag
+        assert not resp.content
+
+        resp = api_client.get(url + "?region=us_ca", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+
+    @pytest.mark.usefixtures(
+        "privacy_notice_us_ca_provide",
+        "fides_user_provided_identity",
+        "privacy_preference_history_us_ca_provide_for_fides_user",
+        "privacy_experience_overlay",
+    )
+    def test_get_privacy_experiences_fides_user_device_id_not_shared(
+        self, api_client: TestClient, url
+    ):
+        resp = api_client.get(url)
+        assert resp.status_code == 200
+        assert (
+            resp.json()["items"][0]["privacy_notices"][0]["current_preference"] is None
+        )
+
+        resp = api_client.get(
+            url + "?fides_user_device_id=051b219f-20e4-45df-82f7-5eb68a00889f",
+            headers={"If-None-Match": resp.headers["ETag"]},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["Cache-Control"] == "private, max-age=0, must-revalidate"
+        assert (
+            resp.json()["items"][0]["privacy_notices"][0]["current_preference"]
+            == "opt_in"
+        )
+
+    @pytest.mark.usefixtures("privacy_experience_privacy_center")
+    def test_get_privacy_experiences_after_notice_change(
+        self, db, api_client: TestClient, url, privacy_notice
+    ):
+        resp = api_client.get(url)
+        assert (
+            resp.json()["items"][0]["privacy_notices"][0]["name"] == privacy_notice.name
+        )
+
+        privacy_notice.update(db, data={"name": "Updated notice name"})
+
+        resp = api_client.get(url)
+        assert (
+            resp.json()["items"][0]["privacy_notices"][0]["name"]
+            == "Updated notice name"
+        )
@@ -16,6 +16,7 @@ from starlette.testclient import TestClient
 
 from fides.api.api.v1.endpoints.privacy_request_endpoints import (
     EMBEDDED_EXECUTION_LOG_LIMIT,
+    stream_privacy_requests_csv,
     validate_manual_input,
 )
 from fides.api.api.v1.scope_registry import (
@@ -1328,6 +1329,41 @@ class TestGetPrivacyRequests:
 
         privacy_request.delete(db)
 
+    def test_stream_privacy_requests_csv_in_chunks(self, db, privacy_requests, user):
+        denied_request = privacy_requests[1]
+        denied_request.status = PrivacyRequestStatus.denied
+        denied_request.save(db)
+        audit_log = AuditLog.create(
+            db=db,
+            data={
+                "user_id": user.id,
+                "privacy_request_id": denied_request.id,
+                "action": AuditLogAction.denied,
+                "message": "Too many requests",
+            },
+        )
+
+        query = (
+            db.query(PrivacyRequest)
+            .filter(PrivacyRequest.id.in_([pr.id for pr in privacy_requests]))
+            .order_by(PrivacyRequest.created_at)
+        )
+        chunks = list(stream_privacy_requests_csv(db, query, chunk_size=2))
+        # The header, then a chunk of two privacy requests and a chunk of one
+        assert len(chunks) == 3
+
+        rows = list(csv.DictReader(io.StringIO("".join(chunks)), delimiter=","))
+        assert [row["Request ID"] for row in rows] == [pr.id for pr in privacy_requests]
+        assert [row["Denial Reason"] for row in rows] == ["", "Too many requests", ""]
+        assert [row["Status"] for row in rows] == [
+            "in_processing",
+            "denied",
+            "in_processing",
+        ]
+        assert {row["Request Type"] for row in rows} == {"access"}
+
+        audit_log.delete(db)
+
     def test_get_paused_access_privacy_request_resume_info(
         self, db, privacy_request, generate_auth_header, api_client, url
     ):
@@ -23,9 +23,13 @@ from fides.core.config import CONFIG
 page_size = Params().size
 
 import json
+from time import monotonic, sleep
 from typing import Any, Dict, Generator
+from unittest import mock
+from uuid import uuid4
 
 import pytest
+from fastapi import Request
 
 from fides.api import middleware as _middleware
 from fides.api.api.v1.scope_registry import USER_CREATE
@@ -35,6 +39,7 @@ from fides.api.cryptography.schemas.jwt import (
     JWE_PAYLOAD_CLIENT_ID,
     JWE_PAYLOAD_SCOPES,
 )
+from fides.api.ctl.sql_models import AuditLogResource
 from fides.api.oauth.jwt import generate_jwe
 from fides.core.config import CONFIG
 
@@ -70,11 +75,53 @@ def test_bad_audit_log_resource_data() -> Generator:
     yield audit_log_resource_data
 
 
-def test_record_written_to_db(db, test_audit_log_resource_data: Dict[str, Any]) -> None:
-    assert _middleware.write_audit_log_resource_record(db, test_audit_log_resource_data)
+def test_build_audit_log_resource_record(
+    db, test_audit_log_resource_data: Dict[str, Any]
+) -> None:
+    pending_record = {
+        "request_path": test_audit_log_resource_data["request_path"],
+        "request_type": test_audit_log_resource_data["request_type"],
+        "authorization": None,
+        "fides_keys": test_audit_log_resource_data["fides_keys"],
+    }
+    assert _middleware.build_audit_log_resource_record(db, pending_record) == {
+        **test_audit_log_resource_data,
+        "user_id": None,
+        "extra_data": None,
+    }
 
 
-async def test_extracted_token(db) -> None:
+async def test_handle_audit_log_resource() -> None:
+    body = b'[{"fides_key": "test_key"}, {"fides_key": "test_key_2"}]'
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": body}
+
+    request = Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/v1/system",
+            "headers": [(b"authorization", b"Bearer token")],
+        },
+        receive,
+    )
+    with mock.patch.object(_middleware.audit_log_resource_writer, "enqueue") as enqueue:
+        await _middleware.handle_audit_log_resource(request)
+
+    # Only the fides_keys of the body are queued, and the body can still be read
+    enqueue.assert_called_once_with(
+        {
+            "request_path": "/api/v1/system",
+            "request_type": "POST",
+            "authorization": "Bearer token",
+            "fides_keys": ["test_key", "test_key_2"],
+        }
+    )
+    assert await request.body() == body
+
+
+def test_extracted_token(db) -> None:
     # This was taken from test_user_endpoints.py
     user = FidesUser.create(
         db=db,
@@ -99,11 +146,136 @@ async def test_extracted_token(db) -> None:
 
     jwe = generate_jwe(json.dumps(payload), CONFIG.security.app_encryption_key)
     auth_header = {"Authorization": "Bearer " + jwe}
-    assert client.user_id == await _middleware.get_client_user_id(
+    assert client.user_id == _middleware.resolve_client_user_id(
         db, auth_header["Authorization"]
     )
 
 
+class TestAuditLogResourceWriter:
+    @pytest.fixture
+    def request_path(self) -> Generator:
+        yield f"/api/v1/test/{uuid4()}"
+
+    @pytest.fixture
+    def written_records(self, db, request_path: str) -> Generator:
+        def get_written_records() -> List[AuditLogResource]:
+            db.expire_all()
+            return (
+                db.query(AuditLogResource)
+                .filter(AuditLogResource.request_path == request_path)
+                .all()
+            )
+
+        yield get_written_records
+        for record in get_written_records():
+            db.delete(record)
+        db.commit()
+
+    def test_records_written_in_bulk(self, request_path: str, written_records) -> None:
+        writer = _middleware.AuditLogResourceWriter()
+        for i in range(3):
+            assert writer.enqueue(
+                {
+                    "request_path": request_path,
+                    "request_type": "POST",
+                    "authorization": None,
+                    "fides_keys": [f"key_{i}"],
+                }
+            )
+        # Records whose user can't be resolved are skipped
+        writer.enqueue(
+            {
+                "request_path": request_path,
+                "request_type": "POST",
+                "authorization": "Bearer not a token",
+                "fides_keys": [],
+            }
+        )
+        writer.stop()
+
+        records = written_records()
+        assert sorted(record.fides_keys[0] for record in records) == [
+            "key_0",
+            "key_1",
+            "key_2",
+        ]
+        assert all(record.user_id is None for record in records)
+        assert writer.stats() == {"queued": 0, "dropped": 0, "written": 3, "failed": 0}
+
+    def test_records_dropped_when_queue_full(
+        self, request_path: str, written_records
+    ) -> None:
+        with mock.patch.object(
+            CONFIG.security, "audit_log_resource_queue_size", 2
+        ), mock.patch.object(_middleware.AuditLogResourceWriter, "_start"):
+            writer = _middleware.AuditLogResourceWriter()
+            pending_record = {
+                "request_path": request_path,
+                "request_type": "DELETE",
+                "authorization": None,
+                "fides_keys": [],
+            }
+            assert writer.enqueue(pending_record)
+            assert writer.enqueue(pending_record)
+            assert not writer.enqueue(pending_record)
+            assert writer.stats()["dropped"] == 1
+
+            writer.flush()
+        assert len(written_records()) == 2
+
+    def test_writer_recovers_after_failed_batch(
+        self, request_path: str, written_records
+    ) -> None:
+        writer = _middleware.AuditLogResourceWriter()
+        with mock.patch.object(
+            CONFIG.security, "audit_log_resource_flush_interval_seconds", 0.01
+        ), mock.patch.object(
+            _middleware.deps,
+            "get_api_session",
+            side_effect=[
+                RuntimeError("Database unavailable"),
+                _middleware.deps.get_api_session(),
+            ],
+        ):
+            writer.enqueue(
+                {
+                    "request_path": request_path,
+                    "request_type": "POST",
+                    "authorization": None,
+                    "fides_keys": ["key_0"],
+                }
+            )
+            deadline = monotonic() + 5
+            while not writer.stats()["failed"] and monotonic() < deadline:
+                sleep(0.01)
+            # The writer thread keeps going after a batch fails
+            assert writer._thread.is_alive()
+
+            writer.enqueue(
+                {
+                    "request_path": request_path,
+                    "request_type": "POST",
+                    "authorization": None,
+                    "fides_keys": ["key_1"],
+                }
+            )
+            writer.stop()
+
+        assert [record.fides_keys for record in written_records()] == [["key_1"]]
+        assert writer.stats() == {"queued": 0, "dropped": 0, "written": 1, "failed": 1}
+
+    def test_writer_restarted_when_thread_died(self) -> None:
+        writer = _middleware.AuditLogResourceWriter()
+        with mock.patch.object(_middleware.AuditLogResourceWriter, "_run"):
+            writer._start()
+            writer._thread.join()
+            dead_thread = writer._thread
+
+            writer._start()
+            assert writer._thread is not dead_thread
+        writer.stop()
+
+
 @pytest.mark.parametrize(
     "request_body, expected_fides_keys",
     [
@@ -121,8 +293,8 @@ async def test_extracted_token(db) -> None:
         ),
     ],
 )
-async def test_extract_data_from_body(
+def test_get_fides_keys_from_body(
     request_body: bytes, expected_fides_keys: List
 ) -> None:
-    fides_keys = await _middleware.extract_data_from_body(request_body)
+    fides_keys = _middleware.get_fides_keys_from_body(request_body)
     assert fides_keys == expected_fides_keys
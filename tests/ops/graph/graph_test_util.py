@@ -246,6 +246,29 @@ def generate_binary_tree_resources(
     return resources
 
 
+def generate_tree_resources(
+    size: int, branching_factor: int = 10
+) -> List[GraphDataset]:
+    """Generate a tree of `size` single-collection datasets, in which each dataset
+    references its parent and the root collection holds the "email" identity"""
+    resources = [
+        GraphDataset(
+            name=f"dr_{i}",
+            collections=[Collection(name=f"ds_{i}", fields=generate_field_list(3))],
+            connection_key="mock_connection_config_key",
+        )
+        for i in range(size)
+    ]
+    # the first field of each collection is f1
+    resources[0].collections[0].fields[0].identity = "email"
+    for i in range(1, size):
+        parent = (i - 1) // branching_factor
+        resources[i].collections[0].fields[0].references.append(
+            (FieldAddress(f"dr_{parent}", f"ds_{parent}", "f1"), "from")
+        )
+    return resources
+
+
 def generate_fully_connected_resources(size: int) -> List[GraphDataset]:
     """Generate a fully connected graph of resources"""
 
@@ -65,6 +65,39 @@ def test_extract_seed_nodes() -> None:
     assert traversal.root_node.children.keys() == {CollectionAddress("dr_1", "ds_1")}
 
 
+def test_traversals_of_shared_graph() -> None:
+    """Nodes are linked to their parents by the time they run in each traversal of
+    a graph, as the tasks built for them read their incoming edges."""
+    t = generate_graph_resources(2)
+    field(t, "dr_1", "ds_1", "f1").references.append(
+        (FieldAddress("dr_2", "ds_2", "f1"), "to")
+    )
+    field(t, "dr_1", "ds_1", "f1").identity = "x"
+    graph: DatasetGraph = DatasetGraph(*t)
+
+    for _ in range(2):
+        incoming_edges = {}
+        Traversal(graph, {"x": 1}).traverse(
+            {},
+            lambda n, _: incoming_edges.__setitem__(n.address, n.incoming_edges()),
+        )
+        assert incoming_edges[CollectionAddress("dr_2", "ds_2")] == {
+            Edge(FieldAddress("dr_1", "ds_1", "f1"), FieldAddress("dr_2", "ds_2", "f1"))
+        }
+
+
+@pytest.mark.parametrize("size", [100, 1000])
+def test_traversal_end_nodes_of_large_graph(size) -> None:
+    """See scripts/benchmark_traversal.py for timing traversals of large graphs."""
+    graph = DatasetGraph(*generate_tree_resources(size))
+
+    traversal = Traversal(graph, {"email": "X"})
+    end_nodes = traversal.traverse({}, lambda tn, data: None)
+
+    # every collection with an index above a tenth of the size is a leaf
+    assert len(end_nodes) == size - (size - 1) // 10 - 1
+
+
 #  -------------------------------------------
 #   graph traversal errors
 #  -------------------------------------------
@@ -105,6 +105,10 @@ class TestTraversalNode:
             is True
         )
 
+        # remaining datasets passed in
+        assert tn.can_run_given({CollectionAddress("_", "_")}, {"_", "f2"}) is False
+        assert tn.can_run_given({CollectionAddress("_", "_")}, {"_"}) is True
+
     def test_is_root_node(self):
         tn = TraversalNode(generate_node("__ROOT__", "__ROOT__"))
         assert tn.is_root_node()
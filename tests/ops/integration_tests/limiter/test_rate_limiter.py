@@ -4,6 +4,7 @@ import unittest.mock as mock
 from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Callable, Dict, Generator, List
+from uuid import uuid4
 
 import pytest
 from requests import Session
@@ -24,12 +25,22 @@ from fides.api.service.connectors.limiter.rate_limiter import (
     RateLimiterPeriod,
     RateLimiterRequest,
     RateLimiterTimeoutException,
+    get_throttle_metrics,
 )
 from fides.api.task import graph_task
 from fides.api.util.saas_util import (
     load_config_with_replacement,
     load_dataset_with_replacement,
 )
+from fides.core.config import CONFIG
+
+
+@pytest.fixture
+def rate_limit_lease_size():
+    original_value = CONFIG.execution.rate_limit_lease_size
+    CONFIG.execution.rate_limit_lease_size = 10
+    yield CONFIG.execution.rate_limit_lease_size
+    CONFIG.execution.rate_limit_lease_size = original_value
 
 
 @pytest.fixture
@@ -218,6 +229,74 @@ def test_limiter_times_out_when_bucket_full() -> None:
             time.sleep(0.002)
 
 
+@pytest.mark.integration
+def test_limiter_times_out_without_waiting() -> None:
+    """A call that cannot be made within the timeout fails right away"""
+    limiter: RateLimiter = RateLimiter()
+    requests = [
+        RateLimiterRequest(
+            key=f"my_test_key_{uuid4()}",
+            rate_limit=1,
+            period=RateLimiterPeriod.MINUTE,
+        )
+    ]
+    limiter.limit(requests=requests)
+
+    start_time = time.time()
+    with pytest.raises(RateLimiterTimeoutException):
+        limiter.limit(requests=requests, timeout_seconds=10)
+    assert time.time() - start_time < 1
+
+
+@pytest.mark.integration
+def test_limiter_records_throttled_calls(loguru_caplog) -> None:
+    """Calls held up by a rate limit are counted in the throttle metrics and logged"""
+    key = f"my_test_key_{uuid4()}"
+    simulate_calls_with_limiter(
+        num_calls=6,
+        rate_limit_requests=[
+            RateLimiterRequest(
+                key=key,
+                rate_limit=5,
+                period=RateLimiterPeriod.SECOND,
+            )
+        ],
+    )
+
+    metrics = get_throttle_metrics()[key]
+    assert metrics["throttled_calls"] == 1
+    assert 0 < metrics["throttled_seconds"] <= 1
+    assert f"Rate limit {key} held up a call for" in loguru_caplog.text
+
+
+@pytest.mark.integration
+def test_limiter_leases_calls(rate_limit_lease_size) -> None:
+    """Calls are reserved in batches while the rate limit is still respected"""
+    num_calls = 200
+    rate_limit = 100
+    with mock.patch.object(
+        RateLimiter,
+        "reserve_calls",
+        autospec=True,
+        side_effect=RateLimiter.reserve_calls,
+    ) as reserve_calls:
+        call_log = simulate_calls_with_limiter(
+            num_calls=num_calls,
+            rate_limit_requests=[
+                RateLimiterRequest(
+                    key=f"my_test_key_{uuid4()}",
+                    rate_limit=rate_limit,
+                    period=RateLimiterPeriod.SECOND,
+                )
+            ],
+        )
+
+    assert sum(call_log.values()) == num_calls
+    assert reserve_calls.call_count < num_calls / rate_limit_lease_size * 2
+    for value in call_log.values():
+        assert value < rate_limit + rate_limit_lease_size + 3
+
+
 @pytest.mark.integration_saas
 @pytest.mark.integration_zendesk
 @pytest.mark.asyncio
@@ -4,6 +4,7 @@ from unittest import mock
 from unittest.mock import Mock
 from uuid import uuid4
 
+import pymongo
 import pytest
 from bson import ObjectId
 from fideslang.models import Dataset
@@ -24,6 +25,7 @@ from fides.api.service.connectors import get_connector
 from fides.api.task import graph_task
 from fides.api.task.filter_results import filter_data_categories
 from fides.api.task.graph_task import get_cached_data_for_erasures
+from fides.core.config import CONFIG
 
 from ..graph.graph_test_util import assert_rows_match, erasure_policy, field
 from ..task.traversal_data import (
@@ -287,6 +289,64 @@ async def test_mongo_erasure_task(db, mongo_inserts, integration_mongodb_config)
     }
 
 
+@pytest.fixture
+def masking_batch_size():
+    original_value = CONFIG.execution.masking_batch_size
+    CONFIG.execution.masking_batch_size = 2
+    yield
+    CONFIG.execution.masking_batch_size = original_value
+
+
+@pytest.mark.integration_mongodb
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("masking_batch_size")
+async def test_mongo_erasure_task_bulk_write(
+    db, mongo_inserts, integration_mongodb_config
+):
+    policy = erasure_policy("A", "B")
+    seed_email = mongo_inserts["customer"][0]["email"]
+    privacy_request = PrivacyRequest(id=f"test_mongo_bulk_erasure_task_{uuid4()}")
+
+    dataset, graph = integration_db_mongo_graph(
+        "mongo_test", integration_mongodb_config.key
+    )
+    field([dataset], "mongo_test", "address", "city").data_categories = ["A"]
+    field([dataset], "mongo_test", "address", "state").data_categories = ["B"]
+    field([dataset], "mongo_test", "customer", "name").data_categories = ["A"]
+
+    await graph_task.run_access_request(
+        privacy_request,
+        policy,
+        graph,
+        [integration_mongodb_config],
+        {"email": seed_email},
+        db,
+    )
+    with mock.patch(
+        "pymongo.collection.Collection.bulk_write",
+        autospec=True,
+        side_effect=pymongo.collection.Collection.bulk_write,
+    ) as bulk_write:
+        v = await graph_task.run_erasure(
+            privacy_request,
+            policy,
+            graph,
+            [integration_mongodb_config],
+            {"email": seed_email},
+            get_cached_data_for_erasures(privacy_request.id),
+            db,
+        )
+    assert v == {
+        "mongo_test:customer": 1,
+        "mongo_test:payment_card": 0,
+        "mongo_test:orders": 0,
+        "mongo_test:address": 2,
+    }
+    # The two addresses are masked by a single bulk write
+    assert bulk_write.call_count == 2
+
+
 @pytest.mark.integration_mongodb
 @pytest.mark.integration
 @pytest.mark.asyncio
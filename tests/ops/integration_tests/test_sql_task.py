@@ -8,6 +8,7 @@ import pytest
 from fideslang import Dataset
 from sqlalchemy import text
 
+from fides.api.common_exceptions import RowLimitExceeded
 from fides.api.graph.config import (
     Collection,
     CollectionAddress,
@@ -21,7 +22,11 @@ from fides.api.graph.traversal import TraversalNode
 from fides.api.models.connectionconfig import ConnectionConfig
 from fides.api.models.datasetconfig import convert_dataset_to_graph
 from fides.api.models.policy import ActionType, Policy, Rule, RuleTarget
-from fides.api.models.privacy_request import ExecutionLog, PrivacyRequest
+from fides.api.models.privacy_request import (
+    ExecutionLog,
+    ExecutionLogStatus,
+    PrivacyRequest,
+)
 from fides.api.service.connectors import get_connector
 from fides.api.task import graph_task
 from fides.api.task.filter_results import filter_data_categories
@@ -356,6 +361,95 @@ async def test_postgres_access_request_task(
     )
 
 
+@pytest.fixture
+def streamed_retrieval():
+    original_batch_size = CONFIG.execution.retrieval_batch_size
+    original_row_limit = CONFIG.execution.retrieval_row_limit
+    CONFIG.execution.retrieval_batch_size = 1
+    CONFIG.execution.retrieval_row_limit = 3
+    yield
+    CONFIG.execution.retrieval_batch_size = original_batch_size
+    CONFIG.execution.retrieval_row_limit = original_row_limit
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("streamed_retrieval")
+async def test_postgres_access_request_task_streamed_with_row_limit(
+    db,
+    policy,
+    integration_postgres_config,
+    postgres_integration_db,
+) -> None:
+    privacy_request = PrivacyRequest(id=str(uuid4()))
+
+    v = await graph_task.run_access_request(
+        privacy_request,
+        policy,
+        integration_db_graph("postgres_example"),
+        [integration_postgres_config],
+        {"email": "customer-1@example.com"},
+        db,
+    )
+
+    assert len(v["postgres_example:customer"]) == 1
+    assert v["postgres_example:customer"][0]["email"] == "customer-1@example.com"
+    # customer-1 has three orders, which is within the row limit
+    assert_rows_match(
+        v["postgres_example:orders"],
+        min_size=3,
+        keys=["id", "customer_id", "shipping_address_id", "payment_card_id"],
+    )
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("streamed_retrieval")
+async def test_postgres_access_request_task_row_limit_exceeded(
+    db,
+    policy,
+    integration_postgres_config,
+    postgres_integration_db,
+) -> None:
+    CONFIG.execution.retrieval_row_limit = 2
+    privacy_request = PrivacyRequest(id=str(uuid4()))
+
+    # customer-1 has three orders, more than the row limit
+    with pytest.raises(RowLimitExceeded):
+        await graph_task.run_access_request(
+            privacy_request,
+            policy,
+            integration_db_graph("postgres_example"),
+            [integration_postgres_config],
+            {"email": "customer-1@example.com"},
+            db,
+        )
+
+    error_log = (
+        db.query(ExecutionLog)
+        .filter_by(
+            privacy_request_id=privacy_request.id,
+            collection_name="orders",
+            status=ExecutionLogStatus.error,
+        )
+        .one()
+    )
+    assert "retrieval_row_limit" in error_log.message
+    # the collection is not retried
+    assert (
+        db.query(ExecutionLog)
+        .filter_by(
+            privacy_request_id=privacy_request.id,
+            collection_name="orders",
+            status=ExecutionLogStatus.retrying,
+        )
+        .count()
+        == 0
+    )
+
+
 @pytest.mark.integration_postgres
 @pytest.mark.integration
 @pytest.mark.asyncio
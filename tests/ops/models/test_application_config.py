@@ -1,10 +1,12 @@
 from json import dumps
 from typing import Any, Dict
+from unittest import mock
 
 import pytest
 from sqlalchemy.orm import Session
 
 from fides.api.models.application_config import ApplicationConfig
+from fides.api.util.cache import FidesopsRedis, get_cache_connection
 from fides.core.config import get_config
 from fides.core.config.config_proxy import ConfigProxy
 
@@ -442,3 +444,63 @@ class TestConfigProxy:
         assert (
             notification_service_type == CONFIG.notifications.notification_service_type
         )
+
+    @pytest.mark.usefixtures("insert_app_config", "insert_example_config_record")
+    def test_config_proxy_cached(self, db, config_proxy: ConfigProxy):
+        assert config_proxy.notifications.notification_service_type == "twilio_email"
+
+        with mock.patch.object(db, "query", wraps=db.query) as query:
+            assert (
+                config_proxy.notifications.notification_service_type == "twilio_email"
+            )
+            assert (
+                config_proxy.notifications.send_request_completion_notification
+                == CONFIG.notifications.send_request_completion_notification
+            )
+            assert not query.called
+
+    @pytest.mark.usefixtures("insert_app_config", "insert_example_config_record")
+    def test_config_proxy_cache_version_read_once_per_interval(
+        self, config_proxy: ConfigProxy
+    ):
+        with mock.patch.object(CONFIG.redis, "version_check_interval_seconds", 0):
+            with mock.patch(
+                "fides.api.util.cache_version.get_cache_connection",
+                wraps=get_cache_connection,
+            ) as cache_connection, mock.patch.object(FidesopsRedis, "ping") as ping:
+                assert (
+                    config_proxy.notifications.notification_service_type
+                    == "twilio_email"
+                )
+                assert cache_connection.call_count == 1
+                assert not ping.called
+
+        with mock.patch.object(CONFIG.redis, "version_check_interval_seconds", 60):
+            assert (
+                config_proxy.notifications.notification_service_type == "twilio_email"
+            )
+            with mock.patch(
+                "fides.api.util.cache_version.get_cache_connection"
+            ) as cache_connection:
+                assert (
+                    config_proxy.notifications.notification_service_type
+                    == "twilio_email"
+                )
+                assert not cache_connection.called
+
+    @pytest.mark.usefixtures("insert_app_config", "insert_example_config_record")
+    def test_config_proxy_cache_invalidated(self, db, config_proxy: ConfigProxy):
+        assert config_proxy.notifications.notification_service_type == "twilio_email"
+
+        other_session = Session(bind=db.get_bind())
+        try:
+            ApplicationConfig.update_api_set(
+                other_session,
+                api_set_dict={
+                    "notifications": {"notification_service_type": "mailgun"}
+                },
+            )
+        finally:
+            other_session.close()
+
+        assert config_proxy.notifications.notification_service_type == "mailgun"
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from fideslang.validation import FidesValidationError
 from sqlalchemy.orm import Session
@@ -12,6 +14,7 @@ from fides.api.models.privacy_notice import (
     check_conflicting_data_uses,
     new_data_use_conflicts_with_existing_use,
 )
+from fides.api.util.relevant_systems_cache import get_relevant_systems
 
 
 class TestPrivacyNoticeModel:
@@ -754,6 +757,32 @@ class TestPrivacyNoticeModel:
             == []
         ), "This is an exact match but this privacy notice is frontend only"
 
+    def test_get_relevant_systems_cached(
+        self, db, system, privacy_notice, privacy_notice_us_ca_provide
+    ):
+        privacy_notice_histories = [
+            privacy_notice.histories[0],
+            privacy_notice_us_ca_provide.histories[0],
+        ]
+        expected = {
+            privacy_notice.histories[0].id: [system.fides_key],
+            privacy_notice_us_ca_provide.histories[0].id: [],
+        }
+        assert get_relevant_systems(db, privacy_notice_histories) == expected
+
+        with mock.patch.object(db, "query", wraps=db.query) as query:
+            assert get_relevant_systems(db, privacy_notice_histories) == expected
+            assert not query.called
+
+        # Changing a system's data use invalidates the relevant systems
+        system.privacy_declarations[0].update(
+            db=db, data={"data_use": "essential.service"}
+        )
+        assert get_relevant_systems(db, privacy_notice_histories) == {
+            privacy_notice.histories[0].id: [],
+            privacy_notice_us_ca_provide.histories[0].id: [system.fides_key],
+        }
+
     def test_generate_privacy_notice_key(self, privacy_notice):
         assert (
             PrivacyNotice.generate_notice_key("Example Privacy Notice")
@@ -471,6 +471,108 @@ class TestPrivacyPreferenceHistory:
             # Can't refresh because this preference has been deleted, and consolidated with the other
             db.refresh(fides_user_device_current_preference)
 
+    def test_bulk_create_privacy_preferences(
+        self, db, system, privacy_notice, privacy_notice_us_ca_provide
+    ):
+        fides_user_provided_identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": "fides_user_device_id",
+                "hashed_value": ProvidedIdentity.hash_value(
+                    "test_fides_user_device_id_1234567"
+                ),
+                "encrypted_value": {"value": "test_fides_user_device_id_1234567"},
+            },
+        )
+        provided_identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": "email",
+                "hashed_value": ProvidedIdentity.hash_value("test@email.com"),
+                "encrypted_value": {"value": "test@email.com"},
+            },
+        )
+        # Preferences for the same notice previously saved separately under each identity
+        device_preference = PrivacyPreferenceHistory.create(
+            db=db,
+            data={
+                "preference": "opt_out",
+                "privacy_notice_history_id": privacy_notice.histories[0].id,
+                "fides_user_device_provided_identity_id": fides_user_provided_identity.id,
+            },
+            check_name=False,
+        ).current_privacy_preference
+        email_preference = PrivacyPreferenceHistory.create(
+            db=db,
+            data={
+                "preference": "opt_out",
+                "privacy_notice_history_id": privacy_notice.histories[0].id,
+                "provided_identity_id": provided_identity.id,
+            },
+            check_name=False,
+        ).current_privacy_preference
+
+        histories = PrivacyPreferenceHistory.bulk_create(
+            db=db,
+            data=[
+                {
+                    "preference": "opt_in",
+                    "privacy_notice_history_id": privacy_notice_history.id,
+                    "provided_identity_id": provided_identity.id,
+                    "fides_user_device_provided_identity_id": fides_user_provided_identity.id,
+                }
+                for privacy_notice_history in [
+                    privacy_notice.histories[0],
+                    privacy_notice_us_ca_provide.histories[0],
+                ]
+            ],
+        )
+
+        assert [history.relevant_systems for history in histories] == [
+            [system.fides_key],
+            [],
+        ]
+        assert all(
+            history.preference == UserConsentPreference.opt_in for history in histories
+        )
+
+        # The existing preferences were consolidated into the one saved under the email
+        current_preference = histories[0].current_privacy_preference
+        assert current_preference == email_preference
+        assert current_preference.preference == UserConsentPreference.opt_in
+        assert (
+            current_preference.fides_user_device_provided_identity_id
+            == fides_user_provided_identity.id
+        )
+        with pytest.raises(InvalidRequestError):
+            db.refresh(device_preference)
+
+        new_preference = histories[1].current_privacy_preference
+        assert new_preference.privacy_notice_id == privacy_notice_us_ca_provide.id
+        assert new_preference.provided_identity_id == provided_identity.id
+        assert new_preference.preference == UserConsentPreference.opt_in
+
+    def test_bulk_create_privacy_preferences_no_privacy_notice_history(
+        self, db, privacy_notice, fides_user_provided_identity
+    ):
+        with pytest.raises(PrivacyNoticeHistoryNotFound):
+            PrivacyPreferenceHistory.bulk_create(
+                db=db,
+                data=[
+                    {
+                        "preference": "opt_in",
+                        "privacy_notice_history_id": privacy_notice_history_id,
+                        "fides_user_device_provided_identity_id": fides_user_provided_identity.id,
+                    }
+                    for privacy_notice_history_id in [
+                        privacy_notice.histories[0].id,
+                        "nonexistent_notice",
+                    ]
+                ],
+            )
+
     def test_update_current_privacy_preferences_fides_id_only(
         self, db, privacy_notice, fides_user_provided_identity
     ):
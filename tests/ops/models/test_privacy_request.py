@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from time import sleep
 from typing import List, Tuple
+from unittest import mock
 from uuid import uuid4
 
 import pytest
@@ -14,6 +15,7 @@ from fides.api.common_exceptions import (
     NoCachedManualWebhookEntry,
     PrivacyRequestPaused,
 )
+from fides.api.cryptography.cryptographic_util import hmac_with_key
 from fides.api.graph.config import CollectionAddress
 from fides.api.models.policy import CurrentStep, Policy
 from fides.api.models.privacy_request import (
@@ -49,6 +51,72 @@ def test_blank_provided_identity_to_identity(
     assert identity.email is None
 
 
+@pytest.fixture
+def blind_index_backfill_pending(monkeypatch):
+    """Forget whether the blind index backfill is complete, so it is checked again"""
+    monkeypatch.setattr(
+        "fides.api.models.privacy_request._blind_index_backfill_complete", False
+    )
+    monkeypatch.setattr(
+        "fides.api.models.privacy_request._blind_index_backfill_checked_at",
+        float("-inf"),
+    )
+
+
+class TestProvidedIdentityBlindIndex:
+    def test_blind_index_set_on_create(
+        self, provided_identity_and_consent_request, provided_identity_value
+    ) -> None:
+        provided_identity = provided_identity_and_consent_request[0]
+        assert provided_identity.blind_index == ProvidedIdentity.blind_index_value(
+            provided_identity_value
+        )
+        assert provided_identity.blind_index != provided_identity.hashed_value
+
+    def test_blind_index_not_keyed_with_app_encryption_key(
+        self, provided_identity_and_consent_request, provided_identity_value
+    ) -> None:
+        provided_identity = provided_identity_and_consent_request[0]
+        assert provided_identity.blind_index != hmac_with_key(
+            provided_identity_value.encode("UTF-8"),
+            CONFIG.security.app_encryption_key.encode("UTF-8"),
+        )
+
+    def test_blind_index_not_set_without_value(self, empty_provided_identity) -> None:
+        assert empty_provided_identity.blind_index is None
+
+    def test_value_matches(
+        self, db, provided_identity_and_consent_request, provided_identity_value
+    ) -> None:
+        provided_identity = provided_identity_and_consent_request[0]
+        assert ProvidedIdentity.filter(
+            db=db,
+            conditions=ProvidedIdentity.value_matches(db, provided_identity_value),
+        ).all() == [provided_identity]
+        assert (
+            ProvidedIdentity.filter(
+                db=db,
+                conditions=ProvidedIdentity.value_matches(db, "other@email.com"),
+            ).first()
+            is None
+        )
+
+    @pytest.mark.usefixtures("blind_index_backfill_pending")
+    def test_value_matches_identity_without_blind_index(
+        self, db, provided_identity_and_consent_request, provided_identity_value
+    ) -> None:
+        provided_identity = provided_identity_and_consent_request[0]
+        db.query(ProvidedIdentity).filter(
+            ProvidedIdentity.id == provided_identity.id
+        ).update({"blind_index": None}, synchronize_session=False)
+
+        assert not ProvidedIdentity.blind_index_backfill_complete(db)
+        assert ProvidedIdentity.filter(
+            db=db,
+            conditions=ProvidedIdentity.value_matches(db, provided_identity_value),
+        ).all() == [provided_identity]
+
+
 def test_privacy_request(
     db: Session,
     policy: Policy,
@@ -251,6 +319,56 @@ def test_delete_privacy_request_removes_cached_data(
     assert cache.get(key) is None
 
 
+class TestPrivacyRequestCacheIndex:
+    def test_indexed_results_read_without_scan(
+        self, cache: FidesopsRedis, privacy_request
+    ) -> None:
+        privacy_request.start_cache_index()
+        privacy_request.cache_identity(Identity(email="customer-1@example.com"))
+        cache.set_encoded_object(
+            f"{privacy_request.id}__access_request__test_dataset:test_collection",
+            [{"id": 1}],
+            index=privacy_request.cache_index,
+        )
+
+        with mock.patch.object(cache, "scan") as mock_scan:
+            assert privacy_request.get_cached_identity_data() == {
+                "email": "customer-1@example.com"
+            }
+            assert privacy_request.get_results() == {
+                f"EN_{privacy_request.id}__access_request__test_dataset:test_collection": [
+                    {"id": 1}
+                ]
+            }
+            mock_scan.assert_not_called()
+
+    def test_index_cached_keys_from_before_index(
+        self, db: Session, cache: FidesopsRedis, privacy_request
+    ) -> None:
+        identity_key = get_identity_cache_key(privacy_request.id, "email")
+        cache.set_with_autoexpire(identity_key, "customer-1@example.com")
+        cache.set_encoded_object(
+            f"{privacy_request.id}__access_request__test_dataset:test_collection",
+            [{"id": 1}],
+        )
+        assert not cache.is_index_complete(privacy_request.cache_index)
+        assert privacy_request.get_cached_identity_data() == {
+            "email": "customer-1@example.com"
+        }
+
+        privacy_request.index_cached_keys()
+
+        assert cache.is_index_complete(privacy_request.cache_index)
+        assert set(cache.get_keys_by_index(privacy_request.cache_index)) == {
+            identity_key,
+            f"EN_{privacy_request.id}__access_request__test_dataset:test_collection",
+        }
+
+        privacy_request.delete(db)
+        assert cache.get(identity_key) is None
+        assert not cache.exists(privacy_request.cache_index)
+
+
 class TestPrivacyRequestTriggerWebhooks:
     def test_trigger_one_way_policy_webhook(
         self,
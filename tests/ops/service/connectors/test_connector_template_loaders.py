@@ -1,3 +1,4 @@
+import json
 import os
 from io import BytesIO
 from unittest import mock
@@ -59,6 +60,82 @@ class TestFileConnectorTemplateLoader:
         assert connector_templates.get("not_found") is None
 
 
+class TestFileConnectorTemplateManifest:
+    @pytest.fixture(autouse=True)
+    def template_manifest_path(self, tmp_path):
+        FileConnectorTemplateLoader._instance = None
+        manifest_path = str(tmp_path / "manifest.json")
+        with mock.patch(
+            "fides.api.service.connectors.saas.connector_registry_service.TEMPLATE_MANIFEST_PATH",
+            manifest_path,
+        ):
+            yield manifest_path
+        FileConnectorTemplateLoader._instance = None
+
+    def test_unchanged_templates_not_validated_again(self, template_manifest_path):
+        connector_templates = dict(
+            FileConnectorTemplateLoader.get_connector_templates()
+        )
+        assert os.path.exists(template_manifest_path)
+
+        FileConnectorTemplateLoader._instance = None
+        with mock.patch(
+            "fides.api.service.connectors.saas.connector_registry_service.ConnectorTemplate",
+            wraps=ConnectorTemplate,
+        ) as connector_template_mock:
+            assert (
+                FileConnectorTemplateLoader.get_connector_templates()
+                == connector_templates
+            )
+        connector_template_mock.assert_not_called()
+
+    @pytest.mark.parametrize("field, value", [("hash", "outdated"), ("type", "stripe")])
+    def test_changed_templates_validated_again(
+        self, template_manifest_path, field, value
+    ):
+        connector_templates = dict(
+            FileConnectorTemplateLoader.get_connector_templates()
+        )
+
+        with open(template_manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+        manifest["templates"]["mailchimp_config.yml"][field] = value
+        with open(template_manifest_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+
+        FileConnectorTemplateLoader._instance = None
+        with mock.patch(
+            "fides.api.service.connectors.saas.connector_registry_service.ConnectorTemplate",
+            wraps=ConnectorTemplate,
+        ) as connector_template_mock:
+            assert (
+                FileConnectorTemplateLoader.get_connector_templates()
+                == connector_templates
+            )
+        connector_template_mock.assert_called_once()
+        assert (
+            connector_template_mock.call_args.kwargs["config"]
+            == connector_templates["mailchimp"].config
+        )
+
+        with open(template_manifest_path, "r", encoding="utf-8") as file:
+            assert json.load(file)["templates"]["mailchimp_config.yml"][field] != value
+
+    def test_manifest_replaced_rather_than_written_through(
+        self, template_manifest_path, tmp_path
+    ):
+        target_path = tmp_path / "target.json"
+        os.symlink(target_path, template_manifest_path)
+
+        FileConnectorTemplateLoader.get_connector_templates()
+
+        assert not target_path.exists()
+        assert not os.path.islink(template_manifest_path)
+        with open(template_manifest_path, "r", encoding="utf-8") as file:
+            assert "mailchimp_config.yml" in json.load(file)["templates"]
+        assert os.listdir(tmp_path) == ["manifest.json"]
+
+
 class TestCustomConnectorTemplateLoader:
     @pytest.fixture(autouse=True)
     def reset_connector_template_loaders(self):
@@ -0,0 +1,102 @@
+from unittest import mock
+
+import pytest
+
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
+from fides.api.service.connectors.dynamodb_connector import DynamoDBConnector
+from fides.connectors.models import ConnectorFailureException
+from fides.core.config import CONFIG
+
+
+@pytest.fixture
+def dynamodb_connector() -> DynamoDBConnector:
+    connector = DynamoDBConnector(
+        ConnectionConfig(key="dynamodb_test", connection_type=ConnectionType.dynamodb)
+    )
+    connector.db_client = mock.Mock()
+    return connector
+
+
+@mock.patch("fides.api.service.connectors.dynamodb_connector.sleep")
+class TestDynamoDBBatchWriteItems:
+    items = [{"email": {"S": f"customer-{i}@example.com"}} for i in range(3)]
+
+    def test_batch_write_items(self, mock_sleep, dynamodb_connector):
+        dynamodb_connector.db_client.batch_write_item.return_value = {
+            "UnprocessedItems": {}
+        }
+
+        assert dynamodb_connector.batch_write_items("customer", self.items) == 3
+        dynamodb_connector.db_client.batch_write_item.assert_called_once_with(
+            RequestItems={
+                "customer": [{"PutRequest": {"Item": item}} for item in self.items]
+            }
+        )
+        mock_sleep.assert_not_called()
+
+    def test_batch_write_items_retries_unprocessed_items(
+        self, mock_sleep, dynamodb_connector
+    ):
+        unprocessed = [{"PutRequest": {"Item": self.items[2]}}]
+        dynamodb_connector.db_client.batch_write_item.side_effect = [
+            {"UnprocessedItems": {"customer": unprocessed}},
+            {"UnprocessedItems": {}},
+        ]
+
+        assert dynamodb_connector.batch_write_items("customer", self.items) == 3
+        assert dynamodb_connector.db_client.batch_write_item.call_count == 2
+        assert dynamodb_connector.db_client.batch_write_item.call_args.kwargs == {
+            "RequestItems": {"customer": unprocessed}
+        }
+        mock_sleep.assert_called_once()
+
+    def test_batch_write_items_unprocessed_after_retries(
+        self, mock_sleep, dynamodb_connector
+    ):
+        dynamodb_connector.db_client.batch_write_item.return_value = {
+            "UnprocessedItems": {"customer": [{"PutRequest": {"Item": self.items[2]}}]}
+        }
+
+        with pytest.raises(ConnectorFailureException):
+            dynamodb_connector.batch_write_items("customer", self.items)
+
+
+class TestDynamoDBMaskData:
+    @pytest.fixture
+    def masking_batch_size(self):
+        original_value = CONFIG.execution.masking_batch_size
+        CONFIG.execution.masking_batch_size = 10
+        yield
+        CONFIG.execution.masking_batch_size = original_value
+
+    @pytest.mark.usefixtures("masking_batch_size")
+    def test_mask_data_dedupes_items_by_key(self, dynamodb_connector):
+        """Duplicate rows are written once even when masking them gives different values"""
+        query_config = mock.Mock(key_attribute_names=["email"])
+        query_config.generate_update_stmt.side_effect = [
+            {"email": {"S": "customer-1@example.com"}, "name": {"S": "random-1"}},
+            {"email": {"S": "customer-1@example.com"}, "name": {"S": "random-2"}},
+            {"email": {"S": "customer-2@example.com"}, "name": {"S": "random-3"}},
+        ]
+        dynamodb_connector.query_config = mock.Mock(return_value=query_config)
+        dynamodb_connector.db_client.batch_write_item.return_value = {
+            "UnprocessedItems": {}
+        }
+        node = mock.Mock()
+        node.address.collection = "customer"
+
+        rows = [
+            {"email": "customer-1@example.com", "name": "John"},
+            {"email": "customer-1@example.com", "name": "John"},
+            {"email": "customer-2@example.com", "name": "Jane"},
+        ]
+        assert (
+            dynamodb_connector.mask_data(node, mock.Mock(), mock.Mock(), rows, {}) == 2
+        )
+        written = dynamodb_connector.db_client.batch_write_item.call_args.kwargs[
+            "RequestItems"
+        ]["customer"]
+        assert [request["PutRequest"]["Item"]["name"]["S"] for request in written] == [
+            "random-2",
+            "random-3",
+        ]
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, Set
+from unittest import mock
 
 import pytest
 from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
@@ -24,6 +25,9 @@ from fides.api.service.connectors.query_config import (
     SQLQueryConfig,
 )
 from fides.api.service.masking.strategy.masking_strategy_hash import HashMaskingStrategy
+from fides.api.service.masking.strategy.masking_strategy_string_rewrite import (
+    StringRewriteMaskingStrategy,
+)
 from fides.api.util.data_category import DataCategory
 
 from ...task.traversal_data import combined_mongo_postgresql_graph, integration_db_graph
@@ -352,6 +356,146 @@ class TestSQLQueryConfig:
             text_clause._bindparams["email"].value == "*****"
         )  # String rewrite masking strategy
 
+    @pytest.fixture(scope="function")
+    def customer_query_config(self, example_datasets, connection_config):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+        return SQLQueryConfig(customer_node)
+
+    def test_generate_batched_update_stmts_same_values(
+        self, erasure_policy, customer_query_config
+    ):
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 6)
+        ]
+
+        statements = customer_query_config.generate_batched_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=2
+        )
+
+        # Null masking gives every row the same masked values, so the rows are
+        # updated together in batches of two
+        assert len(statements) == 3
+        for stmt, _ in statements:
+            assert stmt.text == "UPDATE customer SET name = :name WHERE id IN :id"
+            assert stmt._bindparams["id"].expanding
+        assert [params for _, params in statements] == [
+            [{"name": None, "id": [1, 2]}],
+            [{"name": None, "id": [3, 4]}],
+            [{"name": None, "id": [5]}],
+        ]
+
+    def test_generate_batched_update_stmts_different_values(
+        self, erasure_policy, customer_query_config
+    ):
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 4)
+        ]
+
+        rule = erasure_policy.rules[0]
+        rule.masking_strategy = {
+            "strategy": "hash",
+            "configuration": {"algorithm": "SHA-512"},
+        }
+        secret = MaskingSecretCache[str](
+            secret="adobo",
+            masking_strategy=HashMaskingStrategy.name,
+            secret_type=SecretType.salt,
+        )
+        cache_secret(secret, privacy_request.id)
+
+        statements = customer_query_config.generate_batched_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=10
+        )
+
+        # Each row has its own masked value, so the statement is executed once per row
+        assert len(statements) == 1
+        stmt, params = statements[0]
+        assert stmt.text == "UPDATE customer SET name = :name WHERE id = :id"
+        assert [param["id"] for param in params] == [1, 2, 3]
+        assert (
+            params[0]["name"]
+            == HashMaskingStrategy(HashMaskingConfiguration(algorithm="SHA-512")).mask(
+                ["Customer 1"], request_id=privacy_request.id
+            )[0][0:40]
+        )
+        clear_cache_secrets(privacy_request.id)
+
+    def test_generate_batched_update_stmts_missing_primary_key(
+        self, erasure_policy, customer_query_config
+    ):
+        rows = [{"email": "customer-1@example.com", "name": "John Customer"}]
+
+        assert (
+            customer_query_config.generate_batched_update_stmts(
+                rows, erasure_policy, privacy_request, batch_size=10
+            )
+            == []
+        )
+
+    def test_build_masking_plan(self, erasure_policy, customer_query_config):
+        masking_plan = customer_query_config.build_masking_plan(erasure_policy)
+
+        assert [field_plan.field_path for field_plan in masking_plan] == [
+            FieldPath("name")
+        ]
+        assert masking_plan[0].null_masking
+        # the plan is reused for the same policy
+        assert customer_query_config.build_masking_plan(erasure_policy) is masking_plan
+
+    def test_update_value_maps_masks_each_field_once(
+        self, erasure_policy, customer_query_config
+    ):
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 4)
+        ]
+        erasure_policy.rules[0].masking_strategy = {
+            "strategy": "string_rewrite",
+            "configuration": {"rewrite_value": "MASKED"},
+        }
+
+        with mock.patch.object(
+            StringRewriteMaskingStrategy,
+            "mask",
+            autospec=True,
+            side_effect=lambda strategy, values, request_id: [
+                f"masked {value}" for value in values
+            ],
+        ) as mock_mask:
+            value_maps = customer_query_config.update_value_maps(
+                rows, erasure_policy, privacy_request
+            )
+
+        mock_mask.assert_called_once()
+        assert value_maps == [
+            {"name": "masked Customer 1"},
+            {"name": "masked Customer 2"},
+            {"name": "masked Customer 3"},
+        ]
+
 
 class TestMongoQueryConfig:
     @pytest.fixture(scope="function")
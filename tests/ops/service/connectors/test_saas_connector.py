@@ -1,5 +1,6 @@
 import json
 import random
+from time import sleep
 from typing import List
 from unittest import mock
 from unittest.mock import Mock
@@ -19,9 +20,18 @@ from fides.api.schemas.saas.saas_config import ParamValue, SaaSConfig, SaaSReque
 from fides.api.schemas.saas.shared_schemas import HTTPMethod
 from fides.api.service.connectors import get_connector
 from fides.api.service.connectors.saas_connector import SaaSConnector
+from fides.core.config import CONFIG
 from tests.ops.graph.graph_test_util import generate_node
 
 
+@pytest.fixture
+def saas_request_max_workers():
+    original_value = CONFIG.execution.saas_request_max_workers
+    CONFIG.execution.saas_request_max_workers = 3
+    yield
+    CONFIG.execution.saas_request_max_workers = original_value
+
+
 @pytest.mark.unit_saas
 class TestSaasConnector:
     """
@@ -189,6 +199,108 @@ class TestSaasConnector:
             {"fidesops_grouped_inputs": [], "conversation_id": ["456"]},
         ) == [{"id": "123", "from_email": "test@example.com"}]
 
+    @pytest.mark.usefixtures("saas_request_max_workers")
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_concurrent_input_values(
+        self, mock_send: Mock, saas_example_config, saas_example_connection_config
+    ):
+        """
+        Verifies that the independent requests of a collection are sent concurrently
+        and their rows are returned in the order of the requests
+        """
+
+        def send(request_params, ignore_errors):
+            conversation_id = request_params.path.split("/")[-2]
+            if conversation_id == "1":
+                sleep(0.1)
+            response = Mock()
+            response.json.return_value = {
+                "conversation_messages": [
+                    {"id": conversation_id, "from_email": "test@example.com"}
+                ]
+            }
+            return response
+
+        mock_send.side_effect = send
+
+        saas_config = SaaSConfig(**saas_example_config)
+        graph = saas_config.get_graph(saas_example_connection_config.secrets)
+        node = Node(
+            graph,
+            next(
+                collection
+                for collection in graph.collections
+                if collection.name == "messages"
+            ),
+        )
+        traversal_node = TraversalNode(node)
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+
+        privacy_request = PrivacyRequest(id="123")
+        privacy_request.cache_identity(Identity(email="test@example.com"))
+
+        assert connector.retrieve_data(
+            traversal_node,
+            Policy(),
+            privacy_request,
+            {"fidesops_grouped_inputs": [], "conversation_id": ["1", "2", "3"]},
+        ) == [
+            {"id": "1", "from_email": "test@example.com"},
+            {"id": "2", "from_email": "test@example.com"},
+            {"id": "3", "from_email": "test@example.com"},
+        ]
+        assert mock_send.call_count == 3
+
+    @pytest.mark.usefixtures("saas_request_max_workers")
+    def test_oauth2_requests_not_concurrent(
+        self,
+        saas_example_connection_config,
+        oauth2_authorization_code_connection_config,
+    ):
+        """
+        Verifies that requests authenticated with a strategy that may refresh and store
+        its tokens are sent one at a time
+        """
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        connector.set_saas_request_state(
+            SaaSRequest(path="test_path", method=HTTPMethod.GET)
+        )
+        assert connector.get_max_request_workers() == 3
+
+        oauth2_connector: SaaSConnector = get_connector(
+            oauth2_authorization_code_connection_config
+        )
+        oauth2_connector.set_saas_request_state(
+            SaaSRequest(path="test_path", method=HTTPMethod.GET)
+        )
+        assert oauth2_connector.get_max_request_workers() == 1
+
+    def test_clients_reused(self, saas_example_connection_config):
+        """
+        Verifies that clients are reused for the same client and rate limit config,
+        and that every client shares the connector's session
+        """
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+        connector.set_saas_request_state(
+            SaaSRequest(path="test_path", method=HTTPMethod.GET)
+        )
+        client = connector.create_client()
+        assert connector.create_client() is client
+
+        connector.set_saas_request_state(
+            SaaSRequest(
+                path="test_path",
+                method=HTTPMethod.GET,
+                rate_limit_config={"enabled": False},
+            )
+        )
+        other_client = connector.create_client()
+        assert other_client is not client
+        assert other_client.session is client.session
+
+        connector.close()
+        assert connector.create_client() is not other_client
+
     def test_missing_input_values(
         self, saas_example_config, saas_example_connection_config
     ):
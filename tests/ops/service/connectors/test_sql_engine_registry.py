@@ -0,0 +1,73 @@
+import pytest
+
+from fides.api.service.connectors.sql_connector import PostgreSQLConnector
+from fides.api.service.connectors.sql_engine_registry import (
+    dispose_all_engines,
+    get_pool_metrics,
+)
+from fides.core.config import CONFIG
+
+
+@pytest.fixture
+def sql_engine_reuse():
+    original_value = CONFIG.execution.sql_engine_reuse
+    CONFIG.execution.sql_engine_reuse = True
+    yield
+    CONFIG.execution.sql_engine_reuse = original_value
+    dispose_all_engines()
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+class TestSQLEngineRegistry:
+    def test_engine_disposed_without_reuse(self, connection_config):
+        connector = PostgreSQLConnector(connection_config)
+        engine = connector.client()
+        connector.close()
+
+        assert PostgreSQLConnector(connection_config).client() is not engine
+        assert get_pool_metrics() == {}
+
+    def test_engine_shared_across_connectors(
+        self,
+        postgres_integration_db,
+        connection_config,
+        sql_engine_reuse,
+        loguru_caplog,
+    ):
+        connector = PostgreSQLConnector(connection_config)
+        assert connector.test_connection()
+        engine = connector.client()
+        connector.close()
+        assert "'checked_out': 0" in loguru_caplog.text
+
+        other_connector = PostgreSQLConnector(connection_config)
+        assert other_connector.client() is engine
+        assert get_pool_metrics() == {
+            connection_config.key: {
+                "size": CONFIG.execution.sql_pool_size,
+                "checked_in": 1,
+                "checked_out": 0,
+                "overflow": 1 - CONFIG.execution.sql_pool_size,
+            }
+        }
+
+    @pytest.mark.usefixtures("sql_engine_reuse")
+    def test_engine_replaced_when_secrets_change(self, db, connection_config):
+        engine = PostgreSQLConnector(connection_config).client()
+
+        connection_config.secrets = {**connection_config.secrets, "port": 5433}
+        connection_config.save(db)
+
+        assert PostgreSQLConnector(connection_config).client() is not engine
+
+    @pytest.mark.usefixtures("sql_engine_reuse")
+    def test_engine_disposed_when_connection_config_deleted(
+        self, db, connection_config
+    ):
+        PostgreSQLConnector(connection_config).client()
+        assert connection_config.key in get_pool_metrics()
+
+        connection_config.delete(db)
+
+        assert get_pool_metrics() == {}
@@ -0,0 +1,28 @@
+from fides.api.models.privacy_request import ProvidedIdentity
+from fides.api.service.privacy_request.blind_index_service import backfill_blind_index
+
+
+def test_backfill_blind_index(
+    db, provided_identity_and_consent_request, provided_identity_value
+) -> None:
+    provided_identity = provided_identity_and_consent_request[0]
+    db.query(ProvidedIdentity).filter(
+        ProvidedIdentity.id == provided_identity.id
+    ).update({"blind_index": None}, synchronize_session=False)
+    db.commit()
+
+    assert backfill_blind_index(db, batch_size=1) >= 1
+
+    db.refresh(provided_identity)
+    assert provided_identity.blind_index == ProvidedIdentity.blind_index_value(
+        provided_identity_value
+    )
+    assert (
+        db.query(ProvidedIdentity)
+        .filter(
+            ProvidedIdentity.blind_index.is_(None),
+            ProvidedIdentity.encrypted_value.isnot(None),
+        )
+        .count()
+        == 0
+    )
@@ -0,0 +1,54 @@
+from unittest import mock
+
+import pytest
+
+from fides.api.graph.config import CollectionAddress
+from fides.api.models.datasetconfig import DatasetConfig
+from fides.api.service.privacy_request.dataset_graph_cache import (
+    clear_dataset_graph_cache,
+    get_dataset_graph,
+    get_dataset_graph_fingerprint,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_dataset_graph_cache():
+    clear_dataset_graph_cache()
+    yield
+    clear_dataset_graph_cache()
+
+
+class TestGetDatasetGraph:
+    def test_graph_reused_until_dataset_changes(
+        self, db, postgres_example_test_dataset_config
+    ):
+        graph = get_dataset_graph(db)
+        assert (
+            CollectionAddress("postgres_example_test_dataset", "customer")
+            in graph.nodes
+        )
+
+        with mock.patch.object(DatasetConfig, "get_graph") as mock_get_graph:
+            assert get_dataset_graph(db) is graph
+            mock_get_graph.assert_not_called()
+
+        ctl_dataset = postgres_example_test_dataset_config.ctl_dataset
+        ctl_dataset.description = "Updated description"
+        db.add(ctl_dataset)
+        db.commit()
+
+        updated_graph = get_dataset_graph(db)
+        assert updated_graph is not graph
+        assert updated_graph.nodes.keys() == graph.nodes.keys()
+
+    def test_graph_rebuilt_when_dataset_removed(
+        self, db, postgres_example_test_dataset_config
+    ):
+        fingerprint = get_dataset_graph_fingerprint(db)
+        assert len(fingerprint) == 1
+        assert get_dataset_graph(db).nodes
+
+        postgres_example_test_dataset_config.delete(db)
+
+        assert get_dataset_graph_fingerprint(db) == ()
+        assert get_dataset_graph(db).nodes == {}
@@ -1,3 +1,4 @@
+from threading import Barrier
 from typing import Any, Dict
 from unittest import mock
 
@@ -26,9 +27,13 @@ from fides.api.task.graph_task import (
     _evaluate_erasure_dependencies,
     build_affected_field_logs,
     collect_queries,
+    execute_task_graph,
+    get_cached_data_for_erasures,
     start_function,
     update_erasure_mapping_from_cache,
 )
+from fides.api.util.cache import ACCESS_RESULTS_REFERENCE, get_cache
+from fides.api.util.collection_util import FIDESOPS_DO_NOT_MASK_INDEX
 from fides.api.util.consent_util import (
     cache_initial_status_and_identities_for_consent_reporting,
 )
@@ -402,6 +407,103 @@ class TestPostProcessInputData:
         }
 
 
+class TestAccessResultsPostProcessing:
+    @pytest.fixture(scope="function")
+    def make_task(
+        self, integration_mongodb_config, connection_config, privacy_request, db
+    ):
+        def task(node):
+            return MockMongoTask(
+                node,
+                TaskResources(
+                    privacy_request,
+                    Policy(),
+                    [connection_config, integration_mongodb_config],
+                    db,
+                ),
+            )
+
+        return task
+
+    def test_placeholder_results_cached_for_filtered_arrays(
+        self, combined_traversal_node_dict, make_task, privacy_request
+    ):
+        node = combined_traversal_node_dict[CollectionAddress("mongo_test", "flights")]
+        task = make_task(node)
+
+        output = task.access_results_post_processing(
+            {"passenger_information.passenger_ids": ["A111-11111"]},
+            [
+                {
+                    "id": 1,
+                    "passenger_information": {
+                        "passenger_ids": ["A111-11111", "B111-11111"]
+                    },
+                }
+            ],
+        )
+
+        assert output == [
+            {"id": 1, "passenger_information": {"passenger_ids": ["A111-11111"]}}
+        ]
+        assert get_cached_data_for_erasures(privacy_request.id) == {
+            "mongo_test:flights": [
+                {
+                    "id": 1,
+                    "passenger_information": {
+                        "passenger_ids": ["A111-11111", FIDESOPS_DO_NOT_MASK_INDEX]
+                    },
+                }
+            ]
+        }
+
+    def test_access_results_referenced_when_nothing_filtered(
+        self, combined_traversal_node_dict, make_task, privacy_request
+    ):
+        node = combined_traversal_node_dict[CollectionAddress("mongo_test", "flights")]
+        task = make_task(node)
+        rows = [
+            {
+                "id": ObjectId("507f191e810c19729de860ea"),
+                "passenger_information": {"passenger_ids": ["A111-11111"]},
+            }
+        ]
+
+        assert (
+            task.access_results_post_processing(
+                {"passenger_information.passenger_ids": ["A111-11111"]}, rows
+            )
+            == rows
+        )
+
+        cache = get_cache()
+        assert (
+            cache.get_encoded_by_key(
+                f"EN_PLACEHOLDER_RESULTS__{privacy_request.id}__access_request__mongo_test:flights"
+            )
+            == ACCESS_RESULTS_REFERENCE
+        )
+        assert get_cached_data_for_erasures(privacy_request.id) == {
+            "mongo_test:flights": rows
+        }
+
+    def test_missing_referenced_access_results(
+        self, combined_traversal_node_dict, make_task, privacy_request
+    ):
+        node = combined_traversal_node_dict[CollectionAddress("mongo_test", "flights")]
+        task = make_task(node)
+        rows = [{"id": 1, "passenger_information": {"passenger_ids": ["A111-11111"]}}]
+        task.access_results_post_processing(
+            {"passenger_information.passenger_ids": ["A111-11111"]}, rows
+        )
+
+        cache = get_cache()
+        cache.delete(f"EN_{privacy_request.id}__access_request__mongo_test:flights")
+        assert get_cached_data_for_erasures(privacy_request.id) == {
+            "mongo_test:flights": []
+        }
+
+
 def test_sql_dry_run_queries(db) -> None:
     traversal = sample_traversal()
     env = collect_queries(
@@ -669,6 +771,48 @@ class TestUpdateErasureMappingFromCache:
         assert dsk[CollectionAddress("dr_1", "ds_1")] == 1
 
 
+class TestExecuteTaskGraph:
+    def test_independent_nodes_run_concurrently(self):
+        """Each of the three independent nodes waits on a barrier that is only
+        released once all three are running at the same time"""
+        barrier = Barrier(3, timeout=5)
+
+        def task(*inputs):
+            barrier.wait()
+            return 1
+
+        independent_nodes = [CollectionAddress("dr_1", f"ds_{i}") for i in range(3)]
+        dsk: Dict[CollectionAddress, Any] = {
+            address: (task, ROOT_COLLECTION_ADDRESS) for address in independent_nodes
+        }
+        dsk[ROOT_COLLECTION_ADDRESS] = 0
+        dsk[TERMINATOR_ADDRESS] = (lambda *x: sum(x), *independent_nodes)
+
+        assert execute_task_graph(dsk, num_workers=3) == 3
+
+    def test_dependent_nodes_run_in_order(self):
+        order = []
+
+        def task(name):
+            def run(*inputs):
+                order.append(name)
+                return name
+
+            return run
+
+        ds_1 = CollectionAddress("dr_1", "ds_1")
+        ds_2 = CollectionAddress("dr_1", "ds_2")
+        dsk: Dict[CollectionAddress, Any] = {
+            ROOT_COLLECTION_ADDRESS: 0,
+            ds_1: (task("ds_1"), ROOT_COLLECTION_ADDRESS),
+            ds_2: (task("ds_2"), ds_1),
+            TERMINATOR_ADDRESS: (lambda *x: x, ds_2),
+        }
+
+        assert execute_task_graph(dsk, num_workers=4) == ("ds_2",)
+        assert order == ["ds_1", "ds_2"]
+
+
 class TestGraphTaskAffectedConsentSystems:
     @pytest.fixture()
     def mock_graph_task(
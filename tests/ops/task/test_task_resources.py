@@ -1,4 +1,51 @@
-from fides.api.task.task_resources import TaskResources
+from time import sleep
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+from requests import Request
+
+from fides.api.graph.config import TERMINATOR_ADDRESS, CollectionAddress
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
+from fides.api.models.privacy_request import ExecutionLog, ExecutionLogStatus
+from fides.api.schemas.policy import ActionType
+from fides.api.service.authentication.authentication_strategy import (
+    AuthenticationStrategy,
+)
+from fides.api.task.graph_task import execute_task_graph
+from fides.api.task.task_resources import (
+    TaskResources,
+    get_connection_concurrency_limit,
+    get_num_workers,
+)
+from fides.core.config import CONFIG
+
+
+@pytest.fixture
+def connection_concurrency():
+    original_value = CONFIG.execution.task_max_connection_concurrency
+    CONFIG.execution.task_max_connection_concurrency = 2
+    yield
+    CONFIG.execution.task_max_connection_concurrency = original_value
+
+
+@pytest.fixture
+def multiple_workers():
+    original_value = CONFIG.execution.task_max_workers
+    CONFIG.execution.task_max_workers = 4
+    yield
+    CONFIG.execution.task_max_workers = original_value
+
+
+@pytest.fixture
+def batched_execution_logs():
+    original_batch_size = CONFIG.execution.execution_log_batch_size
+    original_flush_interval = CONFIG.execution.execution_log_flush_interval
+    CONFIG.execution.execution_log_batch_size = 3
+    CONFIG.execution.execution_log_flush_interval = 3600
+    yield
+    CONFIG.execution.execution_log_batch_size = original_batch_size
+    CONFIG.execution.execution_log_flush_interval = original_flush_interval
 
 
 class TestTaskResources:
@@ -42,3 +89,263 @@ class TestTaskResources:
             "manual_example:filing-cabinet": 2,
             "manual_example:storage-unit": 3,
         }
+
+    @pytest.mark.usefixtures("connection_concurrency")
+    def test_connection_slot(
+        self,
+        db,
+        privacy_request,
+        policy,
+        connection_config,
+        saas_example_connection_config,
+    ):
+        resources = TaskResources(
+            privacy_request,
+            policy,
+            [connection_config, saas_example_connection_config],
+            db,
+        )
+
+        postgres_semaphore = resources.connection_semaphores[connection_config.key]
+        with resources.connection_slot(connection_config.key):
+            with resources.connection_slot(connection_config.key):
+                # both slots for the connection are taken
+                assert not postgres_semaphore.acquire(blocking=False)
+
+        assert postgres_semaphore.acquire(blocking=False)
+        postgres_semaphore.release()
+
+        saas_semaphore = resources.connection_semaphores[
+            saas_example_connection_config.key
+        ]
+        with resources.connection_slot(saas_example_connection_config.key):
+            assert not saas_semaphore.acquire(blocking=False)
+
+    def test_connection_slot_unlimited(
+        self, db, privacy_request, policy, connection_config
+    ):
+        resources = TaskResources(privacy_request, policy, [connection_config], db)
+
+        assert resources.connection_semaphores == {}
+        with resources.connection_slot(connection_config.key):
+            with resources.connection_slot(connection_config.key):
+                pass
+
+    def test_worker_session_single_worker(
+        self, db, privacy_request, policy, connection_config
+    ):
+        resources = TaskResources(privacy_request, policy, [connection_config], db)
+
+        with resources.worker_session() as session:
+            assert session is db
+
+    def test_worker_session_multiple_workers(
+        self, db, privacy_request, policy, connection_config
+    ):
+        resources = TaskResources(
+            privacy_request, policy, [connection_config], db, num_workers=4
+        )
+
+        with resources.worker_session() as session:
+            assert session is not db
+            assert not resources.connection_disabled(connection_config)
+
+            ConnectionConfig.get(db=session, object_id=connection_config.id).update(
+                session, data={"disabled": True}
+            )
+
+        # The change is seen without the request's session being refreshed
+        assert not connection_config.disabled
+        assert resources.connection_disabled(connection_config)
+
+        connection_config.disabled = False
+        connection_config.save(db)
+
+    @pytest.mark.usefixtures("batched_execution_logs")
+    def test_write_execution_logs_in_batches(
+        self, db, privacy_request, policy, integration_manual_config
+    ):
+        resources = TaskResources(
+            privacy_request, policy, [integration_manual_config], db
+        )
+
+        def write_execution_log(collection: str, status: ExecutionLogStatus) -> None:
+            resources.write_execution_log(
+                integration_manual_config.key,
+                CollectionAddress("manual_example", collection),
+                [],
+                ActionType.access,
+                status,
+                status.value,
+            )
+
+        def written_logs():
+            return [
+                (log.collection_name, log.status)
+                for log in db.query(ExecutionLog)
+                .filter(ExecutionLog.privacy_request_id == privacy_request.id)
+                .order_by(ExecutionLog.created_at)
+            ]
+
+        write_execution_log("filing-cabinet", ExecutionLogStatus.in_processing)
+        write_execution_log("storage-unit", ExecutionLogStatus.in_processing)
+        assert written_logs() == []
+
+        # The batch is full
+        write_execution_log("box", ExecutionLogStatus.in_processing)
+        assert written_logs() == [
+            ("filing-cabinet", ExecutionLogStatus.in_processing),
+            ("storage-unit", ExecutionLogStatus.in_processing),
+            ("box", ExecutionLogStatus.in_processing),
+        ]
+
+        # Completed collections are written right away
+        write_execution_log("filing-cabinet", ExecutionLogStatus.complete)
+        assert written_logs()[3:] == [
+            ("filing-cabinet", ExecutionLogStatus.complete),
+        ]
+
+        # Failures are written right away
+        write_execution_log("storage-unit", ExecutionLogStatus.retrying)
+        write_execution_log("storage-unit", ExecutionLogStatus.error)
+        assert written_logs()[4:] == [
+            ("storage-unit", ExecutionLogStatus.retrying),
+            ("storage-unit", ExecutionLogStatus.error),
+        ]
+
+        # Logs left over are written when the resources are closed
+        write_execution_log("box", ExecutionLogStatus.retrying)
+        assert len(written_logs()) == 6
+        resources.close()
+        assert written_logs()[6:] == [("box", ExecutionLogStatus.retrying)]
+
+    @pytest.mark.usefixtures("batched_execution_logs")
+    def test_write_execution_logs_after_flush_interval(
+        self, db, privacy_request, policy, integration_manual_config
+    ):
+        CONFIG.execution.execution_log_flush_interval = 0.001
+        resources = TaskResources(
+            privacy_request, policy, [integration_manual_config], db
+        )
+
+        resources.write_execution_log(
+            integration_manual_config.key,
+            CollectionAddress("manual_example", "filing-cabinet"),
+            [],
+            ActionType.access,
+            ExecutionLogStatus.in_processing,
+        )
+        sleep(0.01)
+        resources.write_execution_log(
+            integration_manual_config.key,
+            CollectionAddress("manual_example", "filing-cabinet"),
+            [],
+            ActionType.access,
+            ExecutionLogStatus.retrying,
+        )
+
+        assert (
+            db.query(ExecutionLog)
+            .filter(ExecutionLog.privacy_request_id == privacy_request.id)
+            .count()
+            == 2
+        )
+
+
+class TestGetNumWorkers:
+    def test_single_worker(self, connection_config):
+        assert get_num_workers([connection_config]) == 1
+
+    @pytest.mark.usefixtures("multiple_workers")
+    def test_multiple_workers(self, connection_config, saas_example_connection_config):
+        assert (
+            get_num_workers([connection_config, saas_example_connection_config])
+            == CONFIG.execution.task_max_workers
+        )
+
+    @pytest.mark.usefixtures("multiple_workers")
+    def test_single_worker_for_token_refreshing_authentication(
+        self, connection_config, oauth2_authorization_code_connection_config
+    ):
+        assert (
+            get_num_workers(
+                [connection_config, oauth2_authorization_code_connection_config]
+            )
+            == 1
+        )
+
+    @pytest.mark.usefixtures("multiple_workers")
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_refresh_token_with_multiple_workers(
+        self,
+        mock_send: Mock,
+        db,
+        privacy_request,
+        policy,
+        oauth2_authorization_code_connection_config,
+        oauth2_authorization_code_configuration,
+    ):
+        mock_send().json.return_value = {
+            "access_token": "new_access",
+            "expires_in": 3600,
+        }
+        connection_config = oauth2_authorization_code_connection_config
+        connection_config.secrets = {**connection_config.secrets, "expires_at": 0}
+        connection_config.save(db)
+
+        resources = TaskResources(
+            privacy_request,
+            policy,
+            [connection_config],
+            db,
+            get_num_workers([connection_config]),
+        )
+        auth_strategy = AuthenticationStrategy.get_strategy(
+            "oauth2_authorization_code", oauth2_authorization_code_configuration
+        )
+
+        def authenticate() -> str:
+            request = Request(method="GET", url="https://localhost/test").prepare()
+            return auth_strategy.add_authentication(request, connection_config).headers[
+                "Authorization"
+            ]
+
+        first = CollectionAddress("oauth2_authorization_code_connector", "first")
+        second = CollectionAddress("oauth2_authorization_code_connector", "second")
+        dsk = {
+            first: (authenticate,),
+            second: (authenticate,),
+            TERMINATOR_ADDRESS: (lambda *headers: list(headers), first, second),
+        }
+
+        # The token is refreshed and saved on the request's session, which is only
+        # safe while the nodes don't run on threads of their own
+        assert execute_task_graph(dsk, resources.num_workers) == [
+            "Bearer new_access",
+            "Bearer new_access",
+        ]
+        assert resources.num_workers == 1
+
+        db.refresh(connection_config)
+        assert connection_config.secrets["access_token"] == "new_access"
+
+
+class TestGetConnectionConcurrencyLimit:
+    @pytest.mark.usefixtures("connection_concurrency")
+    def test_connection_concurrency_limit(self):
+        assert (
+            get_connection_concurrency_limit(
+                ConnectionConfig(
+                    key="postgres", connection_type=ConnectionType.postgres
+                )
+            )
+            == CONFIG.execution.task_max_connection_concurrency
+        )
+
+    def test_saas_connections_limited_to_one(self):
+        assert (
+            get_connection_concurrency_limit(
+                ConnectionConfig(key="saas", connection_type=ConnectionType.saas)
+            )
+            == 1
+        )
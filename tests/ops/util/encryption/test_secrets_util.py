@@ -1,4 +1,5 @@
 from typing import Dict, List
+from unittest import mock
 
 from fides.api.schemas.masking.masking_secrets import (
     MaskingSecretCache,
@@ -9,6 +10,7 @@ from fides.api.service.masking.strategy.masking_strategy_aes_encrypt import (
     AesEncryptionMaskingStrategy,
 )
 from fides.api.service.masking.strategy.masking_strategy_hmac import HmacMaskingStrategy
+from fides.api.util.cache import get_cache
 from fides.api.util.encryption.secrets_util import SecretsUtil
 
 from ...test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
@@ -88,3 +90,50 @@ def test_build_masking_secrets_for_cache() -> None:
         masking_meta
     )
     assert len(result) == 2
+
+
+def test_prefetch_masking_secrets() -> None:
+    masking_meta: Dict[
+        SecretType, MaskingSecretMeta
+    ] = HmacMaskingStrategy._build_masking_secret_meta()
+    for secret_type, secret in [
+        (SecretType.key, "test_key"),
+        (SecretType.salt, "salt"),
+    ]:
+        cache_secret(
+            MaskingSecretCache[str](
+                secret=secret,
+                masking_strategy=HmacMaskingStrategy.name,
+                secret_type=secret_type,
+            ),
+            request_id,
+        )
+
+    with mock.patch(
+        "fides.api.util.encryption.secrets_util.get_cache", wraps=get_cache
+    ) as mock_get_cache:
+        SecretsUtil.prefetch_masking_secrets(request_id, [HmacMaskingStrategy.name])
+        assert mock_get_cache.call_count == 1
+
+        for _ in range(3):
+            assert (
+                SecretsUtil.get_or_generate_secret(
+                    request_id, SecretType.key, masking_meta[SecretType.key]
+                )
+                == "test_key"
+            )
+            assert (
+                SecretsUtil.get_or_generate_secret(
+                    request_id, SecretType.salt, masking_meta[SecretType.salt]
+                )
+                == "salt"
+            )
+        assert mock_get_cache.call_count == 1
+
+        SecretsUtil.clear_masking_secrets(request_id)
+        SecretsUtil.get_or_generate_secret(
+            request_id, SecretType.key, masking_meta[SecretType.key]
+        )
+        assert mock_get_cache.call_count == 2
+
+    clear_cache_secrets(request_id)
@@ -1,17 +1,21 @@
+import json
 import pickle
 import random
 from base64 import b64encode
 from datetime import datetime
 from enum import Enum
 from typing import Any, List
+from unittest import mock
 
 import pytest
 from bson.objectid import ObjectId
 
 from fides.api.util.cache import (
+    COMPRESSED_OBJECT_PREFIX,
     ENCODED_BYTES_PREFIX,
     ENCODED_DATE_PREFIX,
     ENCODED_MONGO_OBJECT_ID_PREFIX,
+    CustomJSONEncoder,
     FidesopsRedis,
 )
 from fides.core.config import CONFIG
@@ -69,6 +73,44 @@ def test_decode_none():
     assert FidesopsRedis.decode_obj(None) is None
 
 
+class TestCompression:
+    @pytest.fixture
+    def compression_threshold(self):
+        original_value = CONFIG.redis.compression_threshold
+        CONFIG.redis.compression_threshold = 100
+        yield
+        CONFIG.redis.compression_threshold = original_value
+
+    @pytest.mark.usefixtures("compression_threshold")
+    def test_encode_decode_compressed(self, cache: FidesopsRedis) -> None:
+        rows = [
+            {
+                "id": ObjectId("507f191e810c19729de860ea"),
+                "email": f"customer-{i}@example.com",
+                "created": datetime(2023, 2, 14, 20, 58),
+                "secret": b"some value",
+            }
+            for i in range(50)
+        ]
+
+        encoded = FidesopsRedis.encode_obj(rows)
+        assert encoded.startswith(COMPRESSED_OBJECT_PREFIX)
+        assert len(encoded) < len(json.dumps(rows, cls=CustomJSONEncoder))
+        assert FidesopsRedis.decode_obj(encoded) == rows
+
+        key = f"compressed_rows_{random.random()}"
+        cache.set_encoded_object(key, rows)
+        assert cache.get_encoded_by_key(f"EN_{key}") == rows
+
+    @pytest.mark.usefixtures("compression_threshold")
+    def test_small_objects_not_compressed(self) -> None:
+        assert FidesopsRedis.encode_obj({"a": "b"}) == '{"a": "b"}'
+
+    def test_decode_uncompressed_when_compression_enabled(self) -> None:
+        with mock.patch.object(CONFIG.redis, "compression_threshold", 1):
+            assert FidesopsRedis.decode_obj('{"a": "b"}') == {"a": "b"}
+
+
 def test_scan(cache: FidesopsRedis) -> List:
     test_key = random.random()
     prefix = f"redis_key_{test_key}_"
@@ -88,6 +130,60 @@ def test_scan(cache: FidesopsRedis) -> List:
     assert len(keys) == 0
 
 
+class TestKeyIndex:
+    @pytest.fixture
+    def index(self, cache: FidesopsRedis):
+        index = f"test_index_{random.random()}"
+        yield index
+        cache.delete_keys_by_index(index)
+
+    def test_get_objects_by_index(self, cache: FidesopsRedis, index: str) -> None:
+        prefix = f"indexed_key_{random.random()}_"
+        cache.start_index(index)
+        for i in range(10):
+            cache.set_encoded_object(f"{prefix}a_{i}", i, index=index)
+        cache.set_encoded_object(f"{prefix}b", "other", index=index)
+
+        with mock.patch.object(cache, "scan") as mock_scan:
+            assert cache.get_encoded_objects_by_index(index, f"{prefix}a_") == {
+                f"EN_{prefix}a_{i}": i for i in range(10)
+            }
+            assert len(cache.get_keys_by_index(index)) == 11
+            mock_scan.assert_not_called()
+
+        assert cache.ttl(index) > 0
+
+    def test_incomplete_index_scans_keys(
+        self, cache: FidesopsRedis, index: str
+    ) -> None:
+        prefix = f"unindexed_key_{random.random()}_"
+        cache.set_encoded_object(f"{prefix}0", 0)
+        cache.set_encoded_object(f"{prefix}1", 1, index=index)
+
+        assert not cache.is_index_complete(index)
+        assert cache.get_encoded_objects_by_index(index, prefix) == {
+            f"EN_{prefix}0": 0,
+            f"EN_{prefix}1": 1,
+        }
+
+        cache.index_keys_by_pattern(index, f"*{prefix}*")
+        assert cache.is_index_complete(index)
+        assert sorted(cache.get_keys_by_index(index, f"EN_{prefix}")) == [
+            f"EN_{prefix}0",
+            f"EN_{prefix}1",
+        ]
+
+    def test_delete_keys_by_index(self, cache: FidesopsRedis, index: str) -> None:
+        prefix = f"deleted_key_{random.random()}_"
+        cache.start_index(index)
+        for i in range(5):
+            cache.set_with_autoexpire(f"{prefix}{i}", i, index=index)
+
+        cache.delete_keys_by_index(index)
+        assert cache.get_keys_by_prefix(prefix) == []
+        assert not cache.exists(index)
+
+
 class TestCustomJSONEncoder:
     def test_encode_enum_string(self):
         class TestEnum(Enum):
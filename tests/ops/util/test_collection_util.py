@@ -2,6 +2,7 @@ from typing import Dict, List
 
 from fides.api.util.collection_util import (
     append,
+    chunks,
     filter_nonempty_values,
     merge_dicts,
     partition,
@@ -47,3 +48,9 @@ def test_filter_nonempty_values() -> None:
     assert filter_nonempty_values({"B": None}) == {}
     assert filter_nonempty_values({}) == {}
     assert filter_nonempty_values(None) == {}
+
+
+def test_chunks() -> None:
+    assert list(chunks([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(chunks([1, 2], 5)) == [[1, 2]]
+    assert list(chunks([], 2)) == []
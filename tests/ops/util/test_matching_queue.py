@@ -14,3 +14,25 @@ def test_queue() -> None:
     queue.pop()
     queue.push_if_new("C")
     assert queue.data == ["C"]
+
+
+def test_ready_queue() -> None:
+    queue = ReadyQueue()
+    queue.push("A", {"B"})
+    queue.push("B")
+    queue.push("C", {"A", "D"})
+    queue.push("E")
+    assert queue.data == ["A", "B", "C", "E"]
+    assert queue.pop() == "B"
+    queue.release("B")
+    # A was queued before E, so it comes first once it no longer waits on B
+    assert queue.pop() == "A"
+    queue.release("A")
+    assert queue.pop() == "E"
+    assert queue.pop() is None
+    assert queue.is_empty() is False
+    queue.push_if_new("C")
+    assert queue.data == ["C"]
+    queue.release("D")
+    assert queue.pop() == "C"
+    assert queue.is_empty() is True